@@ -0,0 +1,50 @@
+"""
+Benchmark de generate_altitude : boucle PerlinNoise vs bruit vectorisé NumPy.
+
+La boucle historique est mesurée sur quelques lignes puis extrapolée à la
+grille complète (la mesurer entièrement prendrait plusieurs minutes).
+
+Usage:
+    python benchmarks/bench_altitude.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from biome.biomes import BiomeDeterminer  # noqa: E402
+
+RESOLUTIONS = [(1024, 512), (2048, 1024), (4096, 2048), (8192, 4096)]
+PERLIN_SAMPLE_ROWS = 4
+
+
+def time_perlin_per_cell(width: int) -> float:
+    """Temps moyen d'un appel PerlinNoise, mesuré sur quelques lignes."""
+    determiner = BiomeDeterminer(width=width, height=PERLIN_SAMPLE_ROWS)
+    start = time.perf_counter()
+    determiner.generate_altitude(backend="perlin")
+    return (time.perf_counter() - start) / (width * PERLIN_SAMPLE_ROWS)
+
+
+def time_numpy(width: int, height: int) -> float:
+    determiner = BiomeDeterminer(width=width, height=height)
+    start = time.perf_counter()
+    determiner.generate_altitude(backend="numpy")
+    return time.perf_counter() - start
+
+
+def main():
+    per_cell = time_perlin_per_cell(1024)
+    print(f"PerlinNoise: {per_cell * 1e6:.1f} µs/pixel")
+    print(f"{'Résolution':>12} | {'perlin (est.)':>13} | {'numpy':>8} | {'ns/pixel':>8} | {'gain':>6}")
+    for width, height in RESOLUTIONS:
+        cells = width * height
+        t_perlin = per_cell * cells
+        t_numpy = time_numpy(width, height)
+        print(f"{width:>5}x{height:<6} | {t_perlin:>12.1f}s | {t_numpy:>7.2f}s | "
+              f"{t_numpy / cells * 1e9:>8.1f} | {t_perlin / t_numpy:>5.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark de determine_biomes : double boucle Python vs table de Whittaker.
+
+Vérifie aussi que les deux méthodes produisent exactement la même carte.
+
+Usage:
+    python benchmarks/bench_biomes.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from biome.biomes import BiomeDeterminer  # noqa: E402
+
+RESOLUTIONS = [(512, 256), (1024, 512), (2048, 1024)]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'Résolution':>12} | {'boucle':>8} | {'table':>8} | {'gain':>6} | identique")
+    for width, height in RESOLUTIONS:
+        determiner = BiomeDeterminer(width=width, height=height)
+        altitude = determiner.generate_altitude()
+        temp_map = determiner.temperature_map(altitude)
+        hum_map = determiner.humidity_map(altitude)
+
+        loop, t_loop = timed(determiner.determine_biomes, temp_map, hum_map, altitude, method="loop")
+        lut, t_lut = timed(determiner.determine_biomes, temp_map, hum_map, altitude, method="lut")
+        print(f"{width:>5}x{height:<6} | {t_loop:>7.2f}s | {t_lut * 1e3:>6.1f}ms | "
+              f"{t_loop / t_lut:>5.0f}x | {np.array_equal(loop, lut)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark de l'érosion thermique et hydraulique (heightmap.erosion.Erosion).
+
+Chaque itération est une suite d'opérations NumPy sur la grille entière :
+le temps par cellule doit rester constant avec la résolution. Avec un
+nombre de workers, la carte est découpée en bandes de latitude.
+
+Usage:
+    python benchmarks/bench_erosion.py [largeur_max] [iterations] [workers]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from biome.biomes import BiomeDeterminer  # noqa: E402
+from heightmap.erosion import Erosion  # noqa: E402
+
+RESOLUTIONS = [(1024, 512), (2048, 1024), (4096, 2048)]
+
+
+def main():
+    max_width = int(sys.argv[1]) if len(sys.argv) > 1 else RESOLUTIONS[-1][0]
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    erosion = Erosion()
+    print(f"{iterations} itérations, workers={workers or 1}")
+    print(f"{'Résolution':>12} | {'temps':>8} | {'ns/px/it':>8}")
+    for width, height in RESOLUTIONS:
+        if width > max_width:
+            break
+        altitude = BiomeDeterminer(width=width, height=height, seed=0).generate_altitude()
+        start = time.perf_counter()
+        erosion.run(altitude, iterations, out=altitude, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{width:>5}x{height:<6} | {elapsed:>7.2f}s | "
+              f"{elapsed / (width * height * iterations) * 1e9:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark grille équirectangulaire contre sphère cubique.
+
+À résolution équatoriale égale (largeur 4 n), compare le nombre de cellules,
+le temps de l'altitude (bruit 3D sur la sphère dans les deux cas), des
+étapes cellule par cellule (température, humidité, biomes, eau) et du
+rééchantillonnage du cube vers l'équirectangulaire.
+
+Usage:
+    python benchmarks/bench_grid.py [n_max]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from biome.biomes import BiomeDeterminer  # noqa: E402
+from grid import CubedSphereGrid  # noqa: E402
+from hydro.hydro import Hydrosphere  # noqa: E402
+
+FACE_SIZES = [256, 512, 1024]
+SEA_LEVEL = 0.45
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _stages(determiner, altitude):
+    temperature = determiner.temperature_map(altitude)
+    humidity = determiner.humidity_map(altitude, SEA_LEVEL)
+    determiner.determine_biomes(temperature, humidity, altitude, SEA_LEVEL)
+    Hydrosphere(SEA_LEVEL).compute(altitude)
+
+
+def main():
+    n_max = int(sys.argv[1]) if len(sys.argv) > 1 else FACE_SIZES[-1]
+    print(f"{'Grille':>16} | {'cellules':>9} | {'altitude':>8} | {'étapes':>7} | {'rééch.':>7}")
+    for n in FACE_SIZES:
+        if n > n_max:
+            break
+        flat = BiomeDeterminer(width=4 * n, height=2 * n, seed=0)
+        altitude, t_alt = _timed(flat.generate_altitude, 100, "tiled")
+        _, t_stages = _timed(_stages, flat, altitude)
+        print(f"{f'{4 * n}x{2 * n}':>16} | {altitude.size:>9} | {t_alt:>7.2f}s | "
+              f"{t_stages:>6.3f}s | {'-':>7}")
+
+        grid = CubedSphereGrid(n)
+        cube = BiomeDeterminer(seed=0, grid=grid)
+        altitude, t_alt = _timed(cube.generate_altitude)
+        _stages(cube, altitude)  # latitudes des cellules mises en cache
+        _, t_stages = _timed(_stages, cube, altitude)
+        resampler = grid.resampler(2 * n, 4 * n)
+        _, t_resample = _timed(resampler, altitude)
+        print(f"{f'cube 6x{n}x{n}':>16} | {altitude.size:>9} | {t_alt:>7.2f}s | "
+              f"{t_stages:>6.3f}s | {t_resample:>6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark de Hydrology.compute (priority-flood, D8, accumulation).
+
+Affiche le temps total, le débit et la part de lacs et de rivières pour
+plusieurs résolutions. La plus grande résolution demande environ 4 Go de RAM.
+
+Usage:
+    python benchmarks/bench_hydrology.py [largeur_max]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from biome.biomes import BiomeDeterminer  # noqa: E402
+from hydro.hydrology import Hydrology  # noqa: E402
+
+RESOLUTIONS = [(1024, 512), (2048, 1024), (4096, 2048), (8192, 4096)]
+SEA_LEVEL = 0.45
+
+
+def main():
+    max_width = int(sys.argv[1]) if len(sys.argv) > 1 else RESOLUTIONS[-1][0]
+    hydrology = Hydrology(niveau_mer=SEA_LEVEL)
+    print(f"{'Résolution':>12} | {'temps':>7} | {'ns/px':>6} | {'lacs':>6} | {'rivières':>8}")
+    for width, height in RESOLUTIONS:
+        if width > max_width:
+            break
+        altitude = BiomeDeterminer(width=width, height=height, seed=0).generate_altitude()
+
+        start = time.perf_counter()
+        result = hydrology.compute(altitude)
+        elapsed = time.perf_counter() - start
+
+        print(f"{width:>5}x{height:<6} | {elapsed:>6.2f}s | {elapsed / altitude.size * 1e9:>6.0f} | "
+              f"{result.lakes.mean():>6.1%} | {result.rivers.mean():>8.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark des niveaux de détail du relief : temps d'image par niveau.
+
+Un relief 8K (8192x4096) déplace chaque niveau ; chaque niveau est ensuite
+affiché seul dans un plotter hors écran et tourne d'un degré par image,
+comme dans la fenêtre interactive. Le temps mesuré est celui de
+l'appareil de rendu disponible (carte graphique ou rendu logiciel).
+
+Usage:
+    python benchmarks/bench_lod.py [images] [largeur_fenêtre] [hauteur_fenêtre]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from render.mesh import relief_lods  # noqa: E402
+from visualize_3d import Visualizer3D  # noqa: E402
+from visualize_planet_3d import textured_mesh  # noqa: E402
+
+RESOLUTIONS = [(2048, 1024), (1024, 512), (512, 256), (256, 128), (128, 64), (64, 32)]
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    window = (int(sys.argv[2]), int(sys.argv[3])) if len(sys.argv) > 3 else (1200, 900)
+    rng = np.random.default_rng(0)
+    # Relief à grande échelle (marche aléatoire 2D) plutôt que du bruit blanc
+    altitude = np.cumsum(np.cumsum(rng.standard_normal((4096, 8192), dtype=np.float32), 0), 1)
+    altitude = ((altitude - altitude.min()) / np.ptp(altitude)).astype(np.float32)
+    texture = pv.Texture((rng.random((1024, 2048, 3)) * 255).astype(np.uint8))
+
+    start = time.perf_counter()
+    meshes = relief_lods(altitude, RESOLUTIONS, sea_level=0.45)
+    print(f"Construction des {len(meshes)} niveaux: {time.perf_counter() - start:.2f}s")
+
+    visualizer = Visualizer3D(window_size=window, off_screen=True)
+    actors = [visualizer.add_mesh(textured_mesh(*mesh), texture=texture, smooth_shading=True)
+              for mesh in meshes]
+    visualizer.set_camera(position=(3, 0, 0), focal_point=(0, 0, 0), view_up=(0, 0, 1))
+    window_render = visualizer.plotter.ren_win.Render
+
+    print(f"{'Niveau':>10} | {'triangles':>9} | {'image':>9} | {'img/s':>6}")
+    for (theta, phi), mesh, actor in zip(RESOLUTIONS, meshes, actors):
+        for other in actors:
+            other.SetVisibility(other is actor)
+        window_render()
+        start = time.perf_counter()
+        for _ in range(frames):
+            actor.RotateZ(1.0)
+            window_render()
+        elapsed = (time.perf_counter() - start) / frames
+        print(f"{theta:>5}x{phi:<4} | {len(mesh[1]) // 4:>9} | {elapsed * 1000:>7.1f}ms | "
+              f"{1 / elapsed:>6.1f}")
+    visualizer.close()
+
+
+if __name__ == "__main__":
+    main()
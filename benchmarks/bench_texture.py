@@ -0,0 +1,73 @@
+"""
+Benchmark de la préparation de la texture d'une planète jusqu'au rendu.
+
+Compare l'aller-retour par fichier (colorisation, écriture PNG/JPEG par PIL
+puis relecture) au chemin en mémoire (colorisation seule, tableau passé à
+PlanetRenderer(texture=...)). Si PyVista est installé, la construction de
+pv.Texture est incluse dans les deux cas (pv.read_texture pour le fichier).
+
+Usage:
+    python benchmarks/bench_texture.py [largeur_max]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from render.palette import as_rgb, colorize  # noqa: E402
+
+try:
+    import pyvista as pv
+except ImportError:
+    pv = None
+
+RESOLUTIONS = [(2048, 1024), (4096, 2048), (8192, 4096)]
+
+
+def time_file(biomes: np.ndarray, suffix: str) -> float:
+    path = os.path.join(tempfile.mkdtemp(), "biomes" + suffix)
+    start = time.perf_counter()
+    Image.fromarray(colorize(biomes)).save(path)
+    if pv is not None:
+        pv.read_texture(path)
+    else:
+        np.asarray(Image.open(path).convert("RGB"))
+    elapsed = time.perf_counter() - start
+    os.remove(path)
+    return elapsed
+
+
+def time_memory(biomes: np.ndarray) -> float:
+    start = time.perf_counter()
+    image = as_rgb(biomes)
+    if pv is not None:
+        pv.Texture(image)
+    return time.perf_counter() - start
+
+
+def main():
+    max_width = int(sys.argv[1]) if len(sys.argv) > 1 else RESOLUTIONS[-1][0]
+    rng = np.random.default_rng(0)
+    print(f"pv.Texture inclus: {'oui' if pv is not None else 'non (PyVista absent)'}")
+    print(f"{'Résolution':>12} | {'PNG':>8} | {'JPEG':>8} | {'mémoire':>8} | {'gain PNG':>8}")
+    for width, height in RESOLUTIONS:
+        if width > max_width:
+            break
+        # Régions de biomes lisses (et non du bruit blanc) pour une compression réaliste
+        coarse = rng.integers(0, 9, size=(height // 64, width // 64), dtype=np.uint8)
+        biomes = np.repeat(np.repeat(coarse, 64, axis=0), 64, axis=1)
+        t_png = time_file(biomes, ".png")
+        t_jpeg = time_file(biomes, ".jpg")
+        t_memory = time_memory(biomes)
+        print(f"{width:>5}x{height:<6} | {t_png:>7.2f}s | {t_jpeg:>7.2f}s | "
+              f"{t_memory:>7.3f}s | {t_png / t_memory:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
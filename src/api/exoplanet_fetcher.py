@@ -9,13 +9,16 @@ from dataclasses import dataclass
 # 1 Modèle de données
 # ======================================================
 class Exoplanet:
-    def __init__(self, name, star, radius, mass, temp, distance):
+    def __init__(self, name, star, radius, mass, temp, distance, star_radius=None, orbit=None):
         self.name = name
         self.star = star
         self.radius = radius
         self.mass = mass
         self.temp = temp
         self.distance = distance
+        # Rayon de l'étoile (rayons solaires) et demi-grand axe (UA), pour le climat
+        self.star_radius = star_radius
+        self.orbit = orbit
 
     def to_dict(self):
         return {
@@ -24,7 +27,9 @@ class Exoplanet:
             "pl_rade": self.radius,
             "pl_masse": self.mass,
             "st_teff": self.temp,
-            "sy_dist": self.distance
+            "sy_dist": self.distance,
+            "st_rad": self.star_radius,
+            "pl_orbsmax": self.orbit
         }
 
 
@@ -40,7 +45,7 @@ class NasaExoplanetAPI:
         Récupère les entrées TRAPPIST-1 g depuis la NASA
         """
         query = """
-        SELECT pl_name, hostname, pl_rade, pl_masse, st_teff, sy_dist
+        SELECT pl_name, hostname, pl_rade, pl_masse, st_teff, sy_dist, st_rad, pl_orbsmax
         FROM ps
         WHERE pl_name = 'TRAPPIST-1 g'
         """
@@ -94,7 +99,9 @@ class ExoplanetService:
             radius=row["pl_rade"],
             mass=row["pl_masse"],
             temp=row["st_teff"],
-            distance=row["sy_dist"]
+            distance=row["sy_dist"],
+            star_radius=row.get("st_rad"),
+            orbit=row.get("pl_orbsmax")
         )
 
 
@@ -0,0 +1,7 @@
+"""
+Module atmosphère : vents de surface et transport de l'humidité.
+"""
+
+from .advection import EARTH_RADIUS, MoistureTransport, SemiLagrangianAdvection, band_winds
+
+__all__ = ['EARTH_RADIUS', 'MoistureTransport', 'SemiLagrangianAdvection', 'band_winds']
@@ -0,0 +1,229 @@
+"""
+Transport de l'humidité par les vents de surface.
+
+Les vents sont ceux des trois cellules de circulation (Hadley, Ferrel,
+polaire) et ne dépendent que de la latitude. L'humidité, évaporée au-dessus
+de l'eau, est advectée par un schéma semi-lagrangien : chaque cellule
+reprend la valeur interpolée au point de départ de sa trajectoire. Le schéma
+est inconditionnellement stable, quelle que soit la distance parcourue en un
+pas de temps.
+
+Comme le vent est constant sur une ligne, le point de départ est décalé du
+même nombre de cellules pour toute la ligne : l'interpolation bilinéaire
+(périodique en longitude) se réduit à un mélange de deux lignes puis à un
+décalage fractionnaire par ligne, dont les indices sont calculés une fois.
+
+La capacité de l'air diminue avec l'altitude : l'air qui franchit un relief
+perd son humidité au vent, et le versant sous le vent reste sec.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from hydro.hydro import OCEAN
+from hydro.hydrology import LAC
+
+
+EARTH_RADIUS = 6.371e6  # m
+
+
+def band_winds(lat: np.ndarray, trade_speed: float = 8.0,
+               meridional_speed: float = 1.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vents de surface des cellules de Hadley, Ferrel et polaires.
+
+    Alizés d'est entre 0° et 30°, vents d'ouest entre 30° et 60°, vents d'est
+    polaires au-delà ; la composante méridienne converge vers l'équateur et
+    vers 60°.
+
+    Args:
+        lat: Latitudes en radians
+        trade_speed: Vitesse zonale maximale (m/s)
+        meridional_speed: Vitesse méridienne maximale (m/s)
+
+    Returns:
+        (u, v): Vent vers l'est et vers le nord (m/s), de la forme de lat
+    """
+    u = -trade_speed * np.sin(6 * np.abs(lat))
+    v = -meridional_speed * np.sin(6 * lat)
+    return u, v
+
+
+class SemiLagrangianAdvection:
+    """
+    Advection d'un champ (H, W) par un vent constant sur chaque ligne.
+
+    Args:
+        u: Vent vers l'est par ligne (m/s), forme (H,)
+        v: Vent vers le nord par ligne (m/s), forme (H,)
+        width: Nombre de colonnes (longitude périodique)
+        dt: Pas de temps (s)
+        radius: Rayon de la planète (m)
+    """
+
+    def __init__(self, u: np.ndarray, v: np.ndarray, width: int, dt: float,
+                 radius: float = EARTH_RADIUS):
+        height = len(u)
+        lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+        d_lat = np.pi / height
+        d_lon = 2 * np.pi / width
+
+        # Point de départ : la ligne 0 est au nord, un vent vers le nord vient du sud
+        rows = np.clip(np.arange(height) + v * dt / (radius * d_lat), 0, height - 1)
+        self.row0 = np.floor(rows).astype(np.int64)
+        self.row1 = np.minimum(self.row0 + 1, height - 1)
+        self.row_weight = (rows - self.row0).astype(np.float32)[:, None]
+
+        shift = u * dt / (radius * np.cos(lat) * d_lon)
+        whole = np.floor(shift).astype(np.int64)
+        self.col_weight = (shift - whole).astype(np.float32)[:, None]
+        cols = np.arange(width)
+        base = (np.arange(height) * width)[:, None]
+        index_dtype = np.int32 if height * width < 2**31 else np.int64
+        # Départ entre les colonnes j - whole - 1 (poids frac) et j - whole
+        self.near = (base + (cols[None, :] - whole[:, None]) % width).astype(index_dtype)
+        self.far = (base + (cols[None, :] - whole[:, None] - 1) % width).astype(index_dtype)
+
+    def __call__(self, field: np.ndarray) -> np.ndarray:
+        """Renvoie le champ advecté d'un pas de temps."""
+        rows = field[self.row0]
+        rows *= 1 - self.row_weight
+        rows += field[self.row1] * self.row_weight
+        flat = rows.ravel()
+        result = flat[self.near]
+        result *= 1 - self.col_weight
+        result += flat[self.far] * self.col_weight
+        return result
+
+
+class MoistureTransport:
+    """
+    Humidité transportée par les vents, avec ombre pluviométrique.
+
+    À chaque pas : advection, évaporation au-dessus de l'eau (rappel vers la
+    capacité de l'air), pluie de l'excédent au-delà de la capacité et pluie
+    de fond proportionnelle à l'humidité. La pluie cumulée donne l'humidité.
+
+    Args:
+        steps (int): Nombre de pas de temps (par défaut: 32)
+        dt (float): Pas de temps en secondes (par défaut: 6 h)
+        radius (float): Rayon de la planète en mètres
+        trade_speed (float): Vitesse zonale maximale des vents (m/s)
+        meridional_speed (float): Vitesse méridienne maximale des vents (m/s)
+        evaporation (float): Fraction du déficit comblée par pas au-dessus de l'eau
+        rain_rate (float): Fraction de l'humidité qui tombe en pluie à chaque pas
+        scale_height (float): Élévation (en unités d'altitude) divisant la capacité par e
+
+    Example:
+        >>> transport = MoistureTransport(steps=24)
+        >>> humidity = transport.humidity(altitude, water_map, sea_level=0.45)
+    """
+
+    def __init__(
+        self,
+        steps: int = 32,
+        dt: float = 6 * 3600,
+        radius: float = EARTH_RADIUS,
+        trade_speed: float = 8.0,
+        meridional_speed: float = 1.5,
+        evaporation: float = 0.5,
+        rain_rate: float = 0.05,
+        scale_height: float = 0.15
+    ):
+        if steps < 1:
+            raise ValueError(f"steps doit être >= 1 (reçu: {steps})")
+        if not 0 < evaporation <= 1 or not 0 <= rain_rate <= 1:
+            raise ValueError("evaporation doit être dans ]0, 1] et rain_rate dans [0, 1]")
+        self.steps = steps
+        self.dt = dt
+        self.radius = radius
+        self.trade_speed = trade_speed
+        self.meridional_speed = meridional_speed
+        self.evaporation = evaporation
+        self.rain_rate = rain_rate
+        self.scale_height = scale_height
+
+    def capacity(self, altitude: np.ndarray, sea_level: float,
+                 temperature: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Humidité maximale de l'air : décroît avec l'élévation au-dessus de la mer
+        et, si la température est fournie, croît de 7 % par °C (Clausius-Clapeyron).
+        """
+        capacity = np.subtract(altitude, sea_level, dtype=np.float32)
+        np.maximum(capacity, 0, out=capacity)
+        capacity *= -1 / self.scale_height
+        if temperature is not None:
+            capacity += np.float32(0.07) * temperature
+        return np.exp(capacity, out=capacity)
+
+    def precipitation(
+        self,
+        altitude: np.ndarray,
+        water_map: np.ndarray,
+        sea_level: float = 0.45,
+        temperature: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Pluie cumulée sur tous les pas de temps.
+
+        Args:
+            altitude: Carte d'altitude (H, W)
+            water_map: Carte de Hydrosphere.compute ; l'eau s'évapore des cellules OCEAN et LAC
+            sea_level: Niveau de la mer de l'altitude
+            temperature: Carte de température (°C) optionnelle
+
+        Returns:
+            np.ndarray: Pluie cumulée float32, en unités de capacité
+        """
+        height, width = altitude.shape
+        lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+        u, v = band_winds(lat, self.trade_speed, self.meridional_speed)
+        advect = SemiLagrangianAdvection(u, v, width, self.dt, self.radius)
+
+        capacity = self.capacity(altitude, sea_level, temperature)
+        evaporation = np.isin(water_map, (OCEAN, LAC)).astype(np.float32)
+        evaporation *= self.evaporation
+        rain_rate = np.float32(self.rain_rate)
+
+        moisture = capacity * (evaporation > 0)
+        total = np.zeros((height, width), dtype=np.float32)
+        for _ in range(self.steps):
+            moisture = advect(moisture)
+            # Évaporation : rappel vers la capacité au-dessus de l'eau
+            moisture += evaporation * (capacity - moisture)
+            # L'excédent tombe (relief, air froid), puis la pluie de fond
+            rain = np.subtract(moisture, capacity)
+            np.maximum(rain, 0, out=rain)
+            moisture -= rain
+            background = moisture * rain_rate
+            moisture -= background
+            rain += background
+            total += rain
+        return total
+
+    def humidity(
+        self,
+        altitude: np.ndarray,
+        water_map: np.ndarray,
+        sea_level: float = 0.45,
+        temperature: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calque d'humidité dans [0, 1] : pluie relative à la pluie moyenne sur l'eau.
+
+        Args:
+            altitude, water_map, sea_level, temperature: Voir precipitation()
+            out: Tableau float32 de sortie optionnel
+
+        Returns:
+            np.ndarray: Humidité (1 sur l'océan, comme BiomeDeterminer.humidity_map)
+        """
+        total = self.precipitation(altitude, water_map, sea_level, temperature)
+        ocean = water_map == OCEAN
+        reference = total[ocean].mean() if ocean.any() else total.max()
+        if out is None:
+            out = np.empty(altitude.shape, dtype=np.float32)
+        np.divide(total, max(float(reference), np.finfo(np.float32).tiny), out=out)
+        out[altitude < sea_level] = 1.0
+        return np.clip(out, 0, 1, out=out)
@@ -1,54 +1,295 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 from perlin_noise import PerlinNoise
 from PIL import Image
 
+# Rend les autres paquets de src/ importables quand ce fichier est lancé comme script
+SRC_PATH = str(Path(__file__).resolve().parents[1])
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from biome.whittaker import WhittakerTable
+from heightmap.noise import CHUNK_CELLS, FractalNoise
+from heightmap.spectral import SpectralTerrain
+from heightmap.tiled import TiledAltitudeGenerator
+from render.palette import colorize
+from surface.layers import LAYER_DTYPES
+from surface.pipeline import build_planet_graph
+
+
+# Identifiants des flux aléatoires indépendants dérivés de la graine
+TEMPERATURE_STREAM = 1
+# Refroidissement avec l'altitude (°C par unité d'altitude au-dessus de la mer)
+ALTITUDE_LAPSE = 20.0
+# Échantillon (lignes x colonnes) du bruit de gradient dont le moteur spectral
+# reprend la distribution d'altitude
+QUANTILE_SAMPLE = (128, 256)
+
+
 class BiomeDeterminer:
-    def __init__(self, width=512, height=1024):
+    def __init__(self, width=512, height=1024, seed=None, grid=None):
+        """ seed: entier, np.random.Generator ou None (graine tirée puis
+        conservée dans self.seed pour pouvoir rejouer la génération)
+
+        grid: grille de la sphère (voir grid.CubedSphereGrid) au lieu de la
+        grille équirectangulaire ; les calques prennent alors la forme
+        grid.shape (width et height sont ignorés)."""
+        self.grid = grid
+        if grid is not None:
+            height, width = grid.shape
         self.width = width
         self.height = height
-        self.perlin = PerlinNoise(octaves=6)
+        if isinstance(seed, np.random.Generator):
+            seed = int(seed.integers(2**63))
+        elif seed is None:
+            seed = int(np.random.SeedSequence().entropy % 2**63)
+        self.seed = seed
+        self.perlin = PerlinNoise(octaves=6, seed=seed % (2**31 - 1) + 1)
+        self.noise = FractalNoise(octaves=6, seed=seed)
+        self.biome_table = WhittakerTable.default()
         self.biomes = ['Océan', 'Désert froid', 'Toundra', 'Tundra', 'Taïga', 
                       'Forêt tempérée', 'Savane', 'Forêt tropicale', 'Désert chaud']
 
-    def generate_altitude(self, scale=100):
-        altitude = np.zeros((self.height, self.width))
-        for i in range(self.height):
+    def _layer(self, out, dtype, shape=None):
+        """Renvoie `out` (écriture en place) ou un nouveau calque compact."""
+        shape = shape if shape is not None else (self.height, self.width)
+        if out is None:
+            return np.empty(shape, dtype=dtype)
+        if out.shape != shape:
+            raise ValueError(f"out doit être de forme {shape} (reçu: {out.shape})")
+        return out
+
+    def rng(self, stream):
+        """Générateur reproductible propre à une étape (même graine → mêmes tirages)."""
+        return np.random.default_rng([self.seed, stream])
+
+    def generate_altitude(self, scale=100, backend="numpy", chunk_rows=None, workers=None, out=None,
+                          rows=None):
+        """ Altitude dans [0,1] (float32, ou écrite dans `out`)
+
+        backend="numpy" remplit la grille par blocs de `chunk_rows` lignes
+        (par défaut ~CHUNK_CELLS pixels) avec le bruit vectorisé ;
+        backend="tiled" échantillonne le bruit sur la sphère par tuiles
+        réparties sur `workers` processus (sans couture en longitude) ;
+        backend="spectral" synthétise un fBm par FFT (heightmap.SpectralTerrain),
+        en O(n log n) quel que soit le nombre d'octaves : sa coupure vaut
+        scale / 2 cycles à l'équateur (même longueur de corrélation que le
+        bruit de gradient) et ses altitudes suivent les quantiles du backend
+        numpy (même part de terres pour un niveau de la mer donné) ;
+        backend="perlin" garde la boucle PerlinNoise historique.
+        rows=(début, fin) ne génère qu'une bande de lignes (numpy et perlin).
+
+        Sur une grille (self.grid), le bruit est toujours échantillonné en 3D
+        sur la sphère (backend="numpy" uniquement).
+        """
+        if backend not in ("numpy", "tiled", "spectral", "perlin"):
+            raise ValueError(f"Backend d'altitude inconnu: {backend}")
+        row_start, row_stop = rows if rows is not None else (0, self.height)
+        if backend in ("tiled", "spectral") and rows is not None:
+            raise ValueError(f"Le backend {backend} génère toujours la grille complète")
+        if backend == "tiled" and self.grid is None:
+            # Sans `out`, les workers écrivent directement dans la carte renvoyée
+            generator = TiledAltitudeGenerator(self.width, self.height, scale, noise=self.noise)
+            return generator.generate(workers=workers, out=out, dtype=LAYER_DTYPES["altitude"])
+        altitude = self._layer(out, LAYER_DTYPES["altitude"], (row_stop - row_start, self.width))
+        if self.grid is not None:
+            if backend != "numpy":
+                raise ValueError(f"Backend {backend} indisponible sur une grille cubique")
+            return self.grid.sample(self.noise, scale, out=altitude, rows=(row_start, row_stop))
+        if backend == "numpy":
+            return self._generate_altitude_numpy(scale, chunk_rows, altitude, row_start)
+        if backend == "spectral":
+            terrain = SpectralTerrain(corner=scale / 2, seed=self.seed)
+            return terrain.generate(self.width, self.height, out=altitude,
+                                    quantiles=self._altitude_quantiles(scale))
+
+        for i in range(row_start, row_stop):
             lat = np.pi * (0.5 - i / self.height)
             y_scale = np.cos(lat)
             for j in range(self.width):
                 x = (j / self.width) * scale * y_scale
                 y = (i / self.height) * scale
-                altitude[i, j] = self.perlin([x, y])
-        return (altitude + 1) / 2  # [-1,1] → [0,1]
-
-    def temperature_map(self, altitude):
-        """ Températures VARIÉES pour TRAPPIST-1e"""
-        temp_equator = np.random.uniform(-5, 10)
-        temp_map = np.zeros((self.height, self.width))
-        for i in range(self.height):
-            lat = abs(np.pi * (0.5 - i / self.height))
-            temp_base = temp_equator * (np.cos(lat)**1.5)
-            temp_noise = self.perlin([i*0.01, np.random.rand()])*2  # ✅ Marche direct
-            temp_map[i, :] = temp_base * (1 - 0.5 * altitude[i, :]) + temp_noise
-        return np.clip(temp_map, -50, 25)
-
-    def humidity_map(self, altitude):
-        """ TOUTES LES MÉTHODES SONT LÀ"""
-        sea_level = 0.45
-        humidity = np.zeros_like(altitude)
+                altitude[i - row_start, j] = self.perlin([x, y])
+        altitude += 1
+        altitude /= 2  # [-1,1] → [0,1]
+        return altitude
+
+    def _generate_altitude_numpy(self, scale, chunk_rows, altitude, row_start=0):
+        if chunk_rows is None:
+            chunk_rows = max(1, CHUNK_CELLS // self.width)
+        cols = np.arange(self.width)
+        row_stop = row_start + altitude.shape[0]
+        for start in range(row_start, row_stop, chunk_rows):
+            rows = np.arange(start, min(start + chunk_rows, row_stop))
+            altitude[start - row_start:start - row_start + len(rows)] = \
+                self._noise_altitude(rows, cols, scale)
+        return altitude
+
+    def _noise_altitude(self, rows, cols, scale):
+        """Altitude du backend numpy aux lignes et colonnes données (grille équirectangulaire)."""
+        lat = np.pi * (0.5 - rows / self.height)
+        # Mêmes coordonnées que la boucle PerlinNoise, calculées par bloc
+        x = (cols / self.width)[None, :] * scale * np.cos(lat)[:, None]
+        y = (rows / self.height * scale)[:, None]
+        block = self.noise(x, y)
+        block += 1
+        block /= 2  # [-1,1] → [0,1]
+        return block
+
+    def _altitude_quantiles(self, scale, levels=257):
+        """Quantiles de l'altitude du backend numpy, sur une sous-grille régulière."""
+        sample_rows, sample_cols = QUANTILE_SAMPLE
+        rows = np.unique(np.linspace(0, self.height - 1, sample_rows).round())
+        cols = np.unique(np.linspace(0, self.width - 1, sample_cols).round())
+        sample = self._noise_altitude(rows, cols, scale)
+        return np.quantile(sample, np.linspace(0, 1, levels))
+
+    def temperature_map(self, altitude, out=None, row_start=0, climate=None, sea_level=0.45,
+                        equator_offset=0.0):
+        """ Températures VARIÉES pour TRAPPIST-1e
+
+        `altitude` peut n'être qu'une bande de lignes commençant à
+        `row_start` : les tirages couvrent toujours la grille entière, une
+        bande vaut donc exactement la même tranche du calcul complet.
+
+        `climate` (voir climate.EnergyBalanceModel.surface_temperature) remplace
+        la température équatoriale aléatoire : profil (height,) ou champ
+        (height, width) en °C, refroidi de ALTITUDE_LAPSE par unité d'altitude
+        au-dessus de `sea_level`.
+
+        `equator_offset` (°C) décale la température équatoriale ; un vecteur
+        (K,) de décalages donne une pile (K, lignes, largeur).
+
+        Sur une grille (voir grid.CubedSphereGrid), la latitude de chaque
+        cellule remplace celle de la ligne, et `climate` doit être un profil
+        (L,) par latitude, interpolé aux latitudes des cellules.
+        """
+        rng = self.rng(TEMPERATURE_STREAM)
+        temp_equator = rng.uniform(-5, 10)
+        offset = np.asarray(equator_offset, dtype=np.float64)
+        if offset.ndim > 1:
+            raise ValueError("equator_offset doit être un scalaire ou un vecteur (K,)")
+        shape = altitude.shape if offset.ndim == 0 else offset.shape + altitude.shape
+        temp_map = self._layer(out, LAYER_DTYPES["temperature"], shape)
+        row_u = rng.random(self.height)
+        rows = np.arange(row_start, row_start + altitude.shape[0])
+
+        if self.grid is None:
+            lat = np.pi * (0.5 - rows / self.height)
+            # Bruit par ligne : un seul tirage vectorisé pour toute la grille
+            temp_noise = (self.noise(rows * 0.01, row_u[rows]) * 2)[:, None]
+        else:
+            cells = slice(rows[0], rows[-1] + 1)
+            lat = self.grid.latitude(cells)
+            # Bruit de la ligne équirectangulaire (2 n lignes) de même latitude
+            lat_rows = 2 * self.grid.n
+            table = self.noise(np.arange(lat_rows) * 0.01, row_u[:lat_rows]) * 2
+            temp_noise = table[self.grid.latitude_rows(lat_rows, cells)]
+        profile = np.cos(np.abs(lat)) ** 1.5
+        scale = temp_equator + offset[..., None, None]
+        if profile.ndim == 1:
+            profile = profile[:, None]
+        else:
+            scale = scale.astype(np.float32)  # profil par cellule : reste en float32
+        temp_base = scale * profile  # (…, lignes, 1 ou n)
+
+        if climate is not None:
+            climate = np.asarray(climate)
+            if self.grid is not None:
+                if climate.ndim != 1:
+                    raise ValueError("Sur une grille, climate doit être un profil (L,) par latitude")
+                # Profil de la ligne 0 (nord) à la ligne L - 1 : abscisses croissantes vers le nord
+                profile_lat = np.pi * (0.5 - np.arange(len(climate)) / len(climate))
+                climate = np.interp(lat, profile_lat[::-1], climate[::-1])
+            else:
+                climate = climate[rows]
+                if climate.ndim == 1:
+                    climate = climate[:, None]
+            # climate - ALTITUDE_LAPSE * max(altitude - sea_level, 0) + bruit, en place
+            np.subtract(altitude, sea_level, out=temp_map)
+            np.maximum(temp_map, 0, out=temp_map)
+            temp_map *= -ALTITUDE_LAPSE
+            temp_map += climate
+            temp_map += temp_noise
+            if offset.any():
+                temp_map += offset[..., None, None] * profile
+            return temp_map
+        # temp_base * (1 - 0.5 * altitude) + temp_noise, calculé en place
+        np.multiply(altitude, -0.5, out=temp_map)
+        temp_map += 1
+        temp_map *= temp_base
+        temp_map += temp_noise
+        return np.clip(temp_map, -50, 25, out=temp_map)
+
+    def humidity_map(self, altitude, sea_level=0.45, out=None, coast_distance=None,
+                     coast_scale=0.1):
+        """ TOUTES LES MÉTHODES SONT LÀ
+
+        Avec `coast_distance` (radians, voir hydro.coast.coast_distance),
+        l'humidité des terres est multipliée par 0.5 + exp(-distance / coast_scale) :
+        x1.5 sur la côte, x0.5 loin à l'intérieur des continents.
+
+        Un vecteur (K,) de `sea_level` donne une pile (K, lignes, largeur).
+        """
+        sea_level = np.asarray(sea_level, dtype=np.float64)
+        shape = altitude.shape if sea_level.ndim == 0 else sea_level.shape + altitude.shape
+        humidity = self._layer(out, LAYER_DTYPES["humidity"], shape)
+        if sea_level.ndim:
+            sea_level = sea_level[:, None, None]
+        # Terres : 0.3 * exp(-3 * (altitude - sea_level)), calculé en place
+        np.subtract(altitude, sea_level, out=humidity)
+        humidity *= -3
+        np.exp(humidity, out=humidity)
+        humidity *= 0.3
+        if coast_distance is not None:
+            humidity *= np.exp(coast_distance / -coast_scale) + 0.5
         humidity[altitude < sea_level] = 1.0
-        land = altitude >= sea_level
-        humidity[land] = 0.3 * np.exp(-3 * (altitude[land] - sea_level))
-        return np.clip(humidity, 0, 1)
-
-    def determine_biomes(self, temp_map, humidity_map, altitude):
-        """ Whittaker RÉEL"""
-        biome_map = np.zeros((self.height, self.width), dtype=int)
-        sea_level = 0.45
-        
-        for i in range(self.height):
-            for j in range(self.width):
+        return np.clip(humidity, 0, 1, out=humidity)
+
+    def determine_biomes(self, temp_map, humidity_map, altitude, sea_level=0.45, method="lut",
+                         table=None, out=None, chunk_rows=None):
+        """ Whittaker RÉEL
+
+        method="lut" classe la grille par blocs de `chunk_rows` lignes via une
+        WhittakerTable (par défaut WhittakerTable.default(), ou `table`
+        fournie) ; method="loop" garde la double boucle historique.
+
+        Avec method="lut", temp_map et humidity_map peuvent être des piles
+        (K, lignes, largeur) et `sea_level` un vecteur (K,) : une carte par réglage.
+        Les entrées sans axe K (cartes 2D, niveau scalaire) sont diffusées.
+        """
+        if method not in ("lut", "loop"):
+            raise ValueError(f"Méthode de classification inconnue: {method}")
+        height, width = altitude.shape
+
+        if method == "lut":
+            table = table if table is not None else self.biome_table
+            level = np.asarray(sea_level, dtype=np.float64)
+            # Une carte par réglage dès qu'une entrée porte l'axe K
+            shape = np.broadcast_shapes(temp_map.shape, humidity_map.shape,
+                                        level.shape + altitude.shape)
+            biome_map = self._layer(out, LAYER_DTYPES["biomes"], shape)
+            if level.ndim:
+                level = level[:, None, None]
+            if chunk_rows is None:
+                stack = biome_map.size // altitude.size
+                chunk_rows = max(1, CHUNK_CELLS // (width * stack))
+            for start in range(0, height, chunk_rows):
+                rows = slice(start, start + chunk_rows)
+                block = biome_map[..., rows, :]
+                temp = np.broadcast_to(temp_map[..., rows, :], block.shape)
+                precip = np.broadcast_to(humidity_map[..., rows, :] * 1000, block.shape)  # mm/an
+                table.classify(temp, precip, out=block)
+                block[np.broadcast_to(altitude[rows] < level, block.shape)] = 0
+            return biome_map
+
+        biome_map = self._layer(out, LAYER_DTYPES["biomes"], temp_map.shape)
+
+        for i in range(height):
+            for j in range(width):
                 if altitude[i, j] < sea_level:
                     biome_map[i, j] = 0
                     continue
@@ -67,14 +308,12 @@ class BiomeDeterminer:
         
         return biome_map
 
-    def visualize(self, biome_map, altitude, temp_map, hum_map):
-        colors = np.array([
-            [0, 51, 255], [200, 200, 200], [240, 240, 240], [170, 220, 170],
-            [34, 102, 34], [68, 136, 68], [220, 170, 68], [0, 136, 0], [255, 221, 136]
-        ], dtype=np.uint8)
-        
-        colored = colors[biome_map % len(colors)]
-        Image.fromarray(colored).save('biomes.png')
+    def visualize(self, biome_map, altitude, temp_map, hum_map, save_path='biomes.png'):
+        """ save_path: image des biomes écrite sur disque (None = aucune) ;
+        le rendu 3D prend la carte directement, voir PlanetRenderer(texture=...)"""
+        colored = colorize(biome_map)
+        if save_path is not None:
+            Image.fromarray(colored).save(save_path)
         
         fig, axs = plt.subplots(2, 2, figsize=(15, 25))
         axs[0,0].imshow(altitude, cmap='terrain')
@@ -91,10 +330,14 @@ class BiomeDeterminer:
         plt.show()
 
 #  EXÉCUTION
-determiner = BiomeDeterminer()
-altitude = determiner.generate_altitude()
-temp_map = determiner.temperature_map(altitude)
-hum_map = determiner.humidity_map(altitude)
-biomes = determiner.determine_biomes(temp_map, hum_map, altitude)
-determiner.visualize(biomes, altitude, temp_map, hum_map)
-print(" TERMINÉ!")
+if __name__ == "__main__":
+    determiner = BiomeDeterminer()
+    # Graphe de calques : changer sea_level (graph.set) ne recalcule
+    # que l'humidité et les biomes, pas le bruit d'altitude
+    graph = build_planet_graph(determiner)
+    altitude = graph.get('altitude')
+    temp_map = graph.get('temperature')
+    hum_map = graph.get('humidity')
+    biomes = graph.get('biomes')
+    determiner.visualize(biomes, altitude, temp_map, hum_map)
+    print(" TERMINÉ!")
@@ -0,0 +1,114 @@
+"""
+Classification des biomes par table de correspondance (diagramme de Whittaker).
+
+La température et les précipitations sont découpées en classes (comme
+np.digitize), puis une seule indexation dans la table produit la carte
+complète des biomes.
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class WhittakerTable:
+    """
+    Table (classe de température, classe de précipitations) → indice de biome.
+
+    Une valeur égale à une borne tombe dans la classe supérieure
+    (convention de np.digitize avec right=False).
+
+    Args:
+        temp_edges: Bornes croissantes des classes de température (°C)
+        precip_edges: Bornes croissantes des classes de précipitations (mm/an)
+        table: Indices de biome, de forme (len(temp_edges)+1, len(precip_edges)+1)
+
+    Raises:
+        ValueError: Si la forme de la table ne correspond pas aux bornes
+
+    Example:
+        >>> table = WhittakerTable([0.0, 20.0], [250.0], [[1, 2], [3, 4], [5, 6]])
+        >>> table.classify(np.array([-5.0, 25.0]), np.array([100.0, 900.0]))
+        array([1, 6])
+    """
+
+    # Au-delà, np.digitize (recherche dichotomique) redevient plus rapide
+    MAX_COMPARE_EDGES = 16
+
+    def __init__(
+        self,
+        temp_edges: Sequence[float],
+        precip_edges: Sequence[float],
+        table: Sequence[Sequence[int]]
+    ):
+        self.temp_edges = np.asarray(temp_edges, dtype=np.float64)
+        self.precip_edges = np.asarray(precip_edges, dtype=np.float64)
+        self.table = np.asarray(table)
+
+        expected = (len(self.temp_edges) + 1, len(self.precip_edges) + 1)
+        if self.table.shape != expected:
+            raise ValueError(
+                f"Table de forme {self.table.shape} incompatible avec les bornes "
+                f"(attendu: {expected})"
+            )
+        if np.any(np.diff(self.temp_edges) <= 0) or np.any(np.diff(self.precip_edges) <= 0):
+            raise ValueError("Les bornes doivent être strictement croissantes")
+
+        self._flat = self.table.ravel()
+        self._n_precip = expected[1]
+
+    @classmethod
+    def default(cls) -> "WhittakerTable":
+        """
+        Table reproduisant exactement les seuils historiques de determine_biomes.
+
+        Les comparaisons strictes (temp > 0, temp > 5, temp > 10) sont obtenues
+        en plaçant la borne juste au-dessus du seuil avec np.nextafter.
+        """
+        up = lambda v: np.nextafter(v, np.inf)  # noqa: E731
+        temp_edges = [up(0.0), up(5.0), 10.0, up(10.0)]
+        precip_edges = [50.0, 300.0, 800.0]
+        #        désert  steppe  forêt  humide
+        table = [
+            [1, 2, 4, 3],  # temp <= 0
+            [1, 5, 4, 3],  # 0 < temp <= 5
+            [1, 5, 4, 7],  # 5 < temp < 10
+            [1, 5, 7, 7],  # temp == 10
+            [8, 5, 7, 7],  # temp > 10
+        ]
+        return cls(temp_edges, precip_edges, np.array(table, dtype=np.uint8))
+
+    def classify(
+        self,
+        temp_map: np.ndarray,
+        precip_map: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Classe chaque cellule selon sa température et ses précipitations.
+
+        Args:
+            temp_map: Températures (°C)
+            precip_map: Précipitations (mm/an), même forme que temp_map
+            out: Tableau de sortie optionnel
+
+        Returns:
+            np.ndarray: Indices de biome
+        """
+        index = self._bin(temp_map, self.temp_edges)
+        index *= self._n_precip
+        index += self._bin(precip_map, self.precip_edges)
+        return np.take(self._flat, index, out=out)
+
+    def _bin(self, values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """
+        Classe de chaque valeur, comme np.digitize(values, edges).
+
+        Avec peu de bornes, une somme de comparaisons dans un tableau uint8
+        évite la recherche dichotomique et les indices int64.
+        """
+        if len(edges) > self.MAX_COMPARE_EDGES or self._flat.size > 255:
+            return np.digitize(values, edges)
+        index = np.zeros(np.shape(values), dtype=np.uint8)
+        for edge in edges:
+            index += values >= edge
+        return index
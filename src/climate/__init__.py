@@ -0,0 +1,18 @@
+"""
+Module climat : insolation stellaire et modèle de bilan énergétique.
+"""
+
+from .ebm import EnergyBalanceModel
+from .insolation import (
+    annual_insolation,
+    daily_insolation,
+    declination,
+    stellar_flux,
+    substellar_insolation
+)
+from .seasons import SeasonalClimate
+
+__all__ = [
+    'EnergyBalanceModel', 'SeasonalClimate', 'annual_insolation', 'daily_insolation',
+    'declination', 'stellar_flux', 'substellar_insolation'
+]
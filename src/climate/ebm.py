@@ -0,0 +1,232 @@
+"""
+Modèle de bilan énergétique diffusif (Budyko-Sellers), à l'équilibre.
+
+À l'état stationnaire, la température de surface T (°C) vérifie
+
+    -D ∇²T + B T = S (1 - α(T)) - A
+
+où A + B T est le rayonnement sortant et D la diffusion de la chaleur. Sur la
+sphère, une FFT en longitude sépare les modes zonaux m : chacun est un
+système tridiagonal en latitude. Les systèmes sont factorisés une seule
+fois, puis résolus ensemble par balayage (Thomas) sur toutes les colonnes.
+
+L'albédo dépend de la température (glace) : on alterne un nombre fixe
+d'itérations résolution / mise à jour de l'albédo. Le modèle tourne sur une
+grille grossière (le champ est lisse) puis est interpolé sur la carte.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .insolation import annual_insolation, stellar_flux, substellar_insolation
+
+
+def _centers(height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Latitudes (nord → sud) et longitudes des centres de cellules."""
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    lon = 2 * np.pi * np.arange(width) / width
+    return lat, lon
+
+
+def _interp_rows(profile: np.ndarray, height: int) -> np.ndarray:
+    """Interpolation linéaire d'un profil par latitude vers `height` lignes."""
+    lat, _ = _centers(len(profile), 1)
+    fine_lat, _ = _centers(height, 1)
+    # np.interp attend des abscisses croissantes : latitudes sud → nord
+    return np.interp(fine_lat[::-1], lat[::-1], profile[::-1])[::-1]
+
+
+def _resample(field: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Interpolation bilinéaire vers (height, width), longitude périodique."""
+    coarse_h, coarse_w = field.shape
+    # Position des centres fins en indices de la grille grossière
+    y = np.clip((np.arange(height) + 0.5) * coarse_h / height - 0.5, 0, coarse_h - 1)
+    i0 = np.floor(y).astype(np.int64)
+    i1 = np.minimum(i0 + 1, coarse_h - 1)
+    wy = (y - i0)[:, None]
+    x = np.arange(width) * coarse_w / width
+    j0 = np.floor(x).astype(np.int64)
+    j1 = (j0 + 1) % coarse_w
+    wx = x - j0
+
+    rows = field[i0] * (1 - wy) + field[i1] * wy
+    return rows[:, j0] * (1 - wx) + rows[:, j1] * wx
+
+
+class EnergyBalanceModel:
+    """
+    Climat d'équilibre d'une exoplanète à partir de son étoile.
+
+    Args:
+        A (float): Rayonnement sortant à 0 °C (W/m²) (par défaut: 203.3)
+        B (float): Sensibilité du rayonnement sortant (W/m²/K) (par défaut: 2.09)
+        D (float): Coefficient de diffusion de la chaleur (W/m²/K) (par défaut: 0.55)
+        albedo_free (float): Albédo sans glace (par défaut: 0.3)
+        albedo_ice (float): Albédo de la glace (par défaut: 0.62)
+        ice_temp (float): Température de transition glace / sans glace (°C)
+        ice_width (float): Largeur (°C) de la transition, lissée par tanh
+        iterations (int): Nombre fixe d'itérations sur l'albédo (par défaut: 20,
+            à moins de 1e-4 °C de l'état convergé, y compris sans obliquité)
+        grid (tuple): Résolution (lignes, colonnes) du calcul (par défaut: 90 x 180)
+
+    Avec les paramètres par défaut, la Terre (S = 1361 W/m²) donne en moyenne
+    annuelle environ 27 °C à l'équateur et -6 °C aux pôles avec son obliquité
+    de 23.44°, et environ 29 °C et -19 °C sans obliquité.
+
+    Example:
+        >>> model = EnergyBalanceModel()
+        >>> climate = model.surface_temperature(planet, 512, 1024, tidally_locked=True)
+        >>> temp_map = determiner.temperature_map(altitude, climate=climate)
+    """
+
+    def __init__(
+        self,
+        A: float = 203.3,
+        B: float = 2.09,
+        D: float = 0.55,
+        albedo_free: float = 0.3,
+        albedo_ice: float = 0.62,
+        ice_temp: float = -10.0,
+        ice_width: float = 5.0,
+        iterations: int = 20,
+        grid: Tuple[int, int] = (90, 180)
+    ):
+        if B <= 0 or D < 0:
+            raise ValueError(f"B doit être positif et D positif ou nul (reçu: B={B}, D={D})")
+        if iterations < 1:
+            raise ValueError(f"iterations doit être >= 1 (reçu: {iterations})")
+        self.A = A
+        self.B = B
+        self.D = D
+        self.albedo_free = albedo_free
+        self.albedo_ice = albedo_ice
+        self.ice_temp = ice_temp
+        self.ice_width = ice_width
+        self.iterations = iterations
+        self.grid = grid
+        self._factors = {}  # (lignes, colonnes, inertie) -> factorisation tridiagonale
+
+    def albedo(self, temperature: np.ndarray) -> np.ndarray:
+        """Albédo lissé : albedo_ice dans le froid, albedo_free dans le chaud."""
+        ice = 0.5 * (1 - np.tanh((temperature - self.ice_temp) / self.ice_width))
+        return self.albedo_free + (self.albedo_ice - self.albedo_free) * ice
+
+    def _factorize(self, height: int, width: int, inertia: float = 0.0):
+        """
+        Coefficients de Thomas des systèmes tridiagonaux de chaque mode zonal.
+
+        `inertia` (C / dt, W/m²/K) s'ajoute à B pour un pas de temps implicite.
+        """
+        key = (height, width, inertia)
+        if key in self._factors:
+            return self._factors[key]
+
+        lat, _ = _centers(height, width)
+        d_lat = np.pi / height
+        d_lon = 2 * np.pi / width
+        cos_c = np.cos(lat)
+        # Faces entre lignes ; flux nul aux pôles (cos = 0)
+        faces = np.cos(np.pi * (0.5 - np.arange(height + 1) / height))
+        faces[[0, -1]] = 0.0
+        lower = -self.D * faces[:-1] / (cos_c * d_lat ** 2)
+        upper = -self.D * faces[1:] / (cos_c * d_lat ** 2)
+
+        # Valeurs propres de la différence seconde périodique en longitude
+        m = np.arange(width // 2 + 1)
+        k_lon = (2 - 2 * np.cos(2 * np.pi * m / width)) / d_lon ** 2
+        diag = ((-(lower + upper) + self.B + inertia)[:, None]
+                + self.D * k_lon[None, :] / cos_c[:, None] ** 2)
+
+        # Élimination avant : dénominateurs et coefficients c' par mode
+        denom = np.empty_like(diag)
+        c_prime = np.empty_like(diag)
+        denom[0] = diag[0]
+        c_prime[0] = upper[0] / denom[0]
+        for i in range(1, height):
+            denom[i] = diag[i] - lower[i] * c_prime[i - 1]
+            c_prime[i] = upper[i] / denom[i]
+
+        self._factors[key] = (lower, denom, c_prime)
+        return self._factors[key]
+
+    def solve_linear(self, forcing: np.ndarray, inertia: float = 0.0) -> np.ndarray:
+        """
+        Résout -D ∇²T + (B + inertia) T = forcing sur une grille (H, W) périodique.
+
+        La factorisation de chaque (H, W, inertia) est mise en cache : un pas
+        implicite (inertia = C / dt) ne coûte qu'une FFT et un balayage de Thomas.
+
+        Args:
+            forcing: Forçage (W/m²) sur une grille (H, W)
+            inertia: Terme d'inertie C / dt (W/m²/K, par défaut: 0)
+
+        Returns:
+            np.ndarray: Températures (°C) de la forme de forcing
+        """
+        height, width = forcing.shape
+        lower, denom, c_prime = self._factorize(height, width, inertia)
+        rhs = np.fft.rfft(forcing, axis=1)
+
+        solution = np.empty_like(rhs)
+        solution[0] = rhs[0] / denom[0]
+        for i in range(1, height):
+            solution[i] = (rhs[i] - lower[i] * solution[i - 1]) / denom[i]
+        for i in range(height - 2, -1, -1):
+            solution[i] -= c_prime[i] * solution[i + 1]
+        return np.fft.irfft(solution, n=width, axis=1)
+
+    def equilibrium(self, insolation: np.ndarray) -> np.ndarray:
+        """
+        Température d'équilibre (°C) pour une insolation donnée.
+
+        Args:
+            insolation: Insolation moyenne (W/m²) sur une grille (H, W) ;
+                une seule colonne (H, 1) donne un modèle zonal 1D
+
+        Returns:
+            np.ndarray: Températures de la forme de insolation
+        """
+        insolation = np.asarray(insolation, dtype=np.float64)
+        if insolation.ndim != 2:
+            raise ValueError("insolation doit être une matrice 2D (H, W)")
+
+        # Départ sans glace puis nombre fixe de mises à jour de l'albédo
+        temperature = self.solve_linear(insolation * (1 - self.albedo_free) - self.A)
+        for _ in range(self.iterations - 1):
+            forcing = insolation * (1 - self.albedo(temperature)) - self.A
+            temperature = self.solve_linear(forcing)
+        return temperature
+
+    def surface_temperature(
+        self,
+        exoplanet,
+        height: int,
+        width: int,
+        tidally_locked: bool = False,
+        obliquity: float = 0.0
+    ) -> np.ndarray:
+        """
+        Champ de température d'équilibre d'une exoplanète, à la résolution de la carte.
+
+        Args:
+            exoplanet: Exoplanet (voir climate.insolation.stellar_flux)
+            height: Nombre de lignes de la carte
+            width: Nombre de colonnes de la carte
+            tidally_locked: Rotation synchrone (face jour fixe) ou moyenne annuelle
+            obliquity: Obliquité en radians (ignorée en rotation synchrone)
+
+        Returns:
+            np.ndarray: Profil float32 (height,) par latitude, ou champ (height, width)
+            en rotation synchrone
+        """
+        flux = stellar_flux(exoplanet)
+        grid_h, grid_w = self.grid
+        lat, lon = _centers(grid_h, grid_w)
+
+        if not tidally_locked:
+            insolation = annual_insolation(lat, flux, obliquity)[:, None]
+            zonal = self.equilibrium(insolation)[:, 0]
+            return _interp_rows(zonal, height).astype(np.float32)
+
+        field = self.equilibrium(substellar_insolation(lat, lon, flux))
+        return _resample(field, height, width).astype(np.float32)
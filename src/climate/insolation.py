@@ -0,0 +1,113 @@
+"""
+Flux stellaire et insolation moyenne par latitude.
+
+Le flux reçu par la planète se déduit de l'étoile (température effective,
+rayon) et du demi-grand axe de l'orbite : S = σ T⁴ (R / a)².
+"""
+import math
+
+import numpy as np
+
+
+SIGMA = 5.670374419e-8  # constante de Stefan-Boltzmann (W/m²/K⁴)
+SOLAR_RADIUS = 6.957e8  # m
+AU = 1.495978707e11  # m
+
+
+def stellar_flux(exoplanet) -> float:
+    """
+    Flux stellaire au sommet de l'atmosphère (W/m²).
+
+    Args:
+        exoplanet: Exoplanet avec temp (st_teff, K), star_radius (st_rad, rayons
+            solaires) et orbit (pl_orbsmax, UA)
+
+    Returns:
+        float: Flux S = σ T⁴ (R / a)²
+
+    Raises:
+        ValueError: Si une des trois grandeurs manque
+
+    Example:
+        >>> stellar_flux(Exoplanet('TRAPPIST-1 g', 'TRAPPIST-1', 1.13, 1.32, 2566, 12.4,
+        ...                        star_radius=0.119, orbit=0.0468))
+        343.6...
+    """
+    values = {
+        "st_teff": exoplanet.temp,
+        "st_rad": exoplanet.star_radius,
+        "pl_orbsmax": exoplanet.orbit,
+    }
+    missing = [name for name, value in values.items() if value is None or math.isnan(value)]
+    if missing:
+        raise ValueError(f"Données manquantes pour le flux stellaire: {missing}")
+
+    ratio = exoplanet.star_radius * SOLAR_RADIUS / (exoplanet.orbit * AU)
+    return SIGMA * exoplanet.temp ** 4 * ratio ** 2
+
+
+def daily_insolation(lat: np.ndarray, flux: float, declination) -> np.ndarray:
+    """
+    Insolation moyenne sur une journée (W/m²) pour une déclinaison du soleil.
+
+    Args:
+        lat: Latitudes en radians
+        flux: Flux stellaire S (W/m²)
+        declination: Déclinaison en radians, scalaire ou tableau diffusable avec lat
+
+    Returns:
+        np.ndarray: Insolation de la forme diffusée de lat et declination
+    """
+    # Angle horaire du coucher, borné pour la nuit et le jour polaires
+    cos_h0 = np.clip(-np.tan(lat) * np.tan(declination), -1, 1)
+    h0 = np.arccos(cos_h0)
+    return (flux / np.pi) * (
+        h0 * np.sin(lat) * np.sin(declination)
+        + np.cos(lat) * np.cos(declination) * np.sin(h0)
+    )
+
+
+def declination(phase, obliquity: float):
+    """Déclinaison du soleil (radians) à une phase orbitale (radians), orbite circulaire."""
+    return np.arcsin(np.sin(obliquity) * np.sin(phase))
+
+
+def annual_insolation(lat: np.ndarray, flux: float, obliquity: float = 0.0,
+                      samples: int = 64) -> np.ndarray:
+    """
+    Insolation moyenne annuelle (W/m²) à chaque latitude, orbite circulaire.
+
+    La moyenne journalière est calculée pour `samples` déclinaisons de
+    l'année à la fois (produit externe latitude x saison).
+
+    Args:
+        lat: Latitudes en radians
+        flux: Flux stellaire S (W/m²)
+        obliquity: Inclinaison de l'axe en radians (0 = pas de saisons)
+        samples: Nombre de positions sur l'orbite
+
+    Returns:
+        np.ndarray: Insolation de la forme de lat
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    phase = 2 * np.pi * (np.arange(samples) + 0.5) / samples
+    daily = daily_insolation(lat[..., None], flux, declination(phase, obliquity))
+    return daily.mean(axis=-1)
+
+
+def substellar_insolation(lat: np.ndarray, lon: np.ndarray, flux: float,
+                          substellar_lon: float = np.pi) -> np.ndarray:
+    """
+    Insolation permanente d'une planète en rotation synchrone (W/m²).
+
+    Args:
+        lat: Latitudes (H,) en radians
+        lon: Longitudes (W,) en radians
+        flux: Flux stellaire S (W/m²)
+        substellar_lon: Longitude du point substellaire (par défaut: centre de la carte)
+
+    Returns:
+        np.ndarray: S max(0, cos φ cos(λ - λ₀)), forme (H, W)
+    """
+    cos_zenith = np.cos(lat)[:, None] * np.cos(lon - substellar_lon)[None, :]
+    return flux * np.maximum(cos_zenith, 0)
@@ -0,0 +1,143 @@
+"""
+Climat saisonnier : températures et humidité sur une période orbitale.
+
+Le bilan énergétique zonal est avancé dans le temps par pas implicites :
+C dT/dt = D ∇²T - A - B T + S(φ, t) (1 - α). Le pas implicite réutilise la
+factorisation tridiagonale de EnergyBalanceModel (B devient B + C / dt) ; à
+chaque pas, seule l'insolation (phase orbitale, obliquité) et l'albédo
+changent.
+
+Sur la carte, tout ce qui ne dépend pas du temps (relief, bruit, humidité de
+base) est calculé une fois ; chaque pas n'ajoute qu'une anomalie par ligne.
+Les séries sont stockées en anomalies float16 (surface.series.LayerSeries).
+"""
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from surface.series import LayerSeries
+
+from .ebm import EnergyBalanceModel, _centers, _interp_rows
+from .insolation import annual_insolation, daily_insolation, declination, stellar_flux
+
+
+YEAR = 3.15576e7  # s
+
+
+class SeasonalClimate:
+    """
+    Cycle saisonnier d'une exoplanète sur `steps` pas par orbite.
+
+    Args:
+        model (EnergyBalanceModel): Modèle de bilan énergétique (None = par défaut)
+        steps (int): Nombre de pas par période orbitale (par défaut: 48)
+        obliquity (float): Obliquité en radians (par défaut: celle de la Terre)
+        heat_capacity (float): Capacité thermique de surface (J/m²/K), ~25 m d'océan
+        period (float): Période orbitale en secondes (par défaut: un an terrestre)
+        spin_up (int): Orbites simulées avant l'orbite enregistrée (par défaut: 2)
+
+    Example:
+        >>> seasons = SeasonalClimate(steps=48)
+        >>> series = seasons.run(determiner, altitude, planet)
+        >>> series['temperature'].max  # maximum annuel de chaque cellule
+    """
+
+    def __init__(
+        self,
+        model: Optional[EnergyBalanceModel] = None,
+        steps: int = 48,
+        obliquity: float = np.radians(23.44),
+        heat_capacity: float = 1.0e8,
+        period: float = YEAR,
+        spin_up: int = 2
+    ):
+        if steps < 1 or spin_up < 0:
+            raise ValueError(f"steps doit être >= 1 et spin_up >= 0 (reçu: {steps}, {spin_up})")
+        self.model = model if model is not None else EnergyBalanceModel()
+        self.steps = steps
+        self.obliquity = obliquity
+        self.heat_capacity = heat_capacity
+        self.period = period
+        self.spin_up = spin_up
+
+    def zonal_cycle(self, exoplanet) -> np.ndarray:
+        """
+        Températures zonales (°C) à chaque pas de la dernière orbite simulée.
+
+        Returns:
+            np.ndarray: Forme (steps, lignes de la grille du modèle)
+        """
+        model = self.model
+        flux = stellar_flux(exoplanet)
+        lat, _ = _centers(model.grid[0], 1)
+        inertia = self.heat_capacity / (self.period / self.steps)
+
+        phase = 2 * np.pi * (np.arange(self.steps) + 0.5) / self.steps
+        insolation = daily_insolation(lat[None, :], flux, declination(phase, self.obliquity)[:, None])
+
+        # Départ à l'équilibre annuel, puis pas implicites
+        temperature = model.equilibrium(annual_insolation(lat, flux, self.obliquity)[:, None])[:, 0]
+        cycle = np.empty((self.steps, len(lat)))
+        for _ in range(self.spin_up + 1):
+            for t in range(self.steps):
+                forcing = insolation[t] * (1 - model.albedo(temperature)) - model.A
+                forcing += inertia * temperature
+                temperature = model.solve_linear(forcing[:, None], inertia)[:, 0]
+                cycle[t] = temperature
+        return cycle
+
+    def run(
+        self,
+        determiner,
+        altitude: np.ndarray,
+        exoplanet,
+        humidity: Optional[np.ndarray] = None,
+        sea_level: float = 0.45,
+        chunk_steps: int = 8,
+        directory: Optional[Union[str, Path]] = None
+    ) -> Dict[str, LayerSeries]:
+        """
+        Séries de température et d'humidité sur une orbite.
+
+        L'humidité de base est modulée de 7 % par °C d'anomalie de température
+        (Clausius-Clapeyron), bornée à [0, 1].
+
+        Args:
+            determiner: BiomeDeterminer (température et humidité de base)
+            altitude: Carte d'altitude (height, width) du determiner
+            exoplanet: Exoplanet (voir climate.insolation.stellar_flux)
+            humidity: Humidité de base (None = determiner.humidity_map)
+            sea_level: Niveau de la mer
+            chunk_steps: Pas par bloc de stockage
+            directory: Dossier des blocs mappés (None = en mémoire)
+
+        Returns:
+            dict: LayerSeries 'temperature' et 'humidity'
+        """
+        height = altitude.shape[0]
+        cycle = np.stack([_interp_rows(profile, height) for profile in self.zonal_cycle(exoplanet)])
+        annual = cycle.mean(axis=0)
+        anomalies = (cycle - annual).astype(np.float32)
+
+        # Termes fixes calculés une fois : relief, bruit, humidité de base
+        reference = determiner.temperature_map(altitude, climate=annual, sea_level=sea_level)
+        if humidity is None:
+            humidity = determiner.humidity_map(altitude, sea_level)
+        series = {
+            "temperature": LayerSeries(reference, self.steps, chunk_steps,
+                                       directory=directory, name="temperature"),
+            "humidity": LayerSeries(humidity, self.steps, chunk_steps,
+                                    directory=directory, name="humidity"),
+        }
+
+        temperature = np.empty_like(series["temperature"].reference)
+        moisture = np.empty_like(series["humidity"].reference)
+        for t in range(self.steps):
+            anomaly = anomalies[t][:, None]
+            np.add(reference, anomaly, out=temperature)
+            series["temperature"].append(temperature)
+            np.multiply(humidity, np.exp(np.float32(0.07) * anomaly), out=moisture)
+            np.clip(moisture, 0, 1, out=moisture)
+            series["humidity"].append(moisture)
+        return series
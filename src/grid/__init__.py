@@ -0,0 +1,7 @@
+"""
+Module des grilles de la sphère (alternatives à l'équirectangulaire).
+"""
+
+from .cubed_sphere import CubedSphereGrid, Resampler
+
+__all__ = ['CubedSphereGrid', 'Resampler']
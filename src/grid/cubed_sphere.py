@@ -0,0 +1,334 @@
+"""
+Grille de sphère cubique (cubed sphere) équiangulaire.
+
+La sphère est projetée sur les six faces d'un cube, chacune découpée en
+n x n cellules d'angles égaux (projection gnomonique). Les cellules ont
+presque toutes la même surface (rapport max / min ≈ 1.4, contre une infinité
+pour une grille équirectangulaire aux pôles) : à résolution équatoriale
+égale, la planète compte 6 n² cellules au lieu de 8 n².
+
+Les six faces sont empilées verticalement dans un calque 2D (6 n, n) : les
+étapes cellule par cellule (humidité, biomes, hydrosphère, statistiques)
+s'y appliquent sans modification. Un rééchantillonneur précalculé produit
+la carte équirectangulaire attendue par les rendus.
+
+Faces : 0 à 3 autour de l'équateur (longitudes 0°, 90°, 180°, 270°),
+4 au pôle nord, 5 au pôle sud. Ligne 0 d'une face équatoriale au nord.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from heightmap.noise import CHUNK_CELLS
+
+
+# Centre, axe « droite » et axe « haut » de chaque face (repère direct)
+_FACES = np.array([
+    [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
+    [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
+    [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
+    [[0, 0, 1], [0, 1, 0], [-1, 0, 0]],
+    [[0, 0, -1], [0, 1, 0], [1, 0, 0]],
+], dtype=np.float64)
+
+
+def _face_of(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Face contenant chaque direction (axe de plus grande composante)."""
+    ax, ay, az = np.abs(x), np.abs(y), np.abs(z)
+    face = np.where(x >= 0, 0, 2).astype(np.int8)
+    face[(ay > ax) & (y >= 0)] = 1
+    face[(ay > ax) & (y < 0)] = 3
+    polar = (az > ax) & (az > ay)
+    face[polar & (z >= 0)] = 4
+    face[polar & (z < 0)] = 5
+    return face
+
+
+class CubedSphereGrid:
+    """
+    Grille équiangulaire de 6 faces n x n, calques de forme (6 n, n).
+
+    Args:
+        n (int): Nombre de cellules par côté de face
+
+    Example:
+        >>> grid = CubedSphereGrid(512)
+        >>> determiner = BiomeDeterminer(seed=1, grid=grid)
+        >>> altitude = determiner.generate_altitude()          # (3072, 512)
+        >>> flat = grid.resampler(1024, 2048)(altitude)        # (1024, 2048)
+    """
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError(f"n doit être >= 1 (reçu: {n})")
+        self.n = n
+        self._area = None
+        self._latitude = None  # float32, calculée au premier appel à latitude()
+        self._latitude_rows = None  # (height, lignes équirectangulaires int32)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Forme des calques : faces empilées verticalement."""
+        return (6 * self.n, self.n)
+
+    def _angles(self, index: np.ndarray) -> np.ndarray:
+        """Angle du centre de la cellule `index` sur une face, dans ]-π/4, π/4[."""
+        return np.pi / 2 * ((index + 0.5) / self.n - 0.5)
+
+    def points(self, rows: Optional[slice] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Directions unitaires (x, y, z) des centres des cellules.
+
+        Args:
+            rows: Lignes du calque (6 n, n) à calculer (None = toutes)
+
+        Returns:
+            (x, y, z): Tableaux float64 de forme (lignes, n)
+        """
+        return tuple(self._component(axis, rows) for axis in range(3))
+
+    def _component(self, axis: int, rows: Optional[slice]) -> np.ndarray:
+        """Composante `axis` des directions : (c + X e1 + Y e2) / sqrt(1 + X² + Y²)."""
+        rows = np.arange(6 * self.n)[rows if rows is not None else slice(None)]
+        basis = _FACES[rows // self.n, :, axis]  # (lignes, centre / droite / haut)
+        right = np.tan(self._angles(np.arange(self.n)))[None, :]
+        up = np.tan(-self._angles(rows % self.n))[:, None]  # ligne 0 en haut de la face
+
+        # Base orthonormée : la norme ne dépend que de X et Y
+        value = basis[:, 1:2] * right
+        value += basis[:, 0:1]
+        value += basis[:, 2:3] * up
+        value /= np.sqrt(1 + right ** 2 + up ** 2)
+        return value
+
+    def latitude(self, rows: Optional[slice] = None) -> np.ndarray:
+        """Latitude (radians, float32) des cellules des lignes `rows`, forme (lignes, n)."""
+        if self._latitude is None:
+            z = self._component(2, None)
+            self._latitude = np.arcsin(np.clip(z, -1, 1)).astype(np.float32)
+        return self._latitude[rows if rows is not None else slice(None)]
+
+    def latitude_rows(self, height: int, rows: Optional[slice] = None) -> np.ndarray:
+        """
+        Ligne d'une carte équirectangulaire de `height` lignes (latitude
+        π (0.5 - i / height)) contenant chaque cellule, forme (lignes, n).
+        """
+        if self._latitude_rows is None or self._latitude_rows[0] != height:
+            index = self.latitude() * np.float32(-height / np.pi)
+            index += np.float32(height / 2)
+            self._latitude_rows = (height, np.clip(index, 0, height - 1).astype(np.int32))
+        return self._latitude_rows[1][rows if rows is not None else slice(None)]
+
+    def longitude(self, rows: Optional[slice] = None) -> np.ndarray:
+        """Longitude dans [0, 2π) des cellules des lignes `rows`, forme (lignes, n)."""
+        x, y, _ = self.points(rows)
+        return np.arctan2(y, x) % (2 * np.pi)
+
+    @property
+    def cell_area(self) -> np.ndarray:
+        """
+        Fraction exacte de la surface de la sphère couverte par chaque cellule.
+
+        Sur une face, l'aire (en stéradians) du rectangle [0, X] x [0, Y] en
+        coordonnées gnomoniques vaut atan(XY / sqrt(1 + X² + Y²)).
+        """
+        if self._area is None:
+            edges = np.tan(np.pi / 2 * (np.arange(self.n + 1) / self.n - 0.5))
+            X, Y = np.meshgrid(edges, edges)
+            corner = np.arctan(X * Y / np.sqrt(1 + X ** 2 + Y ** 2))
+            face = corner[1:, 1:] - corner[1:, :-1] - corner[:-1, 1:] + corner[:-1, :-1]
+            self._area = np.tile(face / (4 * np.pi), (6, 1))
+        return self._area
+
+    def sample(self, noise, scale: float = 100, out: Optional[np.ndarray] = None,
+               rows: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """
+        Échantillonne un bruit 3D sur la sphère, dans [0, 1].
+
+        Même rayon que TiledAltitudeGenerator (l'équateur couvre `scale`
+        mailles du bruit) : la carte rééchantillonnée est celle du backend
+        tiled, sans couture ni pincement aux pôles.
+
+        Args:
+            noise: FractalNoise appelé avec (x, y, z)
+            scale: Échelle du bruit
+            out: Tableau de sortie de forme (lignes, n)
+            rows: (début, fin) des lignes du calque (None = toutes)
+
+        Returns:
+            np.ndarray: Altitude dans [0, 1]
+        """
+        row_start, row_stop = rows if rows is not None else (0, 6 * self.n)
+        if out is None:
+            out = np.empty((row_stop - row_start, self.n), dtype=np.float32)
+        radius = scale / (2 * np.pi)
+        block_rows = max(1, CHUNK_CELLS // self.n)
+        for start in range(row_start, row_stop, block_rows):
+            stop = min(start + block_rows, row_stop)
+            x, y, z = self.points(slice(start, stop))
+            values = noise(radius * x, radius * y, radius * z)
+            values += 1
+            values /= 2  # [-1,1] → [0,1]
+            out[start - row_start:stop - row_start] = values
+        return out
+
+    def locate(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Position continue de directions sur la grille.
+
+        Returns:
+            (face, ligne, colonne): Face (int8) et indices fractionnaires des
+            centres de cellules sur la face (0 = centre de la première cellule)
+        """
+        face = _face_of(x, y, z)
+        basis = _FACES[face]
+        point = np.stack([x, y, z], axis=-1)
+        depth = np.einsum("...k,...k->...", point, basis[..., 0, :])
+        a = np.arctan(np.einsum("...k,...k->...", point, basis[..., 1, :]) / depth)
+        b = np.arctan(np.einsum("...k,...k->...", point, basis[..., 2, :]) / depth)
+        scale = self.n / (np.pi / 2)
+        return face, (np.pi / 4 - b) * scale - 0.5, (a + np.pi / 4) * scale - 0.5
+
+    def resampler(self, height: int, width: int, method: str = "bilinear") -> "Resampler":
+        """Rééchantillonneur vers une grille équirectangulaire (height, width)."""
+        return Resampler(self, height, width, method)
+
+
+class Resampler:
+    """
+    Rééchantillonnage précalculé d'un calque cubique vers l'équirectangulaire.
+
+    Les indices et poids sont calculés une fois ; chaque calque coûte ensuite
+    quatre lectures indexées (bilinéaire) ou une seule (nearest, pour les
+    classes : biomes, eau). En bilinéaire, chaque face est d'abord bordée
+    d'une cellule de halo interpolée dans ses voisines. Pixel (i, j) :
+    latitude π (0.5 - i / height), longitude 2π j / width, comme
+    generate_altitude.
+
+    Args:
+        grid: CubedSphereGrid source
+        height, width: Dimensions de la carte équirectangulaire
+        method (str): "bilinear" ou "nearest"
+    """
+
+    def __init__(self, grid: CubedSphereGrid, height: int, width: int,
+                 method: str = "bilinear"):
+        if method not in ("bilinear", "nearest"):
+            raise ValueError(f"Méthode de rééchantillonnage inconnue: {method}")
+        self.grid = grid
+        self.shape = (height, width)
+        self.method = method
+        n = grid.n
+
+        lat = np.pi * (0.5 - np.arange(height) / height)
+        lon = 2 * np.pi * np.arange(width) / width
+        x = np.cos(lat)[:, None] * np.cos(lon)[None, :]
+        y = np.cos(lat)[:, None] * np.sin(lon)[None, :]
+        z = np.broadcast_to(np.sin(lat)[:, None], (height, width))
+        face, row, col = grid.locate(x, y, z)
+        index_dtype = np.int32 if 6 * (n + 2) ** 2 < 2**31 else np.int64
+
+        if method == "nearest":
+            row = np.clip(np.rint(row), 0, n - 1).astype(np.int64)
+            col = np.clip(np.rint(col), 0, n - 1).astype(np.int64)
+            self.index = (face.astype(np.int64) * n * n + row * n + col).astype(index_dtype)
+            return
+
+        # Bilinéaire sur des faces bordées d'une cellule de halo (n + 2)² prise
+        # aux faces voisines : pas de couture entre faces
+        self.halo, self.halo_index, self.halo_weights = self._halo(grid, index_dtype)
+        self.index, self.weight_row, self.weight_col = _bilinear_taps(
+            face, row + 1, col + 1, n + 2, 0, n + 1, index_dtype)
+
+    @staticmethod
+    def _halo(grid: CubedSphereGrid, index_dtype) -> Tuple[np.ndarray, tuple, tuple]:
+        """
+        Cellules de halo d'un calque bordé (6, n + 2, n + 2) et leurs valeurs.
+
+        Le centre de chaque cellule de halo prolonge la face au-delà de son
+        bord ; sa valeur est interpolée dans la face voisine qui le contient.
+
+        Returns:
+            (position, taps, poids): Indices des cellules de halo dans le calque
+            bordé, quatre indices dans le calque (6 n, n) et poids (ligne, colonne)
+        """
+        n = grid.n
+        border = np.ones((n + 2, n + 2), dtype=bool)
+        border[1:-1, 1:-1] = False
+        rows, cols = np.nonzero(border)
+        angle_row = grid._angles(rows - 1.0)
+        angle_col = grid._angles(cols - 1.0)
+
+        # Direction c + tan(a) e1 - tan(b) e2 de chaque cellule de halo, par face
+        right = np.tan(angle_col)
+        up = -np.tan(angle_row)
+        point = (_FACES[:, None, 0, :] + _FACES[:, None, 1, :] * right[None, :, None]
+                 + _FACES[:, None, 2, :] * up[None, :, None])
+        face, row, col = grid.locate(point[..., 0], point[..., 1], point[..., 2])
+        position = (np.arange(6)[:, None] * (n + 2) ** 2 + rows * (n + 2) + cols).ravel()
+        taps, weight_row, weight_col = _bilinear_taps(
+            face.ravel(), row.ravel(), col.ravel(), n, 0, n - 1, index_dtype)
+        return position.astype(index_dtype), taps, (weight_row, weight_col)
+
+    def __call__(self, field: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rééchantillonne un calque (6 n, n).
+
+        Args:
+            field: Calque de la grille cubique
+            out: Tableau de sortie optionnel (height, width)
+
+        Returns:
+            np.ndarray: Carte équirectangulaire (float32 en bilinéaire, type de
+            field en nearest)
+        """
+        if field.shape != self.grid.shape:
+            raise ValueError(f"field doit être de forme {self.grid.shape} (reçu: {field.shape})")
+        flat = field.ravel()
+        if self.method == "nearest":
+            return np.take(flat, self.index, out=out)
+
+        n = self.grid.n
+        padded = np.empty((6, n + 2, n + 2), dtype=np.float32)
+        padded[:, 1:-1, 1:-1] = field.reshape(6, n, n)
+        padded = padded.ravel()
+        padded[self.halo] = _interpolate(flat, self.halo_index, *self.halo_weights)
+        if out is None:
+            out = np.empty(self.shape, dtype=np.float32)
+        return _interpolate(padded, self.index, self.weight_row, self.weight_col, out)
+
+
+def _bilinear_taps(face: np.ndarray, row: np.ndarray, col: np.ndarray, size: int,
+                   low: float, high: float, index_dtype) -> Tuple[tuple, np.ndarray, np.ndarray]:
+    """
+    Quatre indices et poids bilinéaires dans des faces size x size empilées.
+
+    Les positions sont bornées à [low, high] ; au bord, la cellule la plus proche.
+    """
+    row = np.clip(row, low, high)
+    col = np.clip(col, low, high)
+    step = 1 if size > 1 else 0
+    r0 = np.minimum(np.floor(row).astype(np.int64), size - 1 - step)
+    c0 = np.minimum(np.floor(col).astype(np.int64), size - 1 - step)
+    top = face.astype(np.int64) * size * size + r0 * size + c0
+    taps = tuple(
+        (top + offset).astype(index_dtype)
+        for offset in (0, step, step * size, step * size + step)
+    )
+    return taps, (row - r0).astype(np.float32), (col - c0).astype(np.float32)
+
+
+def _interpolate(flat: np.ndarray, taps: tuple, weight_row: np.ndarray, weight_col: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Interpolation bilinéaire (float32) de `flat` aux quatre indices `taps`."""
+    i00, i01, i10, i11 = taps
+    upper = flat[i00].astype(np.float32)
+    upper += weight_col * (flat[i01] - upper)
+    lower = flat[i10].astype(np.float32)
+    lower += weight_col * (flat[i11] - lower)
+    lower -= upper
+    lower *= weight_row
+    if out is None:
+        return upper + lower
+    return np.add(upper, lower, out=out)
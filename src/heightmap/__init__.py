@@ -0,0 +1,11 @@
+"""
+Module de génération de cartes d'altitude (heightmaps).
+"""
+
+from .erosion import Erosion
+from .noise import CHUNK_CELLS, FractalNoise
+from .spectral import SpectralTerrain
+from .tiled import TiledAltitudeGenerator, shared_array
+
+__all__ = ['CHUNK_CELLS', 'Erosion', 'FractalNoise', 'SpectralTerrain', 'TiledAltitudeGenerator',
+           'shared_array']
@@ -0,0 +1,289 @@
+"""
+Érosion thermique et hydraulique de la carte d'altitude, vectorisée.
+
+Les deux processus s'écrivent comme des échanges entre paires de cellules
+voisines (est-ouest, avec la couture 0°/360°, puis nord-sud). Chaque
+échange retire d'une cellule ce qu'il ajoute à l'autre : la matière est
+conservée. Une paire d'axe est traitée en quelques opérations NumPy sur des
+vues décalées de la grille entière, sans boucle Python par cellule ni par
+goutte.
+
+- Thermique : au-delà de la pente d'éboulis (talus), une fraction de
+  l'excédent de dénivelé glisse vers le voisin le plus bas. Est-ouest, la
+  distance entre cellules diminue avec cos(latitude) : le talus aussi.
+- Hydraulique (grille, Olsen 2004) : pluie, dissolution proportionnelle à
+  l'eau, écoulement de l'eau et des sédiments vers les voisins plus bas
+  (surface altitude + eau), évaporation puis dépôt de l'excédent au-delà de
+  la capacité de transport.
+
+Avec `workers`, la grille est découpée en bandes de latitude. Une itération
+ne propage l'information que de deux lignes : chaque bande, lue avec une
+marge (halo) de 2 k lignes, avance de k itérations sans communiquer, puis
+les bandes échangent leurs marges via la mémoire partagée. Le résultat est
+identique au bit près au calcul en un seul processus.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# Lignes propagées par itération (une passe nord-sud thermique + une hydraulique)
+ROWS_PER_ITERATION = 2
+
+# État des workers, initialisé une seule fois par processus
+_worker = {}
+
+
+def _init_worker(erosion: "Erosion", shm_name: str, shape: Tuple[int, int]) -> None:
+    # Les workers partagent le resource_tracker du parent, seul responsable de unlink()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["erosion"] = erosion
+    # Deux jeux (lecture / écriture) de trois champs : altitude, eau, sédiments
+    _worker["fields"] = np.ndarray((2, 3) + shape, dtype=np.float32, buffer=shm.buf)
+
+
+def _erode_band_in_worker(task: Tuple[int, int, int, int]) -> None:
+    r0, r1, iterations, source = task
+    fields = _worker["fields"]
+    _worker["erosion"]._erode_band(fields[source], fields[1 - source], r0, r1, iterations)
+
+
+def _pairs(field: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Vues (cellule, voisin) de toutes les paires d'un axe, puis de l'autre.
+
+    Yields:
+        (a, b, axe): axe 1 = est-ouest (couture comprise), axe 0 = nord-sud
+    """
+    yield field[:, :-1], field[:, 1:], 1
+    yield field[:, -1:], field[:, :1], 1  # couture 0°/360°
+    yield field[:-1], field[1:], 0
+
+
+def _scratch(buffer: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """Vue contiguë de `shape` au début d'un tampon plat (pas d'allocation)."""
+    return buffer[:int(np.prod(shape))].reshape(shape)
+
+
+class Erosion:
+    """
+    Érosion thermique et hydraulique d'une carte d'altitude (H, W) dans [0, 1].
+
+    Args:
+        talus (float): Pente d'éboulis, en altitude par radian d'arc (par défaut: 4.0,
+            soit 0.006 par cellule à l'équateur sur 4096 colonnes)
+        thermal_rate (float): Fraction de l'excédent déplacée par itération, dans ]0, 0.25]
+        rain (float): Eau ajoutée à chaque cellule par itération (par défaut: 0.01)
+        solubility (float): Altitude dissoute par unité d'eau et par itération (par défaut: 0.01)
+        capacity (float): Sédiments transportables par unité d'eau (par défaut: 0.01)
+        evaporation (float): Fraction de l'eau évaporée par itération (par défaut: 0.5)
+        flow_rate (float): Fraction de l'écart de surface écoulée par paire, dans ]0, 0.5]
+
+    Example:
+        >>> altitude = determiner.generate_altitude()
+        >>> Erosion().run(altitude, iterations=100, out=altitude)
+        >>> Erosion().run(altitude, iterations=100, workers=8)  # bandes en parallèle
+    """
+
+    def __init__(
+        self,
+        talus: float = 4.0,
+        thermal_rate: float = 0.25,
+        rain: float = 0.01,
+        solubility: float = 0.01,
+        capacity: float = 0.01,
+        evaporation: float = 0.5,
+        flow_rate: float = 0.5
+    ):
+        # Bornes qui garantissent qu'aucune cellule ne cède plus qu'elle n'a
+        if not 0 < thermal_rate <= 0.25:
+            raise ValueError(f"thermal_rate doit être dans ]0, 0.25] (reçu: {thermal_rate})")
+        if not 0 < flow_rate <= 0.5:
+            raise ValueError(f"flow_rate doit être dans ]0, 0.5] (reçu: {flow_rate})")
+        if not 0 <= evaporation <= 1:
+            raise ValueError(f"evaporation doit être dans [0, 1] (reçu: {evaporation})")
+        self.talus = talus
+        self.thermal_rate = thermal_rate
+        self.rain = rain
+        self.solubility = solubility
+        self.capacity = capacity
+        self.evaporation = evaporation
+        self.flow_rate = flow_rate
+
+    def erode(
+        self,
+        altitude: np.ndarray,
+        water: np.ndarray,
+        sediment: np.ndarray,
+        iterations: int,
+        row_start: int = 0,
+        height: Optional[int] = None
+    ) -> None:
+        """
+        Avance de `iterations` itérations, en place, sur une bande de lignes.
+
+        Args:
+            altitude, water, sediment: Champs float32 (lignes, W) de la bande
+            iterations: Nombre d'itérations
+            row_start: Première ligne de la bande dans la carte complète
+            height: Hauteur de la carte complète (None = la bande est la carte)
+        """
+        rows, width = altitude.shape
+        height = height if height is not None else rows
+        lat = np.pi * (0.5 - (np.arange(row_start, row_start + rows) + 0.5) / height)
+        # Pente d'éboulis par cellule : l'écart est-ouest se resserre avec cos(latitude)
+        cell = self.talus * 2 * np.pi / width
+        talus = ((cell * np.cos(lat)).astype(np.float32)[:, None], np.float32(cell))
+        scratch = [np.empty(rows * width, dtype=np.float32) for _ in range(5)]
+        mask = np.empty(rows * width, dtype=bool)
+
+        for _ in range(iterations):
+            self._thermal(altitude, talus, scratch)
+            self._hydraulic(altitude, water, sediment, scratch, mask)
+
+    def _thermal(self, altitude: np.ndarray, talus: Tuple[np.ndarray, np.float32],
+                 scratch: List[np.ndarray]) -> None:
+        rate = np.float32(self.thermal_rate)
+        for a, b, axis in _pairs(altitude):
+            drop = np.subtract(a, b, out=_scratch(scratch[0], a.shape))  # > 0 : a plus haut
+            moved = np.abs(drop, out=_scratch(scratch[1], a.shape))
+            moved -= talus[0] if axis == 1 else talus[1]
+            np.maximum(moved, 0, out=moved)
+            moved *= rate
+            np.copysign(moved, drop, out=moved)
+            a -= moved
+            b += moved
+
+    def _hydraulic(self, altitude: np.ndarray, water: np.ndarray, sediment: np.ndarray,
+                   scratch: List[np.ndarray], mask: np.ndarray) -> None:
+        water += np.float32(self.rain)
+        dissolved = np.multiply(water, np.float32(self.solubility),
+                                out=_scratch(scratch[0], water.shape))
+        altitude -= dissolved
+        sediment += dissolved
+
+        flow_rate = np.float32(self.flow_rate)
+        half = np.float32(0.5)
+        tiny = np.float32(np.finfo(np.float32).tiny)
+        surface = _scratch(scratch[3], water.shape)
+        concentration = _scratch(scratch[4], water.shape)
+        passes = (slice(0, 2), slice(2, 3))  # est-ouest (avec couture), puis nord-sud
+        for selected in passes:
+            np.add(altitude, water, out=surface)
+            np.maximum(water, tiny, out=concentration)
+            np.divide(sediment, concentration, out=concentration)
+            pairs = zip(list(_pairs(surface))[selected], list(_pairs(water))[selected],
+                        list(_pairs(sediment))[selected], list(_pairs(concentration))[selected])
+            for (s_a, s_b, _), (w_a, w_b, _), (c_a, c_b, _), (k_a, k_b, _) in pairs:
+                shape = s_a.shape
+                drop = np.subtract(s_a, s_b, out=_scratch(scratch[0], shape))
+                down = np.greater(drop, 0, out=_scratch(mask, shape))
+                # Eau disponible à la source (la cellule la plus haute)
+                source = _scratch(scratch[1], shape)
+                np.copyto(source, w_b)
+                np.copyto(source, w_a, where=down)
+                moved = np.abs(drop, out=_scratch(scratch[2], shape))
+                moved *= half
+                np.minimum(moved, source, out=moved)
+                moved *= flow_rate
+                np.copysign(moved, drop, out=moved)
+                # Sédiments emportés à la concentration de la source
+                carried = source
+                np.copyto(carried, k_b)
+                np.copyto(carried, k_a, where=down)
+                carried *= moved
+                w_a -= moved
+                w_b += moved
+                c_a -= carried
+                c_b += carried
+
+        water *= np.float32(1 - self.evaporation)
+        # Dépôt de ce qui dépasse la capacité de transport
+        excess = np.multiply(water, np.float32(-self.capacity), out=_scratch(scratch[0], water.shape))
+        excess += sediment
+        np.maximum(excess, 0, out=excess)
+        sediment -= excess
+        altitude += excess
+
+    def _erode_band(self, source: np.ndarray, target: np.ndarray, r0: int, r1: int,
+                    iterations: int) -> None:
+        """Avance la bande [r0, r1) lue avec son halo dans source, écrite dans target."""
+        height = source.shape[1]
+        halo = ROWS_PER_ITERATION * iterations
+        lo, hi = max(0, r0 - halo), min(height, r1 + halo)
+        altitude, water, sediment = (np.array(field[lo:hi]) for field in source)
+        self.erode(altitude, water, sediment, iterations, row_start=lo, height=height)
+        for field, band in zip(target, (altitude, water, sediment)):
+            field[r0:r1] = band[r0 - lo:r1 - lo]
+
+    def run(
+        self,
+        altitude: np.ndarray,
+        iterations: int = 50,
+        out: Optional[np.ndarray] = None,
+        workers: Optional[int] = None,
+        band_rows: Optional[int] = None,
+        exchange_every: int = 8
+    ) -> np.ndarray:
+        """
+        Érode une carte d'altitude ; les sédiments encore en suspension sont
+        déposés à la fin.
+
+        Args:
+            altitude: Carte (H, W), ligne 0 au pôle nord
+            iterations: Budget d'itérations
+            out: Tableau float32 de sortie optionnel (peut être altitude)
+            workers: Nombre de processus (None, 0 ou 1 = calcul dans le processus courant)
+            band_rows: Lignes par bande en parallèle (None = H / workers)
+            exchange_every: Itérations entre deux échanges de halos en parallèle
+
+        Returns:
+            np.ndarray: Altitude érodée (float32)
+        """
+        if altitude.ndim != 2:
+            raise ValueError("altitude doit être une matrice 2D")
+        if iterations < 0 or exchange_every < 1:
+            raise ValueError("iterations doit être >= 0 et exchange_every >= 1")
+        if out is None:
+            out = altitude.astype(np.float32, copy=True)
+        elif out.shape != altitude.shape or out.dtype != np.float32:
+            raise ValueError("out doit être un tableau float32 de la forme de altitude")
+        elif out is not altitude:
+            out[...] = altitude
+
+        height, width = altitude.shape
+        if not workers or workers <= 1:
+            water = np.zeros_like(out)
+            sediment = np.zeros_like(out)
+            self.erode(out, water, sediment, iterations)
+            out += sediment
+            return out
+
+        band_rows = band_rows or -(-height // workers)
+        bands = [(r0, min(r0 + band_rows, height)) for r0 in range(0, height, band_rows)]
+        shm = shared_memory.SharedMemory(create=True, size=6 * out.nbytes)
+        try:
+            fields = np.ndarray((2, 3, height, width), dtype=np.float32, buffer=shm.buf)
+            fields[0, 0] = out
+            fields[0, 1:] = 0
+            source = 0
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self, shm.name, (height, width))
+            ) as pool:
+                for done in range(0, iterations, exchange_every):
+                    steps = min(exchange_every, iterations - done)
+                    tasks = [(r0, r1, steps, source) for r0, r1 in bands]
+                    for _ in pool.map(_erode_band_in_worker, tasks):
+                        pass
+                    source = 1 - source
+            np.add(fields[source, 0], fields[source, 2], out=out)
+            del fields
+        finally:
+            shm.close()
+            shm.unlink()
+        return out
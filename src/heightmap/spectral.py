@@ -0,0 +1,169 @@
+"""
+Terrain fractal par synthèse spectrale (FFT).
+
+Un bruit blanc gaussien est mis en forme dans le domaine fréquentiel par
+un spectre de puissance en loi de puissance P(f) ∝ f^-beta, puis ramené dans
+l'espace par une seule FFT inverse réelle (np.fft.irfft2). Le coût est en
+O(n log n) quel que soit le nombre d'octaves représentées : toutes les
+échelles, du continent au pixel, sont produites en une fois.
+
+Les coefficients sont tirés directement dans le domaine fréquentiel
+(équivalent, en loi, à np.fft.rfft2 d'un bruit blanc) en complex64, par
+blocs de lignes. La carte est périodique en longitude par construction,
+donc sans couture à 0°/360°.
+
+En latitude, un champ périodique relierait le pôle nord au pôle sud. Le
+champ est donc tiré sur 2 H lignes puis replié : la ligne i reçoit aussi
+la ligne 2 H - 1 - i décalée d'un demi-tour de longitude. Franchir un pôle
+ramène alors sur le méridien opposé, comme sur la sphère, et les deux
+pôles sont indépendants.
+
+Les valeurs du champ suivent une loi normale. Avec `quantiles`, elles sont
+transportées sur une distribution d'altitude cible (par exemple celle du
+bruit de gradient) : un même niveau de la mer découvre alors la même part
+de terres qu'avec l'autre moteur.
+"""
+from typing import Optional
+
+import numpy as np
+from scipy import special
+
+
+# Lignes de coefficients tirées à la fois (borne les temporaires du tirage)
+SPECTRAL_BLOCK_ROWS = 256
+
+# Entrées de la table de transport vers les quantiles cibles
+QUANTILE_TABLE_SIZE = 4096
+
+
+class SpectralTerrain:
+    """
+    Générateur de terrain fBm par FFT, dans [0, 1].
+
+    Args:
+        beta (float): Exposant du spectre de puissance (par défaut: 3.0) ; plus
+            il est grand, plus le relief est lisse
+        corner (float): Fréquence de coupure basse, en cycles le long de
+            l'équateur : en dessous, le spectre est plat (None = aucune, les
+            plus grandes structures ont la taille de la planète)
+        seed (int): Graine du tirage (None = aléatoire)
+
+    Example:
+        >>> terrain = SpectralTerrain(beta=3.0, seed=42)
+        >>> altitude = terrain.generate(16384, 8192)  # float32 dans [0, 1]
+    """
+
+    def __init__(self, beta: float = 3.0, corner: Optional[float] = None,
+                 seed: Optional[int] = None):
+        if beta <= 0:
+            raise ValueError(f"beta doit être positif (reçu: {beta})")
+        if corner is not None and corner < 0:
+            raise ValueError(f"corner doit être positif ou nul (reçu: {corner})")
+        self.beta = beta
+        self.corner = corner
+        self.seed = seed
+
+    def spectrum(self, width: int, height: int) -> np.ndarray:
+        """
+        Coefficients de Fourier aléatoires (height, width // 2 + 1), complex64.
+
+        Amplitude (f² + f0²)^(-beta / 4) avec f la fréquence radiale en cycles
+        par pixel et f0 la coupure ; le mode constant est nul (moyenne nulle).
+        """
+        rng = np.random.default_rng(self.seed)
+        fx = np.fft.rfftfreq(width).astype(np.float32) ** 2
+        fy = np.fft.fftfreq(height).astype(np.float32) ** 2
+        f0 = np.float32((self.corner or 0.0) / width) ** 2
+        exponent = np.float32(-self.beta / 4)
+
+        coefficients = np.empty((height, len(fx)), dtype=np.complex64)
+        for start in range(0, height, SPECTRAL_BLOCK_ROWS):
+            rows = slice(start, min(start + SPECTRAL_BLOCK_ROWS, height))
+            radius = fy[rows, None] + fx[None, :]
+            radius += f0
+            radius[radius == 0] = np.inf  # mode constant : amplitude nulle
+            amplitude = np.power(radius, exponent, out=radius)
+            # Partie réelle et imaginaire gaussiennes, vues comme un complex64
+            block = rng.standard_normal(amplitude.shape + (2,), dtype=np.float32)
+            block = block.view(np.complex64)[..., 0]
+            block *= amplitude
+            coefficients[rows] = block
+        return coefficients
+
+    def generate(
+        self,
+        width: int,
+        height: int,
+        out: Optional[np.ndarray] = None,
+        quantiles: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Génère une carte d'altitude (height, width).
+
+        Args:
+            width: Largeur en pixels (longitude)
+            height: Hauteur en pixels (latitude)
+            out: Tableau float32 de sortie optionnel
+            quantiles: Quantiles croissants (n,) de la distribution d'altitude
+                cible, aux niveaux régulièrement espacés de 0 à 1 (None = carte
+                étirée sur [0, 1], minimum 0 et maximum 1)
+
+        Returns:
+            np.ndarray: Altitude float32 dans [0, 1]
+        """
+        if width < 2 or height < 1:
+            raise ValueError(f"Dimensions invalides: ({width}, {height})")
+        if quantiles is not None:
+            quantiles = np.asarray(quantiles, dtype=np.float64)
+            if quantiles.ndim != 1 or len(quantiles) < 2 or np.any(np.diff(quantiles) < 0):
+                raise ValueError("quantiles doit être un vecteur croissant d'au moins deux valeurs")
+        if out is None:
+            out = np.empty((height, width), dtype=np.float32)
+        elif out.shape != (height, width):
+            raise ValueError(f"out doit être de forme {(height, width)} (reçu: {out.shape})")
+
+        # Champ périodique sur 2 H lignes, replié aux pôles avec un demi-tour :
+        # FFT inverse en latitude sur place, puis en longitude par blocs de
+        # lignes (seuls les coefficients et la carte restent en mémoire)
+        coefficients = self.spectrum(width, 2 * height)
+        np.fft.ifft(coefficients, axis=0, out=coefficients)
+        half = width // 2
+        for start in range(0, height, SPECTRAL_BLOCK_ROWS):
+            stop = min(start + SPECTRAL_BLOCK_ROWS, height)
+            north = np.fft.irfft(coefficients[start:stop], n=width, axis=1)
+            # Ligne 2 H - 1 - i pour la ligne i
+            south = np.fft.irfft(coefficients[2 * height - stop:2 * height - start][::-1],
+                                 n=width, axis=1)
+            np.add(north[:, :width - half], south[:, half:], out=out[start:stop, :width - half])
+            np.add(north[:, width - half:], south[:, :half], out=out[start:stop, width - half:])
+        del coefficients
+
+        if quantiles is None:
+            low, high = out.min(), out.max()
+            out -= low
+            out /= max(high - low, np.finfo(np.float32).tiny)
+            return out
+
+        # Valeur du champ à chaque niveau de la loi normale (extrêmes du champ
+        # aux bouts), associée au quantile de même niveau de la cible
+        mean, std = out.mean(dtype=np.float64), out.std(dtype=np.float64)
+        low, high = float(out.min()), float(out.max())
+        levels = special.ndtri(np.linspace(0, 1, len(quantiles))) * std + mean
+        levels[0], levels[-1] = low, high
+        levels = np.maximum.accumulate(np.clip(levels, low, high))
+        # Table régulière en valeur du champ : l'indice d'une cellule est une
+        # multiplication, sans la recherche dichotomique de np.interp
+        size = QUANTILE_TABLE_SIZE
+        table = np.interp(np.linspace(low, high, size), levels, quantiles).astype(np.float32)
+        slope = np.append(np.diff(table), np.float32(0))
+        step = np.float32((size - 1) / max(high - low, np.finfo(np.float32).tiny))
+        for start in range(0, height, SPECTRAL_BLOCK_ROWS):
+            block = out[start:start + SPECTRAL_BLOCK_ROWS]
+            block -= np.float32(low)
+            block *= step
+            index = block.astype(np.int32)
+            np.minimum(index, size - 1, out=index)
+            block -= index
+            block *= slope[index]
+            block += table[index]
+        return out
@@ -0,0 +1,187 @@
+"""
+Génération d'altitude par tuiles, répartie sur plusieurs processus.
+
+La grille équirectangulaire est découpée en tuiles de taille fixe. Chaque
+tuile est calculée par un worker d'un ProcessPoolExecutor et écrite
+directement dans le tableau de sortie, alloué en mémoire partagée
+(shared_array) : la carte n'existe qu'en un exemplaire, sans copie finale.
+
+Le bruit est échantillonné en 3D sur la sphère : une tuile ne dépend que de
+la table de permutation (dérivée de la graine globale) et des coordonnées
+globales de ses pixels. Le résultat est donc identique au bit près quel que
+soit le nombre de workers, et continu à la couture 0°/360°.
+"""
+import ctypes
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .noise import CHUNK_CELLS, FractalNoise
+
+
+Tile = Tuple[int, int, int, int]  # (ligne début, ligne fin, colonne début, colonne fin)
+
+# État des workers, initialisé une seule fois par processus
+_worker = {}
+
+
+def shared_array(shape: Tuple[int, ...], dtype: np.dtype = np.float32) -> np.ndarray:
+    """
+    Tableau NumPy en mémoire partagée entre processus (multiprocessing.RawArray).
+
+    La mémoire est libérée avec le dernier tableau qui la référence ; les
+    workers de TiledAltitudeGenerator.generate() y écrivent directement.
+
+    Args:
+        shape: Forme du tableau
+        dtype: Type des éléments
+
+    Returns:
+        np.ndarray: Tableau C-contigu initialisé à zéro
+    """
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape))
+    raw = RawArray(ctypes.c_char, max(1, count * dtype.itemsize))
+    return np.frombuffer(raw, dtype=dtype, count=count).reshape(shape)
+
+
+def _shared_buffer(array: np.ndarray) -> Optional[ctypes.Array]:
+    """RawArray sous-jacent si `array` couvre tout un tableau de shared_array(), sinon None."""
+    base = array
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if (
+        isinstance(base, ctypes.Array)
+        and array.flags.c_contiguous
+        and array.ctypes.data == ctypes.addressof(base)
+    ):
+        return base
+    return None
+
+
+def _init_worker(generator: "TiledAltitudeGenerator", raw: ctypes.Array, dtype: str) -> None:
+    _worker["generator"] = generator
+    shape = (generator.height, generator.width)
+    _worker["out"] = np.frombuffer(raw, dtype=dtype, count=shape[0] * shape[1]).reshape(shape)
+
+
+def _fill_tile_in_worker(tile: Tile) -> Tile:
+    _worker["generator"].fill_tile(_worker["out"], tile)
+    return tile
+
+
+class TiledAltitudeGenerator:
+    """
+    Générateur d'altitude équirectangulaire par tuiles, dans [0, 1].
+
+    Args:
+        width (int): Largeur de la carte en pixels (longitude)
+        height (int): Hauteur de la carte en pixels (latitude)
+        scale (float): Nombre de mailles du bruit le long de l'équateur (par défaut: 100)
+        noise (FractalNoise): Bruit à échantillonner (None = FractalNoise(octaves=6, seed=seed))
+        seed (int): Graine du bruit créé par défaut
+        tile_size (int): Côté des tuiles en pixels (par défaut: 512)
+
+    Example:
+        >>> generator = TiledAltitudeGenerator(16384, 8192, seed=42)
+        >>> altitude = generator.generate(workers=8)
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        scale: float = 100,
+        noise: Optional[FractalNoise] = None,
+        seed: Optional[int] = None,
+        tile_size: int = 512
+    ):
+        if width < 1 or height < 1:
+            raise ValueError(f"Dimensions invalides: ({width}, {height})")
+        if tile_size < 1:
+            raise ValueError(f"tile_size doit être >= 1 (reçu: {tile_size})")
+
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.noise = noise if noise is not None else FractalNoise(octaves=6, seed=seed)
+        self.tile_size = tile_size
+
+    def tiles(self) -> Iterator[Tile]:
+        """Énumère les tuiles ; le découpage ne dépend pas du nombre de workers."""
+        for r0 in range(0, self.height, self.tile_size):
+            for c0 in range(0, self.width, self.tile_size):
+                yield (r0, min(r0 + self.tile_size, self.height),
+                       c0, min(c0 + self.tile_size, self.width))
+
+    def fill_tile(self, out: np.ndarray, tile: Tile) -> None:
+        """
+        Calcule une tuile et l'écrit dans `out` (grille complète).
+
+        Args:
+            out: Tableau de sortie de forme (height, width)
+            tile: Bornes (r0, r1, c0, c1) de la tuile en coordonnées globales
+        """
+        r0, r1, c0, c1 = tile
+        lon = 2 * np.pi * np.arange(c0, c1) / self.width
+        cos_lon, sin_lon = np.cos(lon), np.sin(lon)
+        # Rayon choisi pour que l'équateur couvre `scale` mailles du bruit
+        radius = self.scale / (2 * np.pi)
+
+        block_rows = max(1, CHUNK_CELLS // (c1 - c0))
+        for start in range(r0, r1, block_rows):
+            rows = np.arange(start, min(start + block_rows, r1))
+            lat = np.pi * (0.5 - rows / self.height)
+            ring = (radius * np.cos(lat))[:, None]
+            x = ring * cos_lon
+            y = ring * sin_lon
+            z = (radius * np.sin(lat))[:, None]
+            values = self.noise(x, y, z)
+            values += 1
+            values /= 2  # [-1,1] → [0,1]
+            out[start:start + len(rows), c0:c1] = values
+
+    def generate(
+        self,
+        workers: Optional[int] = None,
+        out: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """
+        Génère la carte d'altitude complète.
+
+        Args:
+            workers: Nombre de processus (None, 0 ou 1 = calcul dans le processus courant)
+            out: Tableau de sortie optionnel de forme (height, width) ; en
+                parallèle, un tableau de shared_array() est rempli sans copie,
+                tout autre tableau reçoit une copie finale
+            dtype: Type du tableau créé si `out` n'est pas fourni
+
+        Returns:
+            np.ndarray: Altitude dans [0, 1] (en mémoire partagée si créée en parallèle)
+        """
+        shape = (self.height, self.width)
+        parallel = bool(workers) and workers > 1
+        if out is None:
+            out = shared_array(shape, dtype) if parallel else np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out doit être de forme {shape} (reçu: {out.shape})")
+
+        if not parallel:
+            for tile in self.tiles():
+                self.fill_tile(out, tile)
+            return out
+
+        target = out if _shared_buffer(out) is not None else shared_array(shape, out.dtype)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self, _shared_buffer(target), target.dtype.str)
+        ) as pool:
+            for _ in pool.map(_fill_tile_in_worker, self.tiles()):
+                pass
+        if target is not out:
+            out[...] = target
+        return out
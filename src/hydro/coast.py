@@ -0,0 +1,173 @@
+"""
+Distance à la côte sur une carte équirectangulaire.
+
+Transformée de distance euclidienne exacte (Felzenszwalb & Huttenlocher) en
+deux passes séparables :
+
+1. le long des lignes, distance périodique (couture 0°/360°) à la cellule
+   d'eau la plus proche, convertie en longueur par cos(latitude) de la ligne ;
+2. le long des colonnes, enveloppe inférieure des paraboles
+   (Δlatitude)² + distance_ligne², calculée pour toutes les colonnes à la fois.
+
+La composante est-ouest est mesurée à la latitude de la cellule d'eau : la
+métrique est celle d'un plan tangent local, exacte pour la distance ainsi
+définie et proche de la distance sur la sphère à courte distance.
+"""
+from typing import Iterable, Union
+
+import numpy as np
+
+from .hydro import OCEAN
+
+
+def _row_distance(target: np.ndarray) -> np.ndarray:
+    """Écart en colonnes (périodique) à la cible la plus proche de la même ligne."""
+    height, width = target.shape
+    cols = np.arange(width, dtype=np.int32)
+    big = np.int32(4 * width)
+
+    # Dernière cible à gauche (ou sur) la colonne ; avant la première cible de
+    # la ligne, c'est la dernière cible de la ligne, une largeur plus à gauche
+    before = np.where(target, cols, -big)
+    np.maximum.accumulate(before, axis=1, out=before)
+    wrap = np.where(before < 0, before[:, -1:] - width, before)
+    left = cols - wrap
+
+    # Première cible à droite (ou sur) la colonne, symétriquement
+    after = np.where(target, cols, big)[:, ::-1]
+    np.minimum.accumulate(after, axis=1, out=after)
+    after = after[:, ::-1]
+    wrap = np.where(after >= width, after[:, :1] + width, after)
+    right = wrap - cols
+
+    distance = np.minimum(left, right).astype(np.float64)
+    distance[distance > width] = np.inf  # ligne sans cible
+    return distance
+
+
+def _lower_envelope(cost: np.ndarray) -> np.ndarray:
+    """
+    min_k (i - k)² + cost[k] pour chaque ligne i, colonne par colonne.
+
+    Algorithme de Felzenszwalb & Huttenlocher exécuté en parallèle sur toutes
+    les colonnes : la boucle Python porte sur les lignes, les opérations sur
+    des vecteurs de largeur W. La parabole au sommet de chaque pile est gardée
+    dans des vecteurs, les piles complètes (indexées à plat, k * W + colonne)
+    ne sont relues que lors des dépilements.
+    """
+    height, width = cost.shape
+    result = np.full((height, width), np.inf)
+    finite = np.isfinite(cost)
+    first = np.argmax(finite, axis=0)
+    targets = np.flatnonzero(finite[first, np.arange(width)])
+    if targets.size < width:
+        # Les colonnes sans cible restent à l'infini
+        if targets.size:
+            result[:, targets] = _lower_envelope(cost[:, targets])
+        return result
+
+    flat_cost = cost.ravel()
+    cols = np.arange(width, dtype=np.int64)
+    vertex = np.empty(height * width, dtype=np.int64)  # ligne de chaque parabole
+    bound = np.empty((height + 1) * width)  # borne inférieure de chaque parabole
+    vertex[cols] = first
+    bound[cols] = -np.inf
+
+    top = np.zeros(width, dtype=np.int64)
+    top_vertex = first.astype(np.int64)
+    top_offset = cost[first, cols] + top_vertex ** 2  # cost[v] + v²
+    top_bound = np.full(width, -np.inf)
+    pushable = finite & (np.arange(height)[:, None] > first)
+
+    for q in range(1, height):
+        # Tranche pleine si toute la ligne est empilable (cas courant) : pas de copie
+        c = slice(None) if pushable[q].all() else np.flatnonzero(pushable[q])
+        c_index = cols[c]
+        if c_index.size == 0:
+            continue
+        offset = cost[q, c] + q * q
+        k = top[c].copy()
+        s = (offset - top_offset[c]) / (2.0 * (q - top_vertex[c]))
+
+        # Retire les paraboles masquées par la nouvelle (bound = -inf en bas de pile)
+        pop = np.flatnonzero(s <= top_bound[c])
+        while pop.size:
+            k[pop] -= 1
+            cp = c_index[pop]
+            v = vertex[k[pop] * width + cp]
+            s[pop] = (offset[pop] - (flat_cost[v * width + cp] + v * v)) / (2.0 * (q - v))
+            pop = pop[s[pop] <= bound[k[pop] * width + cp]]
+
+        k += 1
+        index = k * width + c_index
+        vertex[index] = q
+        bound[index] = s
+        top[c] = k
+        top_vertex[c] = q
+        top_offset[c] = offset
+        top_bound[c] = s
+
+    bound[(top + 1) * width + cols] = np.inf
+
+    # Parcours des lignes : chaque colonne avance dans sa pile
+    k = np.zeros(width, dtype=np.int64)
+    current = first.astype(np.int64)
+    current_cost = cost[first, cols]
+    next_bound = bound[width + cols]
+    rows = np.arange(height)
+    for i in rows:
+        moved = np.flatnonzero(next_bound < i)
+        if moved.size:
+            step = moved
+            while step.size:
+                k[step] += 1
+                next_bound[step] = bound[(k[step] + 1) * width + step]
+                step = step[next_bound[step] < i]
+            v = vertex[k[moved] * width + moved]
+            current[moved] = v
+            current_cost[moved] = flat_cost[v * width + moved]
+        np.subtract(i, current, out=result[i])
+        result[i] **= 2
+        result[i] += current_cost
+    return result
+
+
+def coast_distance(
+    water_map: np.ndarray,
+    water: Union[int, Iterable[int]] = OCEAN,
+    radius: float = 1.0
+) -> np.ndarray:
+    """
+    Distance de chaque cellule à la cellule d'eau la plus proche.
+
+    Args:
+        water_map: Carte de Hydrosphere.compute, forme (H, W), ligne 0 au pôle nord
+        water: Classe(s) comptées comme eau (par défaut: OCEAN)
+        radius: Rayon de la planète ; 1.0 donne des distances en radians
+
+    Returns:
+        np.ndarray: Distances float32 (0 sur l'eau, inf s'il n'y a aucune eau)
+
+    Example:
+        >>> distance = coast_distance(Hydrosphere(0.45).compute(altitude))
+        >>> humidity = determiner.humidity_map(altitude, coast_distance=distance)
+    """
+    if water_map.ndim != 2:
+        raise ValueError("water_map doit être une matrice 2D")
+
+    height, width = water_map.shape
+    target = np.isin(water_map, np.atleast_1d(np.asarray(water)))
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    d_lon = 2 * np.pi / width
+    d_lat = np.pi / height
+
+    # Passe 1 : écart est-ouest en longueur, exprimé en pas de latitude
+    cost = _row_distance(target)
+    cost *= (np.cos(lat) * d_lon / d_lat)[:, None]
+    cost **= 2
+
+    # Passe 2 : enveloppe inférieure le long des méridiens
+    distance = _lower_envelope(cost)
+    np.sqrt(distance, out=distance)
+    distance *= d_lat * radius
+    return distance.astype(np.float32)
@@ -0,0 +1,174 @@
+"""
+Composantes connexes sur une carte équirectangulaire périodique.
+
+scipy.ndimage.label étiquette l'intérieur de la carte en temps linéaire mais
+traite la couture 0°/360° et les pôles comme des bords : un continent à
+cheval sur la couture y est coupé en deux. Au pôle, une cellule de la
+première (ou dernière) ligne touche celle de la longitude opposée, plus ses
+deux voisines en 8-connexité. Les étiquettes qui se touchent à
+travers la couture ou un pôle sont ensuite fusionnées par union-find, puis
+renumérotées de 1 à n.
+
+Les statistiques (nombre de cellules, surface pondérée par cos(latitude))
+s'obtiennent avec un seul np.bincount par grandeur.
+"""
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+from scipy import ndimage
+
+from .hydro import OCEAN
+
+
+_STRUCTURES = {
+    4: ndimage.generate_binary_structure(2, 1),
+    8: ndimage.generate_binary_structure(2, 2),
+}
+
+
+def _find(parent: list, i: int) -> int:
+    """Racine de i, avec compression de chemin par division."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union_find(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Racine de chaque étiquette 0..n-1 après union des paires (a[k], b[k]).
+
+    Seules les étiquettes présentes dans les paires passent par la boucle
+    Python ; les autres sont leur propre racine.
+    """
+    involved, local = np.unique(np.concatenate([a, b]), return_inverse=True)
+    parent = list(range(len(involved)))
+    la, lb = local[:len(a)].tolist(), local[len(a):].tolist()
+    for i, j in zip(la, lb):
+        ri, rj = _find(parent, i), _find(parent, j)
+        if ri != rj:
+            # La plus petite étiquette devient la racine
+            if ri < rj:
+                parent[rj] = ri
+            else:
+                parent[ri] = rj
+
+    root = np.arange(n, dtype=np.int64)
+    root[involved] = involved[[_find(parent, i) for i in range(len(involved))]]
+    return root
+
+
+def _seam_pairs(labels: np.ndarray, connectivity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Paires d'étiquettes voisines à travers la couture et les pôles."""
+    height, width = labels.shape
+    first, last = labels[:, 0], labels[:, -1]
+    pairs = [(first, last)]
+    if connectivity == 8:
+        pairs += [(first[1:], last[:-1]), (first[:-1], last[1:])]
+
+    # Au pôle, la cellule j touche la cellule diamétralement opposée j + W/2
+    # et, en 8-connexité, ses deux voisines j + W/2 ± 1
+    if width % 2 == 0:
+        half = width // 2
+        shifts = (half - 1, half, half + 1) if connectivity == 8 else (half,)
+        for row in (labels[0], labels[-1]):
+            for shift in shifts:
+                pairs.append((row, np.roll(row, -shift)))
+
+    a = np.concatenate([p[0] for p in pairs])
+    b = np.concatenate([p[1] for p in pairs])
+    keep = (a > 0) & (b > 0) & (a != b)
+    return a[keep], b[keep]
+
+
+def label_periodic(mask: np.ndarray, connectivity: int = 8) -> Tuple[np.ndarray, int]:
+    """
+    Étiquette les composantes connexes d'un masque, longitude périodique.
+
+    Args:
+        mask: Masque booléen 2D (H, W), ligne 0 au pôle nord
+        connectivity: 4 ou 8 voisins (par défaut: 8)
+
+    Returns:
+        (labels, n): Étiquettes int32 (0 hors du masque, 1..n sinon) et nombre
+        de composantes
+
+    Raises:
+        ValueError: Si le masque n'est pas 2D ou si la connectivité est invalide
+
+    Example:
+        >>> labels, n = label_periodic(water_map == OCEAN)
+    """
+    if mask.ndim != 2:
+        raise ValueError("mask doit être une matrice 2D")
+    if connectivity not in _STRUCTURES:
+        raise ValueError(f"connectivity doit valoir 4 ou 8 (reçu: {connectivity})")
+
+    labels, n = ndimage.label(mask, structure=_STRUCTURES[connectivity], output=np.int32)
+    a, b = _seam_pairs(labels, connectivity)
+    if len(a) == 0:
+        return labels, n
+
+    root = _union_find(n + 1, a, b)
+    # Renumérotation compacte : 0 reste le fond
+    _, compact = np.unique(root, return_inverse=True)
+    compact = compact.astype(np.int32)
+    return compact[labels], int(compact.max())
+
+
+def cell_area_weights(height: int) -> np.ndarray:
+    """
+    Fraction de la surface de la planète occupée par chaque ligne (∝ cos(latitude)).
+
+    Une cellule de la ligne i pèse poids[i] / W ; la carte entière somme à 1.
+    """
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    weights = np.cos(lat)
+    return weights / weights.sum()
+
+
+def component_stats(labels: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nombre de cellules et surface de chaque composante.
+
+    Args:
+        labels: Étiquettes de label_periodic, forme (H, W)
+        n: Nombre de composantes
+
+    Returns:
+        (counts, areas): Tableaux de longueur n (composante k à l'indice k-1) ;
+        areas est la fraction de la surface de la planète
+    """
+    height, width = labels.shape
+    flat = labels.ravel()
+    counts = np.bincount(flat, minlength=n + 1)[1:]
+    weights = np.repeat(cell_area_weights(height) / width, width)
+    areas = np.bincount(flat, weights=weights, minlength=n + 1)[1:]
+    return counts, areas
+
+
+def label_water(
+    water_map: np.ndarray,
+    classes: Union[int, Iterable[int]] = OCEAN,
+    connectivity: int = 8
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Étiquette les étendues d'une ou plusieurs classes de la carte de l'eau.
+
+    Args:
+        water_map: Carte de Hydrosphere.compute (éventuellement complétée par Hydrology)
+        classes: Classe(s) formant les composantes, par ex. OCEAN pour les mers
+            ou (COTE, TERRE) pour les continents
+        connectivity: 4 ou 8 voisins (par défaut: 8)
+
+    Returns:
+        (labels, counts, areas): Étiquettes et statistiques de component_stats
+
+    Example:
+        >>> labels, counts, areas = label_water(water_map, (COTE, TERRE))
+        >>> areas.max()  # fraction de la planète couverte par le plus grand continent
+    """
+    mask = np.isin(water_map, np.atleast_1d(np.asarray(classes)))
+    labels, n = label_periodic(mask, connectivity)
+    counts, areas = component_stats(labels, n)
+    return labels, counts, areas
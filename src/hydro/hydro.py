@@ -1,31 +1,84 @@
+from typing import Optional, Union
+
 import numpy as np
 
 
+# Classes de la carte de l'eau
+OCEAN = 0
+COTE = 1
+TERRE = 2
+
+# Cellules comparées à la fois (borne le masque booléen réutilisé)
+WATER_CHUNK_CELLS = 1 << 20
+
+
 class Hydrosphere:
 
     def __init__(
         self,
-        niveau_mer: float = 0.0,
+        niveau_mer: Union[float, np.ndarray] = 0.0,
         seuil_côte: float = 0.05
     ):
         self.niveau_mer = niveau_mer
         self.seuil_côte = seuil_côte
 
-    def compute(self, altitude_map: np.ndarray) -> np.ndarray:
+    def compute(
+        self,
+        altitude_map: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        niveau_mer: Union[None, float, np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Classe chaque cellule en océan (0), côte (1) ou terre (2).
+
+        Côte : |altitude - niveau_mer| <= seuil_côte ; océan en dessous,
+        terre au-dessus. Deux comparaisons écrivent directement dans le
+        tampon uint8 de sortie, par blocs de lignes : le seul masque
+        intermédiaire est un tampon booléen d'environ WATER_CHUNK_CELLS
+        cellules, réutilisé d'un bloc à l'autre.
 
-        if altitude_map.ndim != 2:
-            raise ValueError("altitude_map doit être une matrice 2D")
+        Args:
+            altitude_map: Carte 2D (H, W) ou pile 3D (n_planètes, H, W)
+            out: Tampon uint8 de sortie optionnel, de la forme de altitude_map
+            niveau_mer: Niveau de la mer, scalaire ou un par planète (n_planètes,) ;
+                None = self.niveau_mer
 
-        water_map = np.zeros_like(altitude_map, dtype=np.uint8)
+        Returns:
+            np.ndarray: Carte de l'eau (uint8)
+        """
+        if altitude_map.ndim not in (2, 3):
+            raise ValueError("altitude_map doit être une matrice 2D ou une pile 3D (n, H, W)")
 
-        ocean_mask = altitude_map < self.niveau_mer
+        niveau = np.asarray(self.niveau_mer if niveau_mer is None else niveau_mer,
+                            dtype=np.float64)
+        if niveau.ndim == 1:
+            if altitude_map.ndim != 3 or len(niveau) != altitude_map.shape[0]:
+                raise ValueError("Un niveau de mer par planète exige une pile 3D de même longueur")
+            niveau = niveau[:, None, None]
+        elif niveau.ndim != 0:
+            raise ValueError("niveau_mer doit être un scalaire ou un vecteur (n_planètes,)")
 
-        coast_mask = np.abs(altitude_map - self.niveau_mer) <= self.seuil_côte
+        if out is None:
+            water_map = np.empty(altitude_map.shape, dtype=np.uint8)
+        elif out.shape != altitude_map.shape:
+            raise ValueError("out doit avoir la forme de altitude_map")
+        else:
+            water_map = out
 
-        land_mask = altitude_map > self.niveau_mer + self.seuil_côte
+        # Bornes au type de l'altitude : pas de copie float64 de la carte
+        bas = (niveau - self.seuil_côte).astype(altitude_map.dtype)
+        haut = (niveau + self.seuil_côte).astype(altitude_map.dtype)
 
-        water_map[ocean_mask] = 0
-        water_map[coast_mask] = 1
-        water_map[land_mask] = 2
+        height, width = altitude_map.shape[-2:]
+        stack = altitude_map.size // max(height * width, 1)
+        block = max(1, WATER_CHUNK_CELLS // max(width * stack, 1))
+        scratch = np.empty(altitude_map.shape[:-2] + (min(block, height), width), dtype=bool)
+        for r0 in range(0, height, block):
+            rows = slice(r0, min(r0 + block, height))
+            band, water = altitude_map[..., rows, :], water_map[..., rows, :]
+            above = scratch[..., :water.shape[-2], :]
+            np.greater_equal(band, bas, out=water)  # océan 0 / côte 1
+            np.greater(band, haut, out=above)
+            water += above                          # terre 2
 
         return water_map
@@ -0,0 +1,347 @@
+"""
+Hydrologie de surface : remplissage des dépressions, directions d'écoulement
+D8, accumulation du flux, lacs et rivières.
+
+Le remplissage suit l'approche « priority-flood » sur le graphe des bassins
+versants, sans boucle Python par cellule :
+
+1. chaque cellule de terre pointe vers son voisin D8 de plus forte pente
+   (longitude périodique) ; les cellules sans voisin plus bas sont des
+   cuvettes ;
+2. un saut de pointeurs (O(n log n)) rattache chaque cellule à sa cuvette,
+   ce qui découpe la carte en bassins ;
+3. pour chaque paire de bassins voisins, le col le plus bas est
+   max(altitude) minimal sur leur frontière (tri lexicographique) ;
+4. un priority-flood (tas binaire) sur ce petit graphe, depuis l'océan,
+   donne le niveau de débordement de chaque bassin : altitude remplie =
+   max(altitude, niveau du bassin).
+
+L'eau d'une cuvette est transmise à la cellule située de l'autre côté de son
+col ; l'accumulation se calcule ensuite niveau par niveau de profondeur dans
+l'arbre d'écoulement.
+"""
+import heapq
+from typing import Optional
+
+import numpy as np
+
+from .hydro import TERRE
+
+
+# Classes ajoutées à la carte de l'eau de Hydrosphere.compute
+LAC = 3
+RIVIERE = 4
+
+# Directions D8 (décalage ligne, décalage colonne) ; la ligne 0 est au nord
+D8_OFFSETS = np.array([
+    (0, 1), (-1, 1), (-1, 0), (-1, -1),
+    (0, -1), (1, -1), (1, 0), (1, 1)
+])
+D8_NAMES = ('E', 'NE', 'N', 'NW', 'W', 'SW', 'S', 'SE')
+NO_FLOW = 255
+
+# Accumulation minimale d'une rivière, quelle que soit la taille de la carte
+MIN_RIVER_CELLS = 16
+
+# Moitié des directions : chaque paire de voisins n'est vue qu'une fois
+_HALF_OFFSETS = ((0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _shift(grid: np.ndarray, dr: int, dc: int, fill: float) -> np.ndarray:
+    """out[r, c] = grid[r + dr, (c + dc) % W], `fill` hors des pôles."""
+    rolled = np.roll(grid, -dc, axis=1) if dc else grid.copy()
+    if dr > 0:
+        rolled[:-dr] = rolled[dr:]
+        rolled[-dr:] = fill
+    elif dr < 0:
+        rolled[-dr:] = rolled[:dr]
+        rolled[:-dr] = fill
+    return rolled
+
+
+def _jump(pointers: np.ndarray):
+    """
+    Saut de pointeurs : racine de chaque cellule et distance (en pas) à celle-ci.
+
+    Seules les cellules dont l'ancêtre n'est pas encore une racine sont mises
+    à jour ; l'ensemble actif diminue de moitié à chaque itération.
+    """
+    ancestor = pointers.copy()
+    distance = (pointers != np.arange(len(pointers), dtype=pointers.dtype)).astype(pointers.dtype)
+    active = np.flatnonzero(ancestor[ancestor] != ancestor)
+    while active.size:
+        target = ancestor[active]
+        distance[active] += distance[target]
+        ancestor[active] = ancestor[target]
+        target = ancestor[active]
+        active = active[ancestor[target] != target]
+    return ancestor, distance
+
+
+class HydrologyResult:
+    """
+    Résultat de Hydrology.compute (tableaux de la forme de l'altitude).
+
+    Attributes:
+        filled: Altitude après remplissage des dépressions
+        flow_direction: Code D8 (indice dans D8_OFFSETS) vers l'aval, NO_FLOW pour
+            l'océan et les cuvettes
+        receivers: Indice aplati de la cellule aval ; une cuvette pointe vers la
+            cellule située au-delà de son col, l'océan vers lui-même
+        accumulation: Nombre de cellules drainées (la cellule elle-même comprise)
+        lakes: Masque des cellules de terre submergées par le remplissage
+        rivers: Masque des cellules de terre hors lacs dont l'accumulation
+            dépasse le seuil
+    """
+
+    def __init__(self, filled, flow_direction, receivers, accumulation, lakes, rivers):
+        self.filled = filled
+        self.flow_direction = flow_direction
+        self.receivers = receivers
+        self.accumulation = accumulation
+        self.lakes = lakes
+        self.rivers = rivers
+
+
+class Hydrology:
+    """
+    Lacs et rivières d'une carte d'altitude équirectangulaire.
+
+    Args:
+        niveau_mer (float): Les cellules en dessous sont l'océan, exutoire de l'eau
+        seuil_rivière (float): Fraction des cellules de la carte qu'une cellule doit
+            drainer pour devenir une rivière (par défaut: 1e-4), et au moins
+            MIN_RIVER_CELLS cellules
+
+    Example:
+        >>> hydrology = Hydrology(niveau_mer=0.45)
+        >>> result = hydrology.compute(altitude)
+        >>> water_map = Hydrosphere(0.45).compute(altitude)
+        >>> hydrology.apply(water_map, result)  # ajoute LAC et RIVIERE
+    """
+
+    def __init__(self, niveau_mer: float = 0.0, seuil_rivière: float = 1e-4):
+        if not 0 < seuil_rivière <= 1:
+            raise ValueError(f"seuil_rivière doit être dans ]0, 1] (reçu: {seuil_rivière})")
+        self.niveau_mer = niveau_mer
+        self.seuil_rivière = seuil_rivière
+
+    def compute(self, altitude_map: np.ndarray) -> HydrologyResult:
+        """
+        Remplit les dépressions et calcule écoulement, accumulation, lacs et rivières.
+
+        Args:
+            altitude_map: Carte 2D (H, W), longitude périodique
+
+        Returns:
+            HydrologyResult: Couches hydrologiques
+        """
+        if altitude_map.ndim != 2:
+            raise ValueError("altitude_map doit être une matrice 2D")
+
+        height, width = altitude_map.shape
+        n = height * width
+        index_dtype = np.int32 if n < 2**31 else np.int64
+        elevation = np.asarray(altitude_map)
+
+        outlet = elevation < self.niveau_mer
+        if not outlet.any():
+            # Pas d'océan : le point le plus bas sert d'exutoire
+            outlet.flat[np.argmin(elevation)] = True
+
+        direction = self._steepest_descent(elevation, outlet)
+        receivers = self._receivers(direction, index_dtype)
+
+        basin, pits = self._basins(receivers, outlet, index_dtype)
+        u, v, spill_level = self._spill_edges(elevation, basin, index_dtype)
+        level, spill_from, spill_to = self._flood_basins(len(pits) + 1, basin, u, v, spill_level)
+
+        filled = np.maximum(elevation, level[basin].reshape(height, width).astype(elevation.dtype))
+        land = ~outlet
+        lakes = (filled > elevation) & land
+
+        # Les cuvettes se déversent par leur col dans le bassin aval
+        routed = receivers.copy()
+        routed[pits] = spill_to[1:]
+        accumulation = self._accumulate(routed, index_dtype).reshape(height, width)
+
+        # Arrondi vers le haut et plancher : sur une petite carte, seuil * n
+        # tomberait à 0 et toute la terre deviendrait rivière
+        threshold = max(MIN_RIVER_CELLS, int(np.ceil(self.seuil_rivière * n)))
+        rivers = (accumulation >= threshold) & land & ~lakes
+
+        return HydrologyResult(
+            filled=filled,
+            flow_direction=direction,
+            receivers=routed.reshape(height, width),
+            accumulation=accumulation,
+            lakes=lakes,
+            rivers=rivers,
+        )
+
+    def apply(self, water_map: np.ndarray, result: HydrologyResult) -> np.ndarray:
+        """
+        Ajoute les lacs (LAC) et rivières (RIVIERE) aux terres d'une carte de l'eau.
+
+        Args:
+            water_map: Carte de Hydrosphere.compute, modifiée en place
+            result: Résultat de compute() sur la même altitude
+
+        Returns:
+            np.ndarray: water_map
+        """
+        land = water_map == TERRE
+        water_map[result.lakes & land] = LAC
+        water_map[result.rivers & land] = RIVIERE
+        return water_map
+
+    @staticmethod
+    def _steepest_descent(elevation: np.ndarray, outlet: np.ndarray) -> np.ndarray:
+        """Code D8 de la plus forte pente descendante (NO_FLOW si aucune)."""
+        height, width = elevation.shape
+        # Distances entre centres de cellules, longitude réduite par cos(latitude)
+        lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+        dx = (2 * np.pi / width) * np.cos(lat)[:, None]
+        dy = np.pi / height
+
+        best = np.zeros(elevation.shape, dtype=np.float32)
+        direction = np.full(elevation.shape, NO_FLOW, dtype=np.uint8)
+        for code, (dr, dc) in enumerate(D8_OFFSETS):
+            slope = _shift(elevation, dr, dc, np.inf).astype(np.float32, copy=False)
+            np.subtract(elevation, slope, out=slope)
+            slope /= np.hypot(dx * dc, dy * dr).astype(np.float32)
+            steeper = slope > best
+            np.copyto(best, slope, where=steeper)
+            np.copyto(direction, code, where=steeper)
+        direction[outlet] = NO_FLOW
+        return direction
+
+    @staticmethod
+    def _receivers(direction: np.ndarray, index_dtype) -> np.ndarray:
+        """Indice aplati du voisin aval (la cellule elle-même sans écoulement)."""
+        height, width = direction.shape
+        rows = np.arange(height, dtype=index_dtype)[:, None]
+        cols = np.arange(width, dtype=index_dtype)[None, :]
+        flows = direction != NO_FLOW
+        code = np.where(flows, direction, 0)
+        dr = D8_OFFSETS[:, 0].astype(index_dtype)[code]
+        dc = D8_OFFSETS[:, 1].astype(index_dtype)[code]
+        target = (rows + dr) * width + (cols + dc) % width
+        own = rows * width + cols
+        return np.where(flows, target, own).ravel()
+
+    @staticmethod
+    def _basins(receivers: np.ndarray, outlet: np.ndarray, index_dtype):
+        """Bassin de chaque cellule (0 = océan) et cuvettes de terre (bassins 1..B)."""
+        root, _ = _jump(receivers)
+
+        cells = np.arange(len(receivers), dtype=index_dtype)
+        pits = np.flatnonzero((receivers == cells) & ~outlet.ravel()).astype(index_dtype)
+        label = np.zeros(len(receivers), dtype=index_dtype)
+        label[pits] = np.arange(1, len(pits) + 1, dtype=index_dtype)
+        return label[root], pits
+
+    @staticmethod
+    def _spill_edges(elevation: np.ndarray, basin: np.ndarray, index_dtype):
+        """Col le plus bas (cellules u, v et niveau) entre chaque paire de bassins voisins."""
+        height, width = elevation.shape
+        basin_grid = basin.reshape(height, width)
+        flat = elevation.ravel()
+        us, vs, levels = [], [], []
+        for dr, dc in _HALF_OFFSETS:
+            neighbour = np.roll(basin_grid, -dc, axis=1) if dc else basin_grid
+            rows, cols = np.nonzero(basin_grid[:height - dr] != neighbour[dr:])
+            u = (rows * width + cols).astype(index_dtype)
+            v = ((rows + dr) * width + (cols + dc) % width).astype(index_dtype)
+            us.append(u)
+            vs.append(v)
+            levels.append(np.maximum(flat[u], flat[v]))
+        u = np.concatenate(us)
+        v = np.concatenate(vs)
+        level = np.concatenate(levels)
+
+        if len(u) == 0:
+            return u, v, level
+
+        # Une seule arête (la plus basse) par paire non ordonnée de bassins
+        bu, bv = basin[u].astype(np.int64), basin[v].astype(np.int64)
+        pair = np.minimum(bu, bv) * (int(basin.max()) + 1) + np.maximum(bu, bv)
+        order = np.argsort(pair)
+        pair, u, v, level = pair[order], u[order], v[order], level[order]
+        first = np.r_[True, pair[1:] != pair[:-1]]
+        group = np.cumsum(first) - 1
+        lowest = np.minimum.reduceat(level, np.flatnonzero(first))
+        candidates = np.flatnonzero(level == lowest[group])
+        keep = candidates[np.r_[True, group[candidates][1:] != group[candidates][:-1]]]
+        return u[keep], v[keep], level[keep]
+
+    @staticmethod
+    def _flood_basins(n_basins: int, basin: np.ndarray, u, v, spill_level):
+        """
+        Priority-flood sur le graphe des bassins depuis l'océan (bassin 0).
+
+        Returns:
+            (niveau, depuis, vers): niveau de débordement de chaque bassin et,
+            pour chaque bassin, les cellules de part et d'autre de son col
+        """
+        bu, bv = basin[u], basin[v]
+        # Listes d'adjacence (CSR) dans les deux sens
+        src = np.concatenate([bu, bv])
+        dst = np.concatenate([bv, bu])
+        cell_src = np.concatenate([u, v])
+        cell_dst = np.concatenate([v, u])
+        weight = np.concatenate([spill_level, spill_level])
+        order = np.argsort(src, kind="stable")
+        src, dst = src[order], dst[order]
+        cell_src, cell_dst, weight = cell_src[order], cell_dst[order], weight[order]
+        start = np.searchsorted(src, np.arange(n_basins + 1)).tolist()
+        dst_l, weight_l = dst.tolist(), weight.tolist()
+
+        level = [-np.inf] * n_basins
+        via = [-1] * n_basins  # arête par laquelle le bassin a été inondé
+        best = [np.inf] * n_basins  # meilleur niveau déjà proposé
+        done = bytearray(n_basins)
+        heap = [(-np.inf, 0, -1)]
+        while heap:
+            current, b, edge = heapq.heappop(heap)
+            if done[b]:
+                continue
+            done[b] = 1
+            level[b] = current
+            via[b] = edge
+            for e in range(start[b], start[b + 1]):
+                nb = dst_l[e]
+                if not done[nb]:
+                    w = weight_l[e]
+                    if w < current:
+                        w = current
+                    if w < best[nb]:
+                        best[nb] = w
+                        heapq.heappush(heap, (w, nb, e))
+
+        # L'eau de chaque bassin quitte son col vers le bassin déjà inondé
+        via = np.array(via)
+        flooded = via >= 0
+        spill_from = np.full(n_basins, -1, dtype=np.int64)
+        spill_to = np.full(n_basins, -1, dtype=np.int64)
+        spill_from[flooded] = cell_dst[via[flooded]]
+        spill_to[flooded] = cell_src[via[flooded]]
+        return np.array(level), spill_from, spill_to
+
+    @staticmethod
+    def _accumulate(receivers: np.ndarray, index_dtype) -> np.ndarray:
+        """Nombre de cellules drainées, cumulé de l'amont vers l'aval."""
+        n = len(receivers)
+        _, depth = _jump(receivers)
+        max_depth = int(depth.max())
+        if max_depth < 2**15:
+            depth = depth.astype(np.int16)  # tri par base (radix), linéaire
+
+        accumulation = np.ones(n, dtype=index_dtype)
+        order = np.argsort(depth, kind="stable")
+        bounds = np.r_[0, np.cumsum(np.bincount(depth, minlength=max_depth + 1))]
+        # Des cellules les plus éloignées de l'exutoire vers l'aval
+        for d in range(max_depth, 0, -1):
+            nodes = order[bounds[d]:bounds[d + 1]]
+            np.add.at(accumulation, receivers[nodes], accumulation[nodes])
+        return accumulation
@@ -0,0 +1,12 @@
+"""
+Module des outils de rendu des calques (palettes, textures, maillages, caches).
+"""
+
+from .cache import RenderCache
+from .mesh import DEFAULT_LODS, relief_lods, relief_sphere, uv_sphere
+from .palette import BIOME_COLORS, as_rgb, colorize
+
+__all__ = [
+    'BIOME_COLORS', 'DEFAULT_LODS', 'RenderCache', 'as_rgb', 'colorize', 'relief_lods',
+    'relief_sphere', 'uv_sphere'
+]
@@ -0,0 +1,89 @@
+"""
+Cache LRU en mémoire des objets de rendu (meshes, textures), limité en taille.
+
+Un objet est compté à la taille que renvoie la fonction `size` fournie ;
+les moins récemment utilisés sont évincés dès que le total dépasse
+`max_bytes`. Les objets mis en cache sont partagés entre les rendus : ils
+ne doivent pas être modifiés en place.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class RenderCache:
+    """
+    Cache LRU d'objets construits à la demande.
+
+    Args:
+        max_bytes (int): Taille maximale du cache en octets
+        size (callable): Taille en octets d'un objet du cache
+
+    Example:
+        >>> meshes = RenderCache(256 * 2**20, size=lambda mesh: mesh.actual_memory_size * 1024)
+        >>> sphere = meshes.get_or_create((1.0, 256, 128), lambda: pv.Sphere())
+    """
+
+    def __init__(self, max_bytes: int, size: Callable[[Any], int]):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes doit être positif (reçu: {max_bytes})")
+        self.max_bytes = max_bytes
+        self.size = size
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # clé -> (objet, taille), du plus ancien au plus récent
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Objet associé à la clé (marqué récemment utilisé), ou None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Ajoute un objet puis évince les plus anciens au-delà de max_bytes.
+
+        Un objet plus grand que max_bytes n'est pas conservé.
+        """
+        nbytes = int(self.size(value))
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Renvoie l'objet en cache, ou le construit avec create() et le conserve.
+
+        Args:
+            key: Clé hachable décrivant entièrement l'objet
+            create: Construction de l'objet en cas d'absence
+
+        Returns:
+            L'objet en cache ou nouvellement construit
+        """
+        value = self.get(key)
+        if value is None:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        self._entries.clear()
+        self.nbytes = 0
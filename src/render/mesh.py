@@ -0,0 +1,196 @@
+"""
+Maillage d'une planète déplacé par le relief, avec niveaux de détail (LOD).
+
+Les sommets forment une grille (latitude, longitude) : chaque sommet est
+poussé radialement selon l'altitude échantillonnée (bilinéaire) en une seule
+opération sur le tableau des points. La colonne de la couture 0°/360° est
+dupliquée pour que les coordonnées de texture aillent de 0 à 1, comme sur
+une texture équirectangulaire.
+
+Pour un niveau grossier, la carte est d'abord moyennée par blocs jusqu'à
+environ deux pixels par sommet : un relief 8K n'est jamais échantillonné
+directement par un maillage de quelques centaines de sommets (crénelage).
+Ce module ne dépend que de NumPy ; les tableaux produits se passent tels
+quels à pv.PolyData.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+# Résolutions (theta, phi) par défaut, du plus fin au plus grossier : chaque
+# niveau divise par deux l'écart entre sommets (voir LOD_DISTANCES dans
+# visualize_planet_3d)
+DEFAULT_LODS = ((1024, 512), (512, 256), (256, 128), (128, 64))
+
+
+def downsample(altitude: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Moyenne par blocs factor x factor (les lignes et colonnes en trop sont ignorées).
+
+    Args:
+        altitude: Carte (H, W)
+        factor: Taille des blocs (1 = aucune réduction)
+
+    Returns:
+        np.ndarray: Carte float32 (H // factor, W // factor)
+    """
+    if factor <= 1:
+        return altitude
+    height, width = (altitude.shape[0] // factor) * factor, (altitude.shape[1] // factor) * factor
+    blocks = altitude[:height, :width].reshape(height // factor, factor, width // factor, factor)
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+def sample(altitude: np.ndarray, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Altitude bilinéaire aux latitudes (lignes) et longitudes (colonnes) données.
+
+    Args:
+        altitude: Carte équirectangulaire (H, W), ligne 0 au pôle nord
+        lat: Latitudes (P,) en radians
+        lon: Longitudes (T,) en radians dans [0, 2π]
+
+    Returns:
+        np.ndarray: Altitude float32 (P, T) ; la longitude boucle
+    """
+    height, width = altitude.shape
+    # Centres des pixels : ligne i à π(0.5 - (i + 0.5) / H), colonne j à 2π(j + 0.5) / W
+    y = np.clip((0.5 - lat / np.pi) * height - 0.5, 0, height - 1)
+    x = (lon / (2 * np.pi)) * width - 0.5
+    y0 = np.minimum(y.astype(np.intp), height - 2) if height > 1 else np.zeros(len(y), np.intp)
+    x0 = np.floor(x).astype(np.intp)
+    fy = (y - y0).astype(np.float32)[:, None]
+    fx = (x - x0).astype(np.float32)[None, :]
+    y1 = np.minimum(y0 + 1, height - 1)
+    x0, x1 = x0 % width, (x0 + 1) % width
+
+    top = altitude[y0[:, None], x0] * (1 - fx) + altitude[y0[:, None], x1] * fx
+    bottom = altitude[y1[:, None], x0] * (1 - fx) + altitude[y1[:, None], x1] * fx
+    return (top * (1 - fy) + bottom * fy).astype(np.float32)
+
+
+def relief_sphere(
+    altitude: Optional[np.ndarray],
+    theta_resolution: int,
+    phi_resolution: int,
+    radius: float = 1.0,
+    exaggeration: float = 0.05,
+    sea_level: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construit une sphère dont chaque sommet est déplacé par l'altitude.
+
+    Le rayon d'un sommet vaut radius * (1 + exaggeration * (h - base)), avec
+    h l'altitude (plafonnée par le bas à sea_level si fourni : océans plats)
+    et base = sea_level (ou 0).
+
+    Args:
+        altitude: Carte équirectangulaire (H, W) dans [0, 1] (None = sphère lisse)
+        theta_resolution: Nombre de méridiens (longitude)
+        phi_resolution: Nombre de bandes de latitude
+        radius: Rayon de la planète
+        exaggeration: Amplitude du relief en fraction du rayon par unité d'altitude
+        sea_level: Niveau de la mer (None = pas de plafond)
+
+    Returns:
+        (points, faces, tcoords): Points float32 (N, 3) avec z vers le pôle nord,
+        faces au format VTK (3, i, j, k, 3, ...) et coordonnées de texture (N, 2)
+
+    Example:
+        >>> points, faces, tcoords = relief_sphere(altitude, 1024, 512, exaggeration=0.08)
+        >>> mesh = visualize_planet_3d.textured_mesh(points, faces, tcoords)
+    """
+    if theta_resolution < 3 or phi_resolution < 2:
+        raise ValueError(
+            f"Résolution trop faible: ({theta_resolution}, {phi_resolution}). Minimum: (3, 2)"
+        )
+    lat = np.linspace(np.pi / 2, -np.pi / 2, phi_resolution + 1)
+    lon = np.linspace(0, 2 * np.pi, theta_resolution + 1)
+
+    scale = np.full((phi_resolution + 1, theta_resolution + 1), radius, dtype=np.float32)
+    if altitude is not None:
+        # Environ deux pixels de la carte par sommet avant l'échantillonnage
+        factor = max(1, altitude.shape[0] // (2 * phi_resolution))
+        height = sample(downsample(altitude, factor), lat, lon)
+        base = 0.0 if sea_level is None else sea_level
+        if sea_level is not None:
+            np.maximum(height, np.float32(sea_level), out=height)
+        height -= np.float32(base)
+        height *= np.float32(radius * exaggeration)
+        scale += height
+        scale[:, -1] = scale[:, 0]  # couture : mêmes positions des deux côtés
+        # Tous les sommets d'un pôle sont au même point : un seul rayon, sinon
+        # les triangles du pôle laissent des fentes entre eux
+        scale[0] = scale[0].mean()
+        scale[-1] = scale[-1].mean()
+
+    ring = np.cos(lat).astype(np.float32)[:, None] * scale
+    points = np.empty(scale.shape + (3,), dtype=np.float32)
+    points[..., 0] = ring * np.cos(lon).astype(np.float32)
+    points[..., 1] = ring * np.sin(lon).astype(np.float32)
+    points[..., 2] = np.sin(lat).astype(np.float32)[:, None] * scale
+
+    tcoords = np.empty(scale.shape + (2,), dtype=np.float32)
+    tcoords[..., 0] = (lon / (2 * np.pi))[None, :]
+    tcoords[..., 1] = (lat / np.pi + 0.5)[:, None]
+
+    # Deux triangles par quadrilatère, orientés vers l'extérieur ; les
+    # triangles dégénérés des pôles sont retirés
+    index = np.arange(scale.size).reshape(scale.shape)
+    a, b = index[:-1, :-1], index[:-1, 1:]
+    d, c = index[1:, :-1], index[1:, 1:]
+    upper = np.stack([a, d, b], axis=-1)[1:]
+    lower = np.stack([b, d, c], axis=-1)[:-1]
+    triangles = np.concatenate([upper.reshape(-1, 3), lower.reshape(-1, 3)])
+    faces = np.empty((len(triangles), 4), dtype=np.int64)
+    faces[:, 0] = 3
+    faces[:, 1:] = triangles
+    return points.reshape(-1, 3), faces.ravel(), tcoords.reshape(-1, 2)
+
+
+def uv_sphere(
+    theta_resolution: int,
+    phi_resolution: int,
+    radius: float = 1.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construit une sphère lisse avec des coordonnées de texture équirectangulaires.
+
+    Args:
+        theta_resolution: Nombre de méridiens (longitude)
+        phi_resolution: Nombre de bandes de latitude
+        radius: Rayon de la sphère
+
+    Returns:
+        (points, faces, tcoords): Voir relief_sphere()
+
+    Example:
+        >>> points, faces, tcoords = uv_sphere(256, 128)
+        >>> mesh = visualize_planet_3d.textured_mesh(points, faces, tcoords)
+    """
+    return relief_sphere(None, theta_resolution, phi_resolution, radius)
+
+
+def relief_lods(
+    altitude: Optional[np.ndarray],
+    resolutions=DEFAULT_LODS,
+    radius: float = 1.0,
+    exaggeration: float = 0.05,
+    sea_level: Optional[float] = None
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Maillages déplacés de chaque niveau de détail, du plus fin au plus grossier.
+
+    Args:
+        altitude: Carte (H, W) ; elle est réduite une fois par niveau
+        resolutions: Résolutions (theta, phi) de chaque niveau
+        radius, exaggeration, sea_level: Voir relief_sphere()
+
+    Returns:
+        list: (points, faces, tcoords) de chaque niveau
+    """
+    return [
+        relief_sphere(altitude, theta, phi, radius, exaggeration, sea_level)
+        for theta, phi in resolutions
+    ]
@@ -0,0 +1,74 @@
+"""
+Palette des biomes et conversion des calques en images RGB en mémoire.
+
+Le rendu 3D (visualize_planet_3d.PlanetRenderer) construit sa texture
+directement depuis ces tableaux, sans écrire puis relire un PNG ou un JPEG.
+Ce module ne dépend que de NumPy.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+# Une couleur par biome, dans l'ordre de BiomeDeterminer.biomes
+BIOME_COLORS = np.array([
+    [0, 51, 255], [200, 200, 200], [240, 240, 240], [170, 220, 170],
+    [34, 102, 34], [68, 136, 68], [220, 170, 68], [0, 136, 0], [255, 221, 136]
+], dtype=np.uint8)
+
+
+def colorize(
+    class_map: np.ndarray,
+    palette: np.ndarray = BIOME_COLORS,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Image RGB d'une carte de classes, par une seule indexation de la palette.
+
+    Les classes au-delà de la palette bouclent (classe % len(palette)).
+
+    Args:
+        class_map: Classes entières (H, W)
+        palette: Couleurs (n, 3) ou (n, 4) en uint8 (par défaut: BIOME_COLORS)
+        out: Tableau uint8 (H, W, canaux) de sortie optionnel
+
+    Returns:
+        np.ndarray: Image uint8 (H, W, canaux)
+
+    Example:
+        >>> image = colorize(graph.get('biomes'))
+        >>> PlanetRenderer(texture=image).render()
+    """
+    palette = np.asarray(palette, dtype=np.uint8)
+    if palette.ndim != 2 or palette.shape[1] not in (3, 4):
+        raise ValueError(f"palette doit être de forme (n, 3) ou (n, 4) (reçu: {palette.shape})")
+    return np.take(palette, class_map, axis=0, mode='wrap', out=out)
+
+
+def as_rgb(image: np.ndarray, palette: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalise un calque en image uint8 contiguë (H, W, 3 ou 4) pour une texture.
+
+    Args:
+        image: Carte de classes entières (H, W), colorisée avec la palette,
+            ou image RGB(A) (H, W, 3|4) en uint8, ou en flottants dans [0, 1]
+        palette: Palette des classes (None = BIOME_COLORS)
+
+    Returns:
+        np.ndarray: Image uint8 C-contiguë (sans copie si elle l'est déjà)
+
+    Raises:
+        ValueError: Si la forme ou le type de l'image ne convient pas
+    """
+    image = np.asarray(image)
+    if image.ndim == 2:
+        if not np.issubdtype(image.dtype, np.integer):
+            raise ValueError(f"Une carte 2D doit contenir des classes entières (reçu: {image.dtype})")
+        return colorize(image, BIOME_COLORS if palette is None else palette)
+    if image.ndim != 3 or image.shape[2] not in (3, 4):
+        raise ValueError(f"L'image doit être de forme (H, W, 3) ou (H, W, 4) (reçu: {image.shape})")
+    if np.issubdtype(image.dtype, np.floating):
+        image = np.clip(image * 255 + 0.5, 0, 255).astype(np.uint8)
+    elif image.dtype != np.uint8:
+        raise ValueError(f"Une image RGB doit être en uint8 ou en flottants (reçu: {image.dtype})")
+    return np.ascontiguousarray(image)
@@ -0,0 +1,19 @@
+"""
+Module des calques de surface d'une planète.
+"""
+
+from .cache import LayerCache
+from .graph import LayerGraph, LayerNode
+from .layers import LAYER_DTYPES, PlanetLayers
+from .pipeline import PLANET_LAYERS, build_planet_graph, cached_planet_layers
+from .series import LayerSeries
+from .statistics import band_fractions, class_fractions, planet_statistics, row_counts
+from .streaming import StreamingPipeline, iter_bands
+from .sweep import ParameterSweep
+
+__all__ = [
+    'LAYER_DTYPES', 'LayerCache', 'LayerGraph', 'LayerNode', 'LayerSeries', 'PLANET_LAYERS',
+    'ParameterSweep', 'PlanetLayers', 'StreamingPipeline', 'band_fractions',
+    'build_planet_graph', 'cached_planet_layers', 'class_fractions', 'iter_bands',
+    'planet_statistics', 'row_counts'
+]
@@ -0,0 +1,186 @@
+"""
+Cache disque des calques de planète, adressé par contenu.
+
+La clé est le hachage des paramètres du générateur (bruit, graine, échelle,
+dimensions, exoplanète...) et de la version du code. Chaque entrée est un
+dossier de fichiers .npy relus en mémoire mappée : un accès réussi ne copie
+aucune donnée. Les entrées les moins récemment utilisées sont supprimées
+quand la taille totale dépasse la limite.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+
+SRC_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules dont le code détermine le contenu des calques
+CODE_MODULES = (
+    "heightmap/noise.py",
+    "heightmap/tiled.py",
+    "heightmap/erosion.py",
+    "heightmap/spectral.py",
+    "atmosphere/advection.py",
+    "biome/biomes.py",
+    "biome/whittaker.py",
+    "climate/ebm.py",
+    "climate/insolation.py",
+    "grid/cubed_sphere.py",
+    "hydro/hydro.py",
+    "hydro/coast.py",
+    "hydro/hydrology.py",
+    "surface/pipeline.py",
+)
+
+_code_version = None
+
+
+def code_version() -> str:
+    """Hachage du code source des modules de génération (calculé une fois)."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for module in CODE_MODULES:
+            path = SRC_ROOT / module
+            if path.exists():
+                digest.update(module.encode("utf-8"))
+                digest.update(path.read_bytes())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+class LayerCache:
+    """
+    Cache LRU de calques sur disque, limité en taille.
+
+    Args:
+        root (str): Dossier du cache (par défaut: 'data/cache')
+        max_bytes (int): Taille maximale du cache en octets (par défaut: 4 Gio)
+
+    Example:
+        >>> cache = LayerCache('data/cache', max_bytes=2 * 1024**3)
+        >>> key = cache.key({'seed': 42, 'width': 1024, 'height': 512})
+        >>> layers = cache.load(key)  # None si absent
+    """
+
+    def __init__(self, root: str = "data/cache", max_bytes: int = 4 * 1024**3):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes doit être positif (reçu: {max_bytes})")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def key(self, params: Mapping[str, Any]) -> str:
+        """
+        Calcule la clé d'un jeu de paramètres.
+
+        Args:
+            params: Paramètres sérialisables en JSON (les valeurs inconnues passent par str)
+
+        Returns:
+            str: Empreinte hexadécimale incluant la version du code
+        """
+        payload = json.dumps(
+            {"params": params, "code": code_version()},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def load(self, key: str) -> Optional[Dict[str, np.memmap]]:
+        """
+        Relit une entrée en mémoire mappée (lecture seule).
+
+        Returns:
+            dict | None: Calques par nom, ou None si la clé est absente
+        """
+        entry = self._entry(key)
+        if not entry.is_dir():
+            return None
+        layers = {
+            path.stem: np.load(path, mmap_mode="r")
+            for path in sorted(entry.glob("*.npy"))
+        }
+        os.utime(entry)  # marque l'entrée comme récemment utilisée
+        return layers
+
+    def store(self, key: str, layers: Mapping[str, np.ndarray]) -> Dict[str, np.memmap]:
+        """
+        Écrit une entrée puis la relit en mémoire mappée.
+
+        L'écriture se fait dans un dossier temporaire renommé ensuite : un
+        autre processus ne voit jamais d'entrée partielle.
+
+        Args:
+            key: Clé calculée par key()
+            layers: Calques par nom
+
+        Returns:
+            dict: Calques relus depuis le cache
+        """
+        entry = self._entry(key)
+        if not entry.is_dir():
+            tmp = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.root))
+            try:
+                for name, layer in layers.items():
+                    np.save(tmp / f"{name}.npy", np.ascontiguousarray(layer))
+                os.rename(tmp, entry)
+            except OSError:
+                # Un autre processus a créé l'entrée entre-temps
+                if not entry.is_dir():
+                    raise
+            finally:
+                if tmp.exists():
+                    shutil.rmtree(tmp, ignore_errors=True)
+            self.evict(keep=key)
+        return self.load(key)
+
+    def get_or_create(
+        self,
+        params: Mapping[str, Any],
+        factory: Callable[[], Mapping[str, np.ndarray]]
+    ) -> Dict[str, np.memmap]:
+        """Renvoie les calques en cache, ou les génère avec factory() et les stocke."""
+        key = self.key(params)
+        layers = self.load(key)
+        if layers is None:
+            layers = self.store(key, factory())
+        return layers
+
+    def size(self) -> int:
+        """Taille totale des entrées en octets."""
+        return sum(self._entry_size(entry) for entry in self._entries())
+
+    def _entries(self):
+        return [p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith(".")]
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Supprime les entrées les moins récemment utilisées au-delà de max_bytes.
+
+        Args:
+            keep: Clé à ne jamais supprimer (entrée qui vient d'être écrite)
+        """
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        sizes = {entry: self._entry_size(entry) for entry in entries}
+        total = sum(sizes.values())
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            # Les mémoires mappées déjà ouvertes restent valides (POSIX)
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
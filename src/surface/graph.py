@@ -0,0 +1,124 @@
+"""
+Graphe de dépendances entre calques, avec recalcul incrémental.
+
+Chaque nœud déclare ses calques d'entrée et les paramètres qu'il lit. Sa
+clé est le hachage de ces paramètres et des clés de ses entrées : modifier
+un paramètre ne recalcule que les nœuds situés en aval.
+"""
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class LayerNode:
+    """
+    Nœud du graphe : un calque calculé à partir d'autres calques.
+
+    Args:
+        name (str): Nom du calque produit
+        func (callable): func(*entrées, **paramètres) -> np.ndarray
+        inputs (sequence): Noms des calques d'entrée, dans l'ordre des arguments
+        params (sequence): Noms des paramètres du graphe transmis à func
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., np.ndarray],
+        inputs: Sequence[str] = (),
+        params: Sequence[str] = ()
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = tuple(params)
+
+
+class LayerGraph:
+    """
+    Graphe de calques avec mise en cache par hachage des paramètres.
+
+    Example:
+        >>> graph = LayerGraph(sea_level=0.45)
+        >>> graph.add('altitude', make_altitude)
+        >>> graph.add('humidity', humidity, inputs=['altitude'], params=['sea_level'])
+        >>> graph.get('humidity')
+        >>> graph.set(sea_level=0.5)  # seule l'humidité sera recalculée
+        >>> graph.get('humidity')
+    """
+
+    def __init__(self, **params: Any):
+        self.params: Dict[str, Any] = dict(params)
+        self.nodes: Dict[str, LayerNode] = {}
+        self._cache: Dict[str, tuple] = {}  # nom -> (clé, calque)
+        self.computed: List[str] = []  # nœuds recalculés lors du dernier get()
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., np.ndarray],
+        inputs: Sequence[str] = (),
+        params: Sequence[str] = ()
+    ) -> None:
+        """
+        Ajoute un nœud ; ses entrées doivent déjà exister dans le graphe.
+
+        Raises:
+            ValueError: Si le nom existe déjà ou si une entrée est inconnue
+        """
+        if name in self.nodes:
+            raise ValueError(f"Calque déjà défini: {name}")
+        missing = [i for i in inputs if i not in self.nodes]
+        if missing:
+            raise ValueError(f"Entrées inconnues pour {name}: {missing}")
+        self.nodes[name] = LayerNode(name, func, inputs, params)
+
+    def set(self, **params: Any) -> None:
+        """Met à jour des paramètres ; les calques concernés sont invalidés par leur clé."""
+        self.params.update(params)
+
+    def key(self, name: str) -> str:
+        """Clé du calque : hachage de ses paramètres et des clés de ses entrées."""
+        node = self.nodes[name]
+        try:
+            values = [(p, self.params[p]) for p in node.params]
+        except KeyError as e:
+            raise KeyError(f"Paramètre manquant pour {name}: {e.args[0]}")
+        payload = repr((name, values, [self.key(i) for i in node.inputs]))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(self, name: str) -> np.ndarray:
+        """
+        Renvoie un calque, en ne recalculant que ce dont la clé a changé.
+
+        Args:
+            name: Nom du calque
+
+        Returns:
+            np.ndarray: Calque à jour
+        """
+        self.computed = []
+        return self._get(name)
+
+    def _get(self, name: str) -> np.ndarray:
+        if name not in self.nodes:
+            raise KeyError(f"Calque inconnu: {name}")
+        node = self.nodes[name]
+        key = self.key(name)
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        inputs = [self._get(i) for i in node.inputs]
+        layer = node.func(*inputs, **{p: self.params[p] for p in node.params})
+        self._cache[name] = (key, layer)
+        self.computed.append(name)
+        return layer
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Vide le cache d'un calque (ou de tous si name vaut None)."""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
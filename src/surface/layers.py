@@ -0,0 +1,56 @@
+"""
+Conteneur des calques d'une planète, préalloués une seule fois.
+
+Chaque étape du pipeline écrit en place dans son calque via le paramètre
+`out=`, avec des types compacts : float32 pour les champs continus et uint8
+pour les classes (biomes, hydrosphère).
+"""
+from typing import Dict
+
+import numpy as np
+
+
+LAYER_DTYPES = {
+    "altitude": np.float32,
+    "temperature": np.float32,
+    "humidity": np.float32,
+    "coast_distance": np.float32,
+    "biomes": np.uint8,
+    "water": np.uint8,
+}
+
+
+class PlanetLayers:
+    """
+    Calques (hauteur x largeur) d'une planète générée.
+
+    Les tableaux sont créés avec np.empty : la mémoire n'est réellement
+    engagée qu'au moment où une étape y écrit.
+
+    Args:
+        width (int): Largeur des calques en pixels (longitude)
+        height (int): Hauteur des calques en pixels (latitude)
+
+    Example:
+        >>> layers = PlanetLayers(1024, 512)
+        >>> determiner.generate_altitude(out=layers.altitude)
+        >>> Hydrosphere().compute(layers.altitude, out=layers.water)
+    """
+
+    def __init__(self, width: int, height: int):
+        if width < 1 or height < 1:
+            raise ValueError(f"Dimensions invalides: ({width}, {height})")
+
+        self.width = width
+        self.height = height
+        for name, dtype in LAYER_DTYPES.items():
+            setattr(self, name, np.empty((height, width), dtype=dtype))
+
+    @property
+    def nbytes(self) -> int:
+        """Taille totale des calques en octets."""
+        return sum(layer.nbytes for layer in self.as_dict().values())
+
+    def as_dict(self) -> Dict[str, np.ndarray]:
+        """Renvoie les calques par nom."""
+        return {name: getattr(self, name) for name in LAYER_DTYPES}
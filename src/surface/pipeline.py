@@ -0,0 +1,227 @@
+"""
+Pipeline de génération d'une planète sous forme de graphe de calques.
+
+    relief (, erosion) → altitude → water (hydrosphère) → coast_distance
+    altitude (, climate) → temperature
+    altitude, coast_distance (ou water, temperature si atmosphere) → humidity
+    temperature, humidity, altitude → biomes
+
+Sur une grille cubique (BiomeDeterminer(grid=...)), les étapes écrites pour
+la carte équirectangulaire passent par une carte (2 n, 4 n) : la distance à
+la côte y est calculée puis relue à chaque cellule, et le climat y est un
+profil par latitude. L'érosion, l'atmosphère et la rotation synchrone n'ont
+pas d'équivalent sur la grille et sont refusées.
+"""
+from typing import Any, Dict
+
+import numpy as np
+
+from atmosphere.advection import MoistureTransport
+from climate.ebm import EnergyBalanceModel
+from heightmap.erosion import Erosion
+from hydro.coast import coast_distance
+from hydro.hydro import OCEAN, Hydrosphere
+
+from .cache import LayerCache
+from .graph import LayerGraph
+
+PLANET_LAYERS = ('altitude', 'temperature', 'humidity', 'biomes', 'water', 'coast_distance')
+
+
+def _grid_coast_distance(grid, water_map: np.ndarray) -> np.ndarray:
+    """
+    Distance à la côte des cellules d'une grille cubique.
+
+    L'eau est rééchantillonnée (plus proche voisin) sur une carte
+    équirectangulaire (2 n, 4 n), de résolution équatoriale égale, où
+    coast_distance s'applique ; chaque cellule relit ensuite le pixel de sa
+    latitude et de sa longitude.
+
+    Args:
+        grid: CubedSphereGrid des calques
+        water_map: Carte de Hydrosphere.compute, forme grid.shape
+
+    Returns:
+        np.ndarray: Distances float32 (radians), forme grid.shape ; 0 sur l'océan
+    """
+    height, width = 2 * grid.n, 4 * grid.n
+    # Pixel (i, j) du rééchantillonneur : latitude π (0.5 - i / H), longitude 2π j / W
+    rows = np.rint((0.5 - grid.latitude() / np.pi) * height).astype(np.int64)
+    np.clip(rows, 0, height - 1, out=rows)
+    cols = np.rint(grid.longitude() * (width / (2 * np.pi))).astype(np.int64) % width
+
+    flat = grid.resampler(height, width, "nearest")(water_map)
+    # Le plus proche voisin peut sauter une mer d'une cellule : chaque cellule
+    # d'océan marque aussi son propre pixel
+    ocean = water_map == OCEAN
+    flat[rows[ocean], cols[ocean]] = OCEAN
+    result = coast_distance(flat)[rows, cols]
+    result[ocean] = 0
+    return result
+
+
+def build_planet_graph(
+    determiner,
+    scale: float = 100,
+    sea_level: float = 0.45,
+    niveau_mer: float = 0.45,
+    seuil_côte: float = 0.05,
+    exoplanet=None,
+    tidally_locked: bool = False,
+    atmosphere: bool = False,
+    erosion: int = 0
+) -> LayerGraph:
+    """
+    Construit le graphe altitude → eau → distance à la côte, température/humidité → biomes.
+
+    Args:
+        determiner: BiomeDeterminer fournissant les étapes de calcul
+        scale: Échelle du bruit d'altitude
+        sea_level: Niveau de la mer pour l'humidité et les biomes
+        niveau_mer: Niveau de la mer de l'hydrosphère
+        seuil_côte: Demi-largeur de la bande côtière de l'hydrosphère
+        exoplanet: Exoplanet dont l'étoile fixe le climat (EnergyBalanceModel) ;
+            None = température équatoriale aléatoire
+        tidally_locked: Rotation synchrone de l'exoplanète
+        atmosphere: Humidité transportée par les vents (MoistureTransport) au lieu
+            de la formule altitude / distance à la côte
+        erosion: Itérations d'érosion thermique et hydraulique (Erosion) appliquées
+            au relief brut ; 0 = aucune
+
+    Returns:
+        LayerGraph: Graphe dont les paramètres se modifient avec graph.set(...)
+
+    Raises:
+        ValueError: Si erosion, atmosphere ou tidally_locked est demandé sur une
+            grille cubique
+
+    Example:
+        >>> graph = build_planet_graph(BiomeDeterminer())
+        >>> biomes = graph.get('biomes')
+        >>> graph.set(sea_level=0.5)
+        >>> biomes = graph.get('biomes')  # altitude et température en cache
+    """
+    grid = determiner.grid
+    if grid is not None:
+        unsupported = [name for name, value in (
+            ("erosion", erosion), ("atmosphere", atmosphere),
+            ("tidally_locked", exoplanet is not None and tidally_locked)
+        ) if value]
+        if unsupported:
+            raise ValueError(
+                f"Étapes réservées à la carte équirectangulaire, impossibles sur une grille: "
+                f"{unsupported}"
+            )
+
+    graph = LayerGraph(
+        scale=scale, sea_level=sea_level, niveau_mer=niveau_mer, seuil_côte=seuil_côte,
+        erosion=erosion
+    )
+    # Le relief brut reste en cache : changer le budget d'érosion ne régénère pas le bruit
+    graph.add('relief', lambda scale: determiner.generate_altitude(scale=scale),
+              params=['scale'])
+    graph.add('altitude',
+              lambda relief, erosion: Erosion().run(relief, erosion) if erosion else relief,
+              inputs=['relief'], params=['erosion'])
+    graph.add('water',
+              lambda altitude, niveau_mer, seuil_côte:
+                  Hydrosphere(niveau_mer, seuil_côte).compute(altitude),
+              inputs=['altitude'], params=['niveau_mer', 'seuil_côte'])
+    if grid is None:
+        graph.add('coast_distance', coast_distance, inputs=['water'])
+    else:
+        graph.add('coast_distance', lambda water: _grid_coast_distance(grid, water),
+                  inputs=['water'])
+    if exoplanet is None:
+        graph.add('temperature', determiner.temperature_map, inputs=['altitude'])
+    else:
+        # Le paramètre 'exoplanet' (to_dict) ne sert qu'à la clé du calque
+        planet, model = exoplanet, EnergyBalanceModel()
+        # Sur une grille, profil par latitude de la carte (2 n, 4 n)
+        shape = (determiner.height, determiner.width) if grid is None else (2 * grid.n, 4 * grid.n)
+        graph.set(exoplanet=exoplanet.to_dict(), tidally_locked=tidally_locked)
+        graph.add('climate',
+                  lambda exoplanet, tidally_locked:
+                      model.surface_temperature(planet, *shape, tidally_locked=tidally_locked),
+                  params=['exoplanet', 'tidally_locked'])
+        graph.add('temperature',
+                  lambda altitude, climate, sea_level:
+                      determiner.temperature_map(altitude, climate=climate, sea_level=sea_level),
+                  inputs=['altitude', 'climate'], params=['sea_level'])
+    if atmosphere:
+        transport = MoistureTransport()
+        graph.add('humidity',
+                  lambda altitude, water, temperature, sea_level:
+                      transport.humidity(altitude, water, sea_level, temperature),
+                  inputs=['altitude', 'water', 'temperature'], params=['sea_level'])
+    else:
+        graph.add('humidity',
+                  lambda altitude, distance, sea_level:
+                      determiner.humidity_map(altitude, sea_level, coast_distance=distance),
+                  inputs=['altitude', 'coast_distance'], params=['sea_level'])
+    graph.add('biomes', determiner.determine_biomes,
+              inputs=['temperature', 'humidity', 'altitude'], params=['sea_level'])
+    return graph
+
+
+def planet_cache_params(determiner, exoplanet=None, **graph_params: Any) -> Dict[str, Any]:
+    """
+    Rassemble tout ce qui détermine les calques d'une planète.
+
+    Args:
+        determiner: BiomeDeterminer utilisé pour la génération
+        exoplanet: Exoplanet source (optionnelle), clé via to_dict()
+        **graph_params: Paramètres de build_planet_graph (scale, sea_level...)
+
+    Raises:
+        ValueError: Si le bruit n'a pas de graine (génération non reproductible)
+    """
+    noise = determiner.noise
+    grid = determiner.grid
+    if noise.seed is None:
+        raise ValueError("Le cache exige un bruit avec une graine explicite (FractalNoise(seed=...))")
+    return {
+        "seed": determiner.seed,
+        "width": determiner.width,
+        "height": determiner.height,
+        "perlin_octaves": determiner.perlin.octaves,
+        "noise": {
+            "octaves": noise.octaves,
+            "persistence": noise.persistence,
+            "lacunarity": noise.lacunarity,
+            "seed": noise.seed,
+        },
+        "grid": {"type": type(grid).__name__, "n": grid.n} if grid is not None else None,
+        "graph": graph_params,
+        "exoplanet": exoplanet.to_dict() if exoplanet is not None else None,
+    }
+
+
+def cached_planet_layers(
+    determiner,
+    cache: LayerCache,
+    exoplanet=None,
+    **graph_params: Any
+) -> Dict[str, np.ndarray]:
+    """
+    Renvoie les calques d'une planète depuis le cache disque, ou les génère.
+
+    Un accès réussi renvoie des mémoires mappées en lecture seule, sans
+    aucune génération.
+
+    Args:
+        determiner: BiomeDeterminer (avec un bruit à graine explicite)
+        cache: Cache disque
+        exoplanet: Exoplanet source (optionnelle)
+        **graph_params: Paramètres transmis à build_planet_graph
+
+    Returns:
+        dict: altitude, temperature, humidity, biomes, water et coast_distance
+    """
+    params = planet_cache_params(determiner, exoplanet, **graph_params)
+
+    def generate() -> Dict[str, np.ndarray]:
+        graph = build_planet_graph(determiner, exoplanet=exoplanet, **graph_params)
+        return {name: graph.get(name) for name in PLANET_LAYERS}
+
+    return cache.get_or_create(params, generate)
@@ -0,0 +1,114 @@
+"""
+Série temporelle compacte d'un calque.
+
+Chaque pas est stocké comme anomalie float16 par rapport à un calque de
+référence float32 (par exemple la moyenne annuelle attendue), par blocs de
+quelques pas. Les blocs vivent en mémoire ou dans des fichiers .npy mappés.
+Le minimum, le maximum et la moyenne de chaque cellule sont cumulés à
+l'ajout, sur les valeurs exactes.
+"""
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+class LayerSeries:
+    """
+    Série de `steps` calques (H, W) stockés en anomalies compactes.
+
+    Args:
+        reference: Calque de référence (H, W), conservé en float32
+        steps (int): Nombre de pas de la série
+        chunk_steps (int): Nombre de pas par bloc (par défaut: 8)
+        dtype: Type des anomalies (par défaut: float16)
+        directory (str): Dossier des blocs .npy mappés (None = en mémoire)
+        name (str): Préfixe des fichiers de blocs
+
+    Example:
+        >>> series = LayerSeries(annual_mean, steps=48)
+        >>> for t in range(48):
+        ...     series.append(temperature_at(t))
+        >>> series[12], series.min, series.max, series.mean
+    """
+
+    def __init__(
+        self,
+        reference: np.ndarray,
+        steps: int,
+        chunk_steps: int = 8,
+        dtype=np.float16,
+        directory: Optional[Union[str, Path]] = None,
+        name: str = "series"
+    ):
+        if steps < 1 or chunk_steps < 1:
+            raise ValueError(f"steps et chunk_steps doivent être >= 1 (reçu: {steps}, {chunk_steps})")
+        self.reference = np.asarray(reference, dtype=np.float32)
+        self.shape = self.reference.shape
+        self.steps = steps
+        self.chunk_steps = chunk_steps
+        self.dtype = np.dtype(dtype)
+        self.directory = Path(directory) if directory is not None else None
+        self.name = name
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._chunks: List[np.ndarray] = []
+        self._length = 0
+        self.min = np.full(self.shape, np.inf, dtype=np.float32)
+        self.max = np.full(self.shape, -np.inf, dtype=np.float32)
+        self._sum = np.zeros(self.shape, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _new_chunk(self) -> np.ndarray:
+        size = min(self.chunk_steps, self.steps - self._length)
+        shape = (size,) + self.shape
+        if self.directory is None:
+            return np.empty(shape, dtype=self.dtype)
+        path = self.directory / f"{self.name}_{len(self._chunks):04d}.npy"
+        return np.lib.format.open_memmap(path, mode="w+", dtype=self.dtype, shape=shape)
+
+    def append(self, layer: np.ndarray) -> None:
+        """
+        Ajoute le pas suivant et met à jour min, max et moyenne.
+
+        Raises:
+            ValueError: Si la série est pleine ou si la forme ne correspond pas
+        """
+        if self._length >= self.steps:
+            raise ValueError(f"Série pleine ({self.steps} pas)")
+        if layer.shape != self.shape:
+            raise ValueError(f"Calque de forme {layer.shape} (attendu: {self.shape})")
+
+        index = self._length % self.chunk_steps
+        if index == 0:
+            if self._chunks and isinstance(self._chunks[-1], np.memmap):
+                self._chunks[-1].flush()
+            self._chunks.append(self._new_chunk())
+        np.subtract(layer, self.reference, out=self._chunks[-1][index], casting="unsafe")
+
+        np.minimum(self.min, layer, out=self.min)
+        np.maximum(self.max, layer, out=self.max)
+        self._sum += layer
+        self._length += 1
+
+    def __getitem__(self, step: int) -> np.ndarray:
+        """Calque du pas `step` (float32), reconstruit depuis son anomalie."""
+        if step < 0:
+            step += self._length
+        if not 0 <= step < self._length:
+            raise IndexError(f"Pas hors de la série: {step}")
+        anomaly = self._chunks[step // self.chunk_steps][step % self.chunk_steps]
+        return self.reference + anomaly.astype(np.float32)
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Moyenne de chaque cellule sur les pas ajoutés."""
+        return (self._sum / max(self._length, 1)).astype(np.float32)
+
+    @property
+    def nbytes(self) -> int:
+        """Taille des anomalies stockées et de la référence, en octets."""
+        return self.reference.nbytes + sum(chunk.nbytes for chunk in self._chunks)
@@ -0,0 +1,180 @@
+"""
+Statistiques de surface pondérées par l'aire des cellules.
+
+Sur une carte équirectangulaire, une ligne de latitude φ couvre une surface
+proportionnelle à cos(φ) : compter les pixels surestime les régions
+polaires. Chaque statistique compte d'abord les cellules par (planète,
+ligne, classe) avec un seul np.bincount par bloc de planètes, puis pondère
+les lignes par leur surface (un produit matriciel de taille H). Le poids par
+cellule n'est jamais matérialisé.
+
+Les cartes peuvent être une planète (H, W) ou une pile (N, H, W).
+"""
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from hydro.components import cell_area_weights
+from hydro.hydro import COTE, OCEAN, TERRE
+from hydro.hydrology import LAC, RIVIERE
+
+
+# Cellules indexées par bloc de planètes : borne la mémoire des indices (intp)
+STAT_CHUNK_CELLS = 1 << 22
+
+# Bornes des bandes de latitude par défaut (degrés)
+DEFAULT_BANDS = (-90, -60, -30, 0, 30, 60, 90)
+
+WATER_CLASSES = {"ocean": OCEAN, "coast": COTE, "land": TERRE, "lake": LAC, "river": RIVIERE}
+
+
+def row_counts(class_map: np.ndarray, n_classes: int) -> np.ndarray:
+    """
+    Nombre de cellules de chaque classe sur chaque ligne.
+
+    Args:
+        class_map: Classes entières dans [0, n_classes), forme (H, W) ou (N, H, W)
+        n_classes: Nombre de classes
+
+    Returns:
+        np.ndarray: Comptes int64 de forme (H, n_classes) ou (N, H, n_classes)
+
+    Raises:
+        ValueError: Si la carte n'est pas 2D ou 3D, ou contient une classe hors bornes
+    """
+    if class_map.ndim not in (2, 3):
+        raise ValueError("class_map doit être une matrice 2D ou une pile 3D (n, H, W)")
+    stack = class_map if class_map.ndim == 3 else class_map[None]
+    count, height, width = stack.shape
+    if stack.size and (stack.min() < 0 or stack.max() >= n_classes):
+        raise ValueError(f"Classes hors de [0, {n_classes})")
+
+    counts = np.empty((count, height, n_classes), dtype=np.int64)
+    chunk = max(1, STAT_CHUNK_CELLS // max(height * width, 1))
+    # Indice (planète du bloc, ligne, classe) = base de la ligne + classe
+    base = (np.arange(chunk * height, dtype=np.intp) * n_classes).reshape(chunk, height, 1)
+    for start in range(0, count, chunk):
+        block = stack[start:start + chunk]
+        size = len(block) * height * n_classes
+        index = np.add(block, base[:len(block)], dtype=np.intp)
+        counts[start:start + len(block)] = np.bincount(
+            index.ravel(), minlength=size
+        ).reshape(len(block), height, n_classes)
+    return counts if class_map.ndim == 3 else counts[0]
+
+
+def class_fractions(class_map: np.ndarray, n_classes: int,
+                    area: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fraction de la surface de la planète occupée par chaque classe.
+
+    Args:
+        class_map: Classes entières, forme (H, W) ou (N, H, W)
+        n_classes: Nombre de classes
+        area: Surface de chaque cellule (H, W) pour une autre grille, par ex.
+            grid.CubedSphereGrid.cell_area (None = grille équirectangulaire)
+
+    Returns:
+        np.ndarray: Fractions (n_classes,) ou (N, n_classes), de somme 1 par planète
+
+    Example:
+        >>> class_fractions(biome_map, len(determiner.biomes))[0]  # part de l'océan
+    """
+    height, width = class_map.shape[-2:]
+    if area is None:
+        return _area_fractions(row_counts(class_map, n_classes), width)
+
+    if area.shape != (height, width):
+        raise ValueError(f"area doit être de forme {(height, width)} (reçu: {area.shape})")
+    weights = area.ravel() / area.sum()
+    stack = class_map.reshape(-1, height * width)
+    fractions = np.stack([np.bincount(planet, weights, minlength=n_classes) for planet in stack])
+    if fractions.shape[1] != n_classes:
+        raise ValueError(f"Classes hors de [0, {n_classes})")
+    return fractions.reshape(class_map.shape[:-2] + (n_classes,))
+
+
+def _area_fractions(counts: np.ndarray, width: int) -> np.ndarray:
+    """Fractions de surface à partir des comptes par ligne (…, H, n_classes)."""
+    weights = cell_area_weights(counts.shape[-2]) / width
+    return np.einsum("...hc,h->...c", counts, weights)
+
+
+def _band_fractions(counts: np.ndarray, width: int, bands: Sequence[float]) -> np.ndarray:
+    """Fractions par bande de latitude à partir des comptes par ligne (…, H, n_classes)."""
+    edges = np.asarray(bands, dtype=np.float64)
+    if edges.ndim != 1 or len(edges) < 2 or np.any(np.diff(edges) <= 0):
+        raise ValueError("bands doit contenir au moins deux bornes strictement croissantes")
+
+    height = counts.shape[-2]
+    lat = np.degrees(np.pi * (0.5 - (np.arange(height) + 0.5) / height))
+    band = np.digitize(lat, edges) - 1
+    inside = (band >= 0) & (band < len(edges) - 1)
+    # Matrice (bande, ligne) des poids de surface des lignes de chaque bande
+    weights = np.zeros((len(edges) - 1, height))
+    weights[band[inside], np.flatnonzero(inside)] = cell_area_weights(height)[inside] / width
+
+    areas = np.einsum("...hc,bh->...bc", counts, weights)
+    totals = weights.sum(axis=1)[:, None] * width  # surface de chaque bande
+    return np.divide(areas, totals, out=np.zeros_like(areas), where=totals > 0)
+
+
+def band_fractions(
+    class_map: np.ndarray,
+    n_classes: int,
+    bands: Sequence[float] = DEFAULT_BANDS
+) -> np.ndarray:
+    """
+    Fraction de chaque bande de latitude occupée par chaque classe.
+
+    Une ligne appartient à la bande qui contient la latitude de son centre.
+
+    Args:
+        class_map: Classes entières, forme (H, W) ou (N, H, W), ligne 0 au pôle nord
+        n_classes: Nombre de classes
+        bands: Bornes croissantes des bandes en degrés (par défaut: tous les 30°)
+
+    Returns:
+        np.ndarray: Fractions (n_bandes, n_classes) ou (N, n_bandes, n_classes), de
+        somme 1 sur chaque bande non vide (bande sud en premier)
+    """
+    return _band_fractions(row_counts(class_map, n_classes), class_map.shape[-1], bands)
+
+
+def planet_statistics(
+    biome_map: np.ndarray,
+    water_map: Optional[np.ndarray] = None,
+    n_biomes: int = 9,
+    bands: Sequence[float] = DEFAULT_BANDS
+) -> Dict[str, np.ndarray]:
+    """
+    Résumé pondéré par la surface d'une planète ou d'une pile de planètes.
+
+    Args:
+        biome_map: Carte des biomes (H, W) ou pile (N, H, W)
+        water_map: Carte de l'eau (Hydrosphere, éventuellement Hydrology) de même forme
+        n_biomes: Nombre de biomes (par défaut: len(BiomeDeterminer.biomes))
+        bands: Bornes des bandes de latitude en degrés
+
+    Returns:
+        dict: 'biomes' (…, n_biomes), 'biome_bands' (…, n_bandes, n_biomes) et, avec
+        water_map, une fraction par classe d'eau ('ocean', 'coast', 'land', 'lake', 'river')
+
+    Example:
+        >>> stats = planet_statistics(biome_stack, water_stack)  # piles (1000, H, W)
+        >>> stats['ocean'].mean()
+    """
+    # Les comptes par ligne servent aux deux statistiques des biomes
+    counts = row_counts(biome_map, n_biomes)
+    width = biome_map.shape[-1]
+    stats = {
+        "biomes": _area_fractions(counts, width),
+        "biome_bands": _band_fractions(counts, width, bands),
+    }
+    if water_map is not None:
+        if water_map.shape != biome_map.shape:
+            raise ValueError("water_map doit avoir la forme de biome_map")
+        water = class_fractions(water_map, max(WATER_CLASSES.values()) + 1)
+        for name, value in WATER_CLASSES.items():
+            stats[name] = water[..., value]
+    return stats
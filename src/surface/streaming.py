@@ -0,0 +1,142 @@
+"""
+Pipeline hors mémoire pour les planètes plus grandes que la RAM.
+
+L'altitude est lue (ou générée) dans un fichier .npy en mémoire mappée, puis
+traitée par bandes de latitude : chaque calque dérivé est écrit bande par
+bande dans son propre fichier .npy mappé. La mémoire utilisée dépend de la
+hauteur des bandes, pas de la taille de la planète.
+"""
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from hydro.hydro import Hydrosphere
+
+from .layers import LAYER_DTYPES
+
+
+def iter_bands(height: int, band_rows: int) -> Iterator[slice]:
+    """Découpe [0, height) en bandes de band_rows lignes."""
+    if band_rows < 1:
+        raise ValueError(f"band_rows doit être >= 1 (reçu: {band_rows})")
+    for start in range(0, height, band_rows):
+        yield slice(start, min(start + band_rows, height))
+
+
+class StreamingPipeline:
+    """
+    Pipeline BiomeDeterminer + Hydrosphere par bandes de latitude.
+
+    Args:
+        determiner: BiomeDeterminer fournissant les étapes de calcul
+        directory (str): Dossier des fichiers .npy de sortie
+        band_rows (int): Nombre de lignes par bande (par défaut: 256)
+        sea_level (float): Niveau de la mer pour l'humidité et les biomes
+        hydrosphere (Hydrosphere): Classification de l'eau (None = Hydrosphere(sea_level))
+
+    Example:
+        >>> pipeline = StreamingPipeline(BiomeDeterminer(32768, 16384, seed=1), 'data/archive')
+        >>> layers = pipeline.run()  # dict de np.memmap
+    """
+
+    def __init__(
+        self,
+        determiner,
+        directory: Union[str, Path],
+        band_rows: int = 256,
+        sea_level: float = 0.45,
+        hydrosphere: Optional[Hydrosphere] = None
+    ):
+        self.determiner = determiner
+        self.directory = Path(directory)
+        self.band_rows = band_rows
+        self.sea_level = sea_level
+        self.hydrosphere = hydrosphere if hydrosphere is not None else Hydrosphere(sea_level)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.determiner.height, self.determiner.width)
+
+    def _open_output(self, name: str) -> np.memmap:
+        return np.lib.format.open_memmap(
+            self.directory / f"{name}.npy", mode="w+",
+            dtype=LAYER_DTYPES[name], shape=self.shape
+        )
+
+    def _open_altitude(self, altitude: Union[None, str, Path, np.ndarray], scale: float):
+        if altitude is None:
+            return self._open_output("altitude"), scale
+        if isinstance(altitude, (str, Path)):
+            altitude = np.load(altitude, mmap_mode="r")
+        if altitude.shape != self.shape:
+            raise ValueError(f"altitude doit être de forme {self.shape} (reçu: {altitude.shape})")
+        return altitude, None
+
+    def stream(
+        self,
+        altitude: Union[None, str, Path, np.ndarray] = None,
+        scale: float = 100
+    ) -> Iterator[Tuple[slice, Dict[str, np.ndarray]]]:
+        """
+        Traite la planète bande par bande.
+
+        Args:
+            altitude: Fichier .npy ou tableau (mappé) d'altitude ; None = généré par bandes
+            scale: Échelle du bruit si l'altitude est générée
+
+        Yields:
+            (lignes, calques): Bande traitée et vues sur ses calques en sortie
+        """
+        altitude, generate_scale = self._open_altitude(altitude, scale)
+        outputs = {
+            name: self._open_output(name)
+            for name in ("temperature", "humidity", "biomes", "water")
+        }
+        determiner = self.determiner
+
+        for rows in iter_bands(self.shape[0], self.band_rows):
+            if generate_scale is not None:
+                determiner.generate_altitude(scale=generate_scale, out=altitude[rows],
+                                             rows=(rows.start, rows.stop))
+            alt = np.asarray(altitude[rows])
+            band = {name: layer[rows] for name, layer in outputs.items()}
+
+            determiner.temperature_map(alt, out=band["temperature"], row_start=rows.start)
+            # La distance à la côte demande la carte entière : pas de correction par bande
+            determiner.humidity_map(alt, self.sea_level, out=band["humidity"])
+            determiner.determine_biomes(band["temperature"], band["humidity"], alt,
+                                        self.sea_level, out=band["biomes"])
+            self.hydrosphere.compute(alt, out=band["water"])
+
+            # Les pages écrites repartent sur le disque : la RAM reste bornée
+            for layer in outputs.values():
+                layer.flush()
+            band["altitude"] = alt
+            yield rows, band
+
+        if isinstance(altitude, np.memmap):
+            altitude.flush()
+
+    def run(
+        self,
+        altitude: Union[None, str, Path, np.ndarray] = None,
+        scale: float = 100
+    ) -> Dict[str, np.memmap]:
+        """
+        Traite toutes les bandes puis relit les calques en mémoire mappée.
+
+        Returns:
+            dict: altitude, temperature, humidity, biomes et water (lecture seule)
+        """
+        for _ in self.stream(altitude, scale):
+            pass
+        names = ("temperature", "humidity", "biomes", "water")
+        layers = {name: np.load(self.directory / f"{name}.npy", mmap_mode="r") for name in names}
+        if altitude is None:
+            altitude = self.directory / "altitude.npy"
+        if isinstance(altitude, (str, Path)):
+            altitude = np.load(altitude, mmap_mode="r")
+        layers["altitude"] = altitude
+        return layers
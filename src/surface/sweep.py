@@ -0,0 +1,152 @@
+"""
+Balayage de paramètres sur une seule carte d'altitude.
+
+L'altitude (le bruit, étape la plus coûteuse) est générée une fois. Les
+réglages (niveau de la mer, décalage de la température équatoriale) forment
+un axe de tête K : température, humidité, biomes et carte de l'eau sont
+calculés pour un bloc de réglages à la fois, en piles (k, H, W) diffusées
+contre la même altitude. La taille des blocs est bornée par un budget
+mémoire, et les tampons sont réutilisés d'un bloc à l'autre.
+"""
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from hydro.hydro import COTE, OCEAN, TERRE, Hydrosphere
+
+from .layers import LAYER_DTYPES
+from .statistics import class_fractions
+
+
+SWEEP_LAYERS = ("temperature", "humidity", "biomes", "water")
+
+
+class ParameterSweep:
+    """
+    Évalue K réglages (sea_level, equator_offset) sur une altitude commune.
+
+    Args:
+        determiner: BiomeDeterminer fournissant les étapes de calcul
+        altitude: Carte d'altitude (H, W) ; None = determiner.generate_altitude(scale)
+        scale (float): Échelle du bruit si l'altitude est générée
+        seuil_côte (float): Demi-largeur de la bande côtière de l'hydrosphère
+        memory_budget (int): Octets alloués aux piles d'un bloc (par défaut: 512 Mo)
+
+    Example:
+        >>> sweep = ParameterSweep(BiomeDeterminer(2048, 1024, seed=3))
+        >>> levels, offsets = np.meshgrid(np.linspace(0.3, 0.6, 10), np.linspace(-10, 10, 10))
+        >>> summary = sweep.run(levels.ravel(), offsets.ravel())
+        >>> summary['ocean']  # fraction de surface océanique de chaque réglage
+    """
+
+    # Octets par cellule et par réglage : calques compacts + masque booléen des
+    # océans de humidity_map. Les temporaires de la classification des biomes
+    # sont bornés par blocs de lignes (CHUNK_CELLS), pas par cellule
+    BYTES_PER_CELL = sum(np.dtype(LAYER_DTYPES[name]).itemsize for name in SWEEP_LAYERS) + 1
+
+    def __init__(
+        self,
+        determiner,
+        altitude: Optional[np.ndarray] = None,
+        scale: float = 100,
+        seuil_côte: float = 0.05,
+        memory_budget: int = 512 * 2**20
+    ):
+        self.determiner = determiner
+        self.altitude = altitude if altitude is not None else determiner.generate_altitude(scale)
+        if self.altitude.shape != (determiner.height, determiner.width):
+            raise ValueError(
+                f"altitude doit être de forme {(determiner.height, determiner.width)} "
+                f"(reçu: {self.altitude.shape})"
+            )
+        self.hydrosphere = Hydrosphere(seuil_côte=seuil_côte)
+        self.memory_budget = memory_budget
+
+    @property
+    def chunk_size(self) -> int:
+        """Nombre de réglages calculés ensemble dans le budget mémoire."""
+        return max(1, int(self.memory_budget // (self.altitude.size * self.BYTES_PER_CELL)))
+
+    def iter_chunks(
+        self,
+        sea_level=0.45,
+        equator_offset=0.0
+    ) -> Iterator[Tuple[slice, Dict[str, np.ndarray]]]:
+        """
+        Calcule les calques bloc de réglages par bloc.
+
+        Args:
+            sea_level: Niveau(x) de la mer, scalaire ou (K,)
+            equator_offset: Décalage(s) de la température équatoriale (°C), scalaire ou (K,)
+
+        Yields:
+            (réglages, calques): Tranche de l'axe K et piles (k, H, W) par nom ;
+            les tampons sont réutilisés au bloc suivant
+        """
+        levels, offsets = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(sea_level, dtype=np.float64)),
+            np.atleast_1d(np.asarray(equator_offset, dtype=np.float64))
+        )
+        if levels.ndim != 1:
+            raise ValueError("sea_level et equator_offset doivent être des scalaires ou des vecteurs")
+        altitude = self.altitude
+        determiner = self.determiner
+        total = len(levels)
+        chunk = min(self.chunk_size, total)
+        buffers = {
+            name: np.empty((chunk,) + altitude.shape, dtype=LAYER_DTYPES[name])
+            for name in SWEEP_LAYERS
+        }
+
+        for start in range(0, total, chunk):
+            settings = slice(start, min(start + chunk, total))
+            level = levels[settings]
+            layers = {name: buffer[:len(level)] for name, buffer in buffers.items()}
+
+            determiner.temperature_map(altitude, out=layers["temperature"],
+                                       equator_offset=offsets[settings])
+            determiner.humidity_map(altitude, level, out=layers["humidity"])
+            determiner.determine_biomes(layers["temperature"], layers["humidity"], altitude,
+                                        level, out=layers["biomes"])
+            # Altitude diffusée sur l'axe des réglages, sans copie
+            stack = np.broadcast_to(altitude, layers["water"].shape)
+            self.hydrosphere.compute(stack, out=layers["water"], niveau_mer=level)
+            yield settings, layers
+
+    def run(self, sea_level=0.45, equator_offset=0.0) -> Dict[str, np.ndarray]:
+        """
+        Résumé de chaque réglage : fractions de surface de l'eau et des biomes.
+
+        Les fractions sont pondérées par la surface des cellules (voir
+        surface.statistics.class_fractions), y compris sur la grille du determiner.
+
+        Args:
+            sea_level, equator_offset: Voir iter_chunks()
+
+        Returns:
+            dict: 'sea_level' et 'equator_offset' (K,), 'ocean', 'coast' et 'land' (K,),
+            'biomes' (K, nombre de biomes)
+        """
+        levels, offsets = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(sea_level, dtype=np.float64)),
+            np.atleast_1d(np.asarray(equator_offset, dtype=np.float64))
+        )
+        n_biomes = len(self.determiner.biomes)
+        water = np.empty((len(levels), TERRE + 1))
+        biomes = np.empty((len(levels), n_biomes))
+
+        grid = getattr(self.determiner, "grid", None)
+        area = grid.cell_area if grid is not None else None
+
+        for settings, layers in self.iter_chunks(levels, offsets):
+            water[settings] = class_fractions(layers["water"], TERRE + 1, area)
+            biomes[settings] = class_fractions(layers["biomes"], n_biomes, area)
+
+        return {
+            "sea_level": levels.copy(),
+            "equator_offset": offsets.copy(),
+            "ocean": water[:, OCEAN],
+            "coast": water[:, COTE],
+            "land": water[:, TERRE],
+            "biomes": biomes,
+        }
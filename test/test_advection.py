@@ -0,0 +1,40 @@
+"""
+Tests de l'advection semi-lagrangienne (atmosphere.advection).
+"""
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from atmosphere.advection import EARTH_RADIUS, SemiLagrangianAdvection, band_winds
+
+
+def reference(field, u, v, dt, radius=EARTH_RADIUS):
+    """Interpolation bilinéaire au point de départ avec scipy.ndimage.map_coordinates."""
+    height, width = field.shape
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    rows = np.clip(np.arange(height) + v * dt / (radius * np.pi / height), 0, height - 1)
+    cols = np.arange(width)[None, :] - (u * dt / (radius * np.cos(lat) * 2 * np.pi / width))[:, None]
+    coords = np.stack(np.broadcast_arrays(rows[:, None], cols))
+    # Lignes bornées dans [0, H - 1] : seul le bouclage en longitude intervient
+    return ndimage.map_coordinates(field, coords, order=1, mode="grid-wrap")
+
+
+@pytest.mark.parametrize("dt", [600.0, 6 * 3600.0, 5 * 86400.0])
+def test_matches_map_coordinates(dt):
+    height, width = 45, 90
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    u, v = band_winds(lat)
+    field = np.random.default_rng(0).random((height, width))
+
+    advect = SemiLagrangianAdvection(u, v, width, dt)
+    np.testing.assert_allclose(advect(field.copy()), reference(field, u, v, dt),
+                               rtol=0, atol=1e-7)
+
+
+def test_uniform_field_is_preserved():
+    height, width = 32, 64
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    u, v = band_winds(lat)
+    field = np.full((height, width), 0.7, dtype=np.float32)
+    np.testing.assert_allclose(SemiLagrangianAdvection(u, v, width, 3600.0)(field), 0.7,
+                               rtol=1e-6)
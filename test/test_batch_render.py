@@ -0,0 +1,24 @@
+"""
+Tests du rendu de vignettes en lot (visualize_batch_3d).
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("pyvista")
+Image = pytest.importorskip("PIL.Image")
+
+from visualize_batch_3d import BatchRenderer  # noqa: E402
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_thumbnails_show_each_planet(tmp_path, workers):
+    rng = np.random.default_rng(0)
+    planets = {f"planet_{i}": rng.integers(0, 9, (32, 64)).astype(np.uint8) for i in range(4)}
+    stats = BatchRenderer(str(tmp_path), window_size=(96, 96), resolution=(48, 24),
+                          workers=workers).render(planets)
+
+    assert stats["count"] == 4
+    images = [np.asarray(Image.open(path).convert("RGB"), dtype=float) for path in stats["paths"]]
+    assert all(image.std() > 10 for image in images)  # texture visible, pas une sphère noire
+    assert np.abs(images[0] - images[1]).mean() > 1  # la texture change d'une planète à l'autre
+    assert images[0][0, 0].sum() == 0  # planète entière dans le champ : coin sur le fond noir
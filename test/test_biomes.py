@@ -0,0 +1,33 @@
+"""
+Tests de la classification des biomes (biome.biomes).
+"""
+import numpy as np
+import pytest
+
+from biome.biomes import BiomeDeterminer
+
+
+@pytest.mark.parametrize("chunk_rows", [None, 5])
+def test_lut_matches_historical_loop(chunk_rows):
+    determiner = BiomeDeterminer(width=48, height=32, seed=3)
+    altitude = determiner.generate_altitude()
+    temperature = determiner.temperature_map(altitude)
+    humidity = determiner.humidity_map(altitude)
+
+    lut = determiner.determine_biomes(temperature, humidity, altitude, method="lut",
+                                      chunk_rows=chunk_rows)
+    loop = determiner.determine_biomes(temperature, humidity, altitude, method="loop")
+    np.testing.assert_array_equal(lut, loop)
+
+
+def test_lut_matches_loop_on_thresholds():
+    # Valeurs exactement sur les seuils de température et de précipitations
+    temp, precip = np.meshgrid([-5.0, 0.0, 5.0, 10.0, 25.0], [0.0, 50.0, 300.0, 800.0, 2000.0])
+    humidity = (precip / 1000).astype(np.float32)
+    temp = temp.astype(np.float32)
+    altitude = np.full(temp.shape, 0.8, dtype=np.float32)
+    determiner = BiomeDeterminer(width=5, height=5, seed=0)
+
+    lut = determiner.determine_biomes(temp, humidity, altitude, method="lut")
+    loop = determiner.determine_biomes(temp, humidity, altitude, method="loop")
+    np.testing.assert_array_equal(lut, loop)
@@ -0,0 +1,42 @@
+"""
+Tests de la distance à la côte (hydro.coast).
+"""
+import numpy as np
+import pytest
+
+from hydro.coast import coast_distance
+from hydro.hydro import OCEAN, TERRE
+
+
+def brute_force(target, radius=1.0):
+    """Distance de chaque cellule à chaque cellule d'eau, minimum exhaustif."""
+    height, width = target.shape
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    d_lon, d_lat = 2 * np.pi / width, np.pi / height
+    rows, cols = np.nonzero(target)
+    result = np.full(target.shape, np.inf)
+    for i in range(height):
+        for j in range(width):
+            gap = np.abs(cols - j)
+            gap = np.minimum(gap, width - gap)  # couture périodique
+            # Composante est-ouest mesurée à la latitude de la cellule d'eau
+            east = np.cos(lat[rows]) * gap * d_lon
+            north = (i - rows) * d_lat
+            if len(rows):
+                result[i, j] = np.sqrt(east ** 2 + north ** 2).min()
+    return result * radius
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("density", [0.02, 0.2])
+def test_matches_brute_force(seed, density):
+    rng = np.random.default_rng(seed)
+    water_map = np.where(rng.random((18, 30)) < density, OCEAN, TERRE).astype(np.uint8)
+    distance = coast_distance(water_map, radius=2.0)
+    expected = brute_force(water_map == OCEAN, radius=2.0)
+    np.testing.assert_allclose(distance, expected, rtol=1e-6)
+
+
+def test_no_water_is_infinite():
+    distance = coast_distance(np.full((6, 8), TERRE, dtype=np.uint8))
+    assert np.isinf(distance).all()
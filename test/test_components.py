@@ -0,0 +1,66 @@
+"""
+Tests de l'étiquetage périodique (hydro.components).
+"""
+from collections import deque
+
+import numpy as np
+import pytest
+
+from hydro.components import label_periodic
+
+
+def neighbours(r, c, height, width, connectivity):
+    """Voisins d'une cellule : couture périodique et liaisons à travers les pôles."""
+    steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if connectivity == 8:
+        steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    for dr, dc in steps:
+        if 0 <= r + dr < height:
+            yield r + dr, (c + dc) % width
+    if r in (0, height - 1) and width % 2 == 0:
+        shifts = (-1, 0, 1) if connectivity == 8 else (0,)
+        for d in shifts:
+            yield r, (c + width // 2 + d) % width
+
+
+def brute_force(mask, connectivity):
+    """Étiquetage de référence par parcours en largeur."""
+    height, width = mask.shape
+    labels = np.zeros(mask.shape, dtype=np.int64)
+    n = 0
+    for start in zip(*np.nonzero(mask)):
+        if labels[start]:
+            continue
+        n += 1
+        labels[start] = n
+        queue = deque([start])
+        while queue:
+            r, c = queue.popleft()
+            for nb in neighbours(r, c, height, width, connectivity):
+                if mask[nb] and not labels[nb]:
+                    labels[nb] = n
+                    queue.append(nb)
+    return labels, n
+
+
+def same_partition(a, b):
+    """Vrai si les deux étiquetages ne diffèrent que par la numérotation."""
+    pairs = np.unique(np.stack([a.ravel(), b.ravel()]), axis=1)
+    return len(np.unique(pairs[0])) == len(np.unique(pairs[1])) == pairs.shape[1]
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_brute_force(connectivity, seed):
+    mask = np.random.default_rng(seed).random((12, 16)) < 0.45
+    labels, n = label_periodic(mask, connectivity)
+    expected, n_expected = brute_force(mask, connectivity)
+    assert n == n_expected
+    assert same_partition(labels, expected)
+
+
+def test_pole_diagonal_links_only_in_8_connectivity():
+    mask = np.zeros((6, 8), dtype=bool)
+    mask[0, 1] = mask[0, 6] = True  # 1 + W/2 + 1 = 6 : diagonale à travers le pôle nord
+    assert label_periodic(mask, 8)[1] == 1
+    assert label_periodic(mask, 4)[1] == 2
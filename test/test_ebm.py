@@ -0,0 +1,37 @@
+"""
+Tests du modèle de bilan énergétique (climate.ebm).
+"""
+import numpy as np
+import pytest
+
+from api.exoplanet_fetcher import Exoplanet
+from climate.ebm import EnergyBalanceModel, _centers
+from climate.insolation import annual_insolation, substellar_insolation
+
+
+EARTH = Exoplanet('Terre', 'Soleil', 1.0, 1.0, 5772, 0.0, star_radius=1.0, orbit=1.0)
+EARTH_OBLIQUITY = np.radians(23.44)
+
+
+def test_earth_profile():
+    profile = EnergyBalanceModel().surface_temperature(EARTH, 180, 360,
+                                                       obliquity=EARTH_OBLIQUITY)
+    equator = profile[89:91].mean()
+    assert 25 < equator < 29
+    assert -8 < profile[0] < -4
+    np.testing.assert_allclose(profile, profile[::-1], atol=1e-4)  # symétrie nord-sud
+
+
+@pytest.mark.parametrize("obliquity", [0.0, EARTH_OBLIQUITY])
+def test_default_iterations_converge(obliquity):
+    lat, _ = _centers(90, 1)
+    insolation = annual_insolation(lat, 1361.0, obliquity)[:, None]
+    converged = EnergyBalanceModel(iterations=200).equilibrium(insolation)
+    np.testing.assert_allclose(EnergyBalanceModel().equilibrium(insolation), converged,
+                               rtol=0, atol=1e-4)
+
+
+def test_tidally_locked_day_side_is_warmer():
+    lat, lon = _centers(30, 60)
+    field = EnergyBalanceModel().equilibrium(substellar_insolation(lat, lon, 1361.0))
+    assert field[15, 30] > field[15, 0]  # point substellaire (centre) contre antistellaire
@@ -0,0 +1,51 @@
+"""
+Tests de l'érosion thermique et hydraulique (heightmap.erosion).
+"""
+import numpy as np
+import pytest
+
+from heightmap.erosion import Erosion
+
+
+def relief(height=24, width=48, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.random((height, width)).astype(np.float32)
+
+
+@pytest.mark.parametrize("iterations", [1, 5, 13])
+def test_parallel_bands_match_serial(iterations):
+    altitude = relief()
+    serial = Erosion().run(altitude, iterations)
+    # Bandes de 7 lignes, halos échangés toutes les 4 itérations (dernier bloc incomplet)
+    parallel = Erosion().run(altitude, iterations, workers=2, band_rows=7, exchange_every=4)
+    np.testing.assert_array_equal(parallel, serial)
+
+
+def test_matter_is_conserved():
+    altitude = relief(seed=1)
+    erosion = Erosion()
+    eroded = altitude.copy()
+    water, sediment = np.zeros_like(eroded), np.zeros_like(eroded)
+    erosion.erode(eroded, water, sediment, 20)
+    # Altitude + sédiments en suspension : ni création ni perte de matière
+    assert sediment.sum() > 0
+    np.testing.assert_allclose(eroded.sum(dtype=np.float64) + sediment.sum(dtype=np.float64),
+                               altitude.sum(dtype=np.float64), rtol=1e-5)
+    # run() redépose les sédiments : la masse d'altitude est conservée
+    result = erosion.run(altitude, 20)
+    assert not np.array_equal(result, altitude)
+    np.testing.assert_allclose(result.sum(dtype=np.float64), altitude.sum(dtype=np.float64),
+                               rtol=1e-5)
+
+
+def test_input_is_not_modified_without_out():
+    altitude = relief(seed=2)
+    original = altitude.copy()
+    result = Erosion().run(altitude, 5)
+    assert result is not altitude
+    np.testing.assert_array_equal(altitude, original)
+
+    # Avec out=altitude, l'érosion se fait en place
+    in_place = Erosion().run(altitude, 5, out=altitude)
+    assert in_place is altitude
+    np.testing.assert_array_equal(in_place, result)
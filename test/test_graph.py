@@ -0,0 +1,51 @@
+"""
+Tests du recalcul incrémental du graphe de calques (surface.graph).
+"""
+import numpy as np
+
+from biome.biomes import BiomeDeterminer
+from surface.graph import LayerGraph
+from surface.pipeline import build_planet_graph
+
+
+def test_only_downstream_nodes_are_recomputed():
+    calls = []
+
+    def node(name):
+        def func(*inputs, **params):
+            calls.append(name)
+            return np.array([len(calls)])
+        return func
+
+    graph = LayerGraph(a=1, b=2)
+    graph.add('left', node('left'), params=['a'])
+    graph.add('right', node('right'), params=['b'])
+    graph.add('middle', node('middle'), inputs=['left'])
+    graph.add('top', node('top'), inputs=['middle', 'right'])
+
+    graph.get('top')
+    assert sorted(graph.computed) == ['left', 'middle', 'right', 'top']
+    graph.set(b=3)
+    graph.get('top')
+    assert sorted(graph.computed) == ['right', 'top']
+    # Même valeur : même clé, rien n'est recalculé
+    graph.set(a=1)
+    graph.get('top')
+    assert graph.computed == []
+    assert len(calls) == 6
+
+
+def test_planet_graph_recomputes_downstream_of_each_parameter():
+    graph = build_planet_graph(BiomeDeterminer(width=32, height=16, seed=4))
+    graph.get('biomes')
+    relief = graph.get('relief')
+    for params, downstream in [
+        ({'sea_level': 0.5}, {'humidity', 'biomes'}),
+        ({'niveau_mer': 0.5}, {'water', 'coast_distance', 'humidity', 'biomes'}),
+        ({'erosion': 2}, {'altitude', 'water', 'coast_distance', 'temperature', 'humidity',
+                          'biomes'}),
+    ]:
+        graph.set(**params)
+        graph.get('biomes')
+        assert set(graph.computed) == downstream, params
+    assert graph.get('relief') is relief
@@ -0,0 +1,39 @@
+"""
+Tests de la grille de sphère cubique et de son rééchantillonnage (grid.cubed_sphere).
+"""
+import numpy as np
+import pytest
+
+from grid import CubedSphereGrid
+
+
+def test_sin_latitude_resamples_without_seams():
+    n, height, width = 32, 128, 256
+    grid = CubedSphereGrid(n)
+    sin_lat = grid.points()[2].astype(np.float32)
+    flat = grid.resampler(height, width)(sin_lat)
+
+    lat = np.pi * (0.5 - np.arange(height) / height)
+    cell = np.pi / 2 / n  # pas angulaire d'une cellule de face
+    # Constant le long de chaque ligne : tout saut est une couture entre faces
+    jumps = np.abs(np.diff(flat, axis=1, append=flat[:, :1]))
+    assert jumps.max() < 0.15 * cell
+    np.testing.assert_allclose(flat, np.broadcast_to(np.sin(lat)[:, None], flat.shape),
+                               rtol=0, atol=0.15 * cell)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_bilinear_reproduces_constants(n):
+    grid = CubedSphereGrid(n)
+    flat = grid.resampler(8, 16)(np.full(grid.shape, 3.5))
+    assert flat.dtype == np.float32
+    np.testing.assert_array_equal(flat, 3.5)
+
+
+def test_nearest_keeps_classes():
+    grid = CubedSphereGrid(8)
+    classes = np.repeat(np.arange(6, dtype=np.uint8), 8 * 8).reshape(grid.shape)
+    flat = grid.resampler(32, 64, "nearest")(classes)
+    assert flat.dtype == np.uint8
+    assert set(np.unique(flat)) == set(range(6))
+    assert (flat[0] == 4).all() and (flat[-1] == 5).all()  # faces polaires
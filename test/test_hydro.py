@@ -0,0 +1,30 @@
+"""
+Tests de la classification océan / côte / terre (hydro.hydro).
+"""
+import numpy as np
+
+from hydro.hydro import COTE, OCEAN, TERRE, Hydrosphere
+
+
+def reference(altitude, bas, haut):
+    water = np.full(altitude.shape, COTE, dtype=np.uint8)
+    water[altitude < bas] = OCEAN
+    water[altitude > haut] = TERRE
+    return water
+
+
+def test_compute_matches_masks(monkeypatch):
+    # Blocs de quelques lignes pour exercer le découpage
+    monkeypatch.setattr("hydro.hydro.WATER_CHUNK_CELLS", 100)
+    altitude = np.random.default_rng(0).random((37, 50), dtype=np.float32)
+    water = Hydrosphere(0.45, 0.05).compute(altitude)
+    np.testing.assert_array_equal(water, reference(altitude, np.float32(0.45 - 0.05), np.float32(0.45 + 0.05)))
+
+
+def test_compute_stack_with_one_level_per_planet():
+    altitude = np.random.default_rng(1).random((24, 32), dtype=np.float32)
+    levels = np.array([0.3, 0.45, 0.6])
+    stack = np.broadcast_to(altitude, (3,) + altitude.shape)
+    water = Hydrosphere(seuil_côte=0.05).compute(stack, niveau_mer=levels)
+    for k, level in enumerate(levels):
+        np.testing.assert_array_equal(water[k], Hydrosphere(level, 0.05).compute(altitude))
@@ -0,0 +1,62 @@
+"""
+Tests du remplissage des dépressions et des rivières (hydro.hydrology).
+"""
+import heapq
+
+import numpy as np
+import pytest
+
+from hydro.hydrology import MIN_RIVER_CELLS, Hydrology
+
+
+def priority_flood(elevation, niveau_mer):
+    """Priority-flood de référence, cellule par cellule (D8, longitude périodique)."""
+    height, width = elevation.shape
+    outlet = elevation < niveau_mer
+    if not outlet.any():
+        outlet.flat[np.argmin(elevation)] = True
+    filled = elevation.copy()
+    done = outlet.copy()
+    heap = [(elevation[r, c], r, c) for r, c in zip(*np.nonzero(outlet))]
+    heapq.heapify(heap)
+    while heap:
+        level, r, c = heapq.heappop(heap)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                nr, nc = r + dr, (c + dc) % width
+                if (dr or dc) and 0 <= nr < height and not done[nr, nc]:
+                    done[nr, nc] = True
+                    filled[nr, nc] = max(elevation[nr, nc], level)
+                    heapq.heappush(heap, (filled[nr, nc], nr, nc))
+    return filled
+
+
+def rough_map(seed, shape=(24, 40)):
+    """Relief lissé avec de nombreuses cuvettes, dont certaines à la couture."""
+    rng = np.random.default_rng(seed)
+    noise = rng.random(shape)
+    smooth = (noise + np.roll(noise, 1, axis=1) + np.roll(noise, 1, axis=0)) / 3
+    return (0.7 * smooth + 0.3 * noise).astype(np.float32)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fill_matches_reference_priority_flood(seed):
+    elevation = rough_map(seed)
+    result = Hydrology(niveau_mer=0.35).compute(elevation)
+    np.testing.assert_array_equal(result.filled, priority_flood(elevation, 0.35))
+
+
+def test_fill_without_ocean_uses_lowest_cell():
+    elevation = rough_map(3) + 1
+    result = Hydrology(niveau_mer=0.0).compute(elevation)
+    np.testing.assert_array_equal(result.filled, priority_flood(elevation, 0.0))
+
+
+def test_small_map_rivers_need_minimum_accumulation():
+    elevation = rough_map(4)
+    result = Hydrology(niveau_mer=0.35).compute(elevation)
+    # 960 cellules : seuil_rivière * n < 1, le plancher s'applique
+    assert result.rivers.any()
+    assert (result.accumulation[result.rivers] >= MIN_RIVER_CELLS).all()
+    land = elevation >= 0.35
+    assert result.rivers.sum() < 0.25 * (land & ~result.lakes).sum()
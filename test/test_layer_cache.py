@@ -0,0 +1,68 @@
+"""
+Tests du cache disque des calques (surface.cache).
+"""
+import os
+
+import numpy as np
+
+from surface import cache as cache_module
+from surface.cache import CODE_MODULES, SRC_ROOT, LayerCache
+
+
+def layers(value, size=1000):
+    return {"altitude": np.full(size, value, dtype=np.float32)}
+
+
+def test_hit_returns_memory_maps(tmp_path):
+    cache = LayerCache(str(tmp_path))
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return layers(0.5)
+
+    first = cache.get_or_create({"seed": 1}, factory)
+    second = cache.get_or_create({"seed": 1}, factory)
+    assert len(calls) == 1
+    assert isinstance(second["altitude"], np.memmap)
+    assert not second["altitude"].flags.writeable
+    np.testing.assert_array_equal(second["altitude"], first["altitude"])
+    assert cache.load(cache.key({"seed": 2})) is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    entry_bytes = 1000 * 4 + 128  # données float32 + en-tête .npy
+    cache = LayerCache(str(tmp_path), max_bytes=2 * entry_bytes)
+    keys = [cache.key({"seed": seed}) for seed in range(3)]
+    for key, value in zip(keys[:2], (0.0, 1.0)):
+        cache.store(key, layers(value))
+    # Dates d'utilisation explicites, puis relecture de la plus ancienne
+    os.utime(tmp_path / keys[0], (1000, 1000))
+    os.utime(tmp_path / keys[1], (2000, 2000))
+    cache.load(keys[0])
+
+    cache.store(keys[2], layers(2.0))
+    assert cache.load(keys[1]) is None  # moins récemment utilisée
+    assert cache.load(keys[0]) is not None and cache.load(keys[2]) is not None
+    assert cache.size() <= cache.max_bytes
+
+
+def test_key_follows_params_and_code(tmp_path, monkeypatch):
+    cache = LayerCache(str(tmp_path / "cache"))
+    assert cache.key({"seed": 1, "scale": 100}) == cache.key({"scale": 100, "seed": 1})
+    assert cache.key({"seed": 1, "scale": 100}) != cache.key({"seed": 1, "scale": 101})
+
+    module = tmp_path / "noise.py"
+    monkeypatch.setattr(cache_module, "SRC_ROOT", tmp_path)
+    monkeypatch.setattr(cache_module, "CODE_MODULES", ("noise.py",))
+    keys = []
+    for source in ("AMPLITUDE = 1\n", "AMPLITUDE = 2\n"):
+        module.write_text(source)
+        monkeypatch.setattr(cache_module, "_code_version", None)
+        keys.append(cache.key({"seed": 1}))
+    assert keys[0] != keys[1]
+
+
+def test_code_modules_exist():
+    assert "hydro/hydrology.py" in CODE_MODULES
+    assert all((SRC_ROOT / module).exists() for module in CODE_MODULES)
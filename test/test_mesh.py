@@ -0,0 +1,51 @@
+"""
+Tests des maillages de planète déplacés par le relief (render.mesh).
+"""
+import numpy as np
+
+from render.mesh import relief_sphere
+
+
+def grid(points, theta, phi):
+    return points.reshape(phi + 1, theta + 1, 3)
+
+
+def test_vertices_at_pixel_centres_are_displaced_by_their_altitude():
+    rng = np.random.default_rng(0)
+    altitude = rng.random((8, 16)).astype(np.float32)
+    # Deux sommets par pixel : les sommets impairs tombent sur les centres des pixels
+    theta, phi = 32, 16
+    points, _, _ = relief_sphere(altitude, theta, phi, radius=2.0, exaggeration=0.1)
+    radius = np.linalg.norm(grid(points, theta, phi), axis=-1)
+    np.testing.assert_allclose(radius[1::2, 1::2], 2.0 * (1 + 0.1 * altitude), rtol=1e-5)
+
+
+def test_sea_level_keeps_oceans_on_the_sphere():
+    altitude = np.linspace(0, 1, 8 * 16, dtype=np.float32).reshape(8, 16)
+    points, _, _ = relief_sphere(altitude, 32, 16, sea_level=0.5)
+    radius = np.linalg.norm(points, axis=-1)
+    assert radius.min() >= 1 - 1e-6
+    assert np.isclose(radius, 1).mean() > 0.4
+
+
+def test_triangles_face_outward():
+    altitude = np.random.default_rng(1).random((16, 32)).astype(np.float32)
+    points, faces, _ = relief_sphere(altitude, 24, 12, exaggeration=0.05)
+    triangles = points[faces.reshape(-1, 4)[:, 1:]].astype(np.float64)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    assert (np.linalg.norm(normals, axis=1) > 0).all()  # pas de triangle dégénéré
+    assert ((normals * triangles.mean(axis=1)).sum(axis=1) > 0).all()
+
+
+def test_seam_and_poles_close_the_surface():
+    altitude = np.random.default_rng(2).random((16, 32)).astype(np.float32)
+    theta, phi = 24, 12
+    points, _, tcoords = relief_sphere(altitude, theta, phi, exaggeration=0.2)
+    points = grid(points, theta, phi)
+    # Couture : la dernière colonne reprend la première, u va de 0 à 1
+    np.testing.assert_allclose(points[:, -1], points[:, 0], atol=1e-6)
+    u = tcoords.reshape(phi + 1, theta + 1, 2)[..., 0]
+    assert (u[:, 0] == 0).all() and (u[:, -1] == 1).all()
+    # Pôles : un seul point chacun, quel que soit le relief autour
+    for pole in (points[0], points[-1]):
+        np.testing.assert_allclose(pole, np.broadcast_to(pole[0], pole.shape), atol=1e-6)
@@ -0,0 +1,40 @@
+"""
+Tests du bruit fractal vectorisé (heightmap.noise).
+"""
+import numpy as np
+import pytest
+
+from heightmap.noise import FractalNoise
+
+
+def coordinates(height=64, width=128):
+    return np.meshgrid(np.linspace(0, 12, width), np.linspace(0, 6, height))
+
+
+@pytest.mark.parametrize("octaves", [1, 6])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_values_stay_in_unit_range(octaves, dtype):
+    x, y = coordinates()
+    noise = FractalNoise(octaves=octaves, persistence=0.8, seed=4)
+    for values in (noise(x, y, dtype=dtype), noise(x, y, x * 0.5 - y, dtype=dtype)):
+        assert values.dtype == dtype
+        assert values.min() >= -1 and values.max() <= 1
+        assert values.std() > 0.05
+
+
+def test_same_seed_gives_same_noise():
+    x, y = coordinates()
+    np.testing.assert_array_equal(FractalNoise(seed=7)(x, y), FractalNoise(seed=7)(x, y))
+    assert not np.array_equal(FractalNoise(seed=7)(x, y), FractalNoise(seed=8)(x, y))
+
+
+@pytest.mark.parametrize("use_z", [False, True])
+def test_chunked_evaluation_matches_single_call(use_z):
+    x, y = coordinates()
+    z = np.sin(x) if use_z else None
+    noise = FractalNoise(seed=3)
+    whole = noise(x, y, z)
+    # Blocs de 5 lignes (le dernier incomplet), comme generate_altitude par chunk_rows
+    chunks = [noise(x[r:r + 5], y[r:r + 5], None if z is None else z[r:r + 5])
+              for r in range(0, x.shape[0], 5)]
+    np.testing.assert_array_equal(np.concatenate(chunks), whole)
@@ -0,0 +1,47 @@
+"""
+Tests du graphe de calques d'une planète (surface.pipeline).
+"""
+import numpy as np
+import pytest
+
+from biome.biomes import BiomeDeterminer
+from grid.cubed_sphere import CubedSphereGrid
+from hydro.hydro import OCEAN
+from surface.pipeline import build_planet_graph, planet_cache_params
+
+
+def great_circle_coast_distance(grid, water_map):
+    """Distance angulaire exacte de chaque cellule à la cellule d'océan la plus proche."""
+    points = np.stack([axis.ravel() for axis in grid.points()], axis=1)
+    ocean = points[water_map.ravel() == OCEAN]
+    cosine = np.clip(points @ ocean.T, -1, 1)
+    return np.arccos(cosine.max(axis=1)).reshape(grid.shape)
+
+
+def test_cubed_sphere_graph():
+    grid = CubedSphereGrid(16)
+    graph = build_planet_graph(BiomeDeterminer(seed=2, grid=grid))
+    for name in ('altitude', 'water', 'coast_distance', 'temperature', 'humidity', 'biomes'):
+        assert graph.get(name).shape == grid.shape, name
+
+    water, distance = graph.get('water'), graph.get('coast_distance')
+    expected = great_circle_coast_distance(grid, water)
+    # Aller-retour par la carte équirectangulaire : moins de deux cellules d'écart
+    # (loin des pôles, où la métrique de coast_distance s'écarte du grand cercle)
+    low = np.abs(grid.latitude()) < np.radians(60)
+    assert np.abs(distance - expected)[low].max() < 2 * (np.pi / 2) / grid.n
+    assert (distance[water == OCEAN] == 0).all()
+
+
+@pytest.mark.parametrize("option", [{"erosion": 5}, {"atmosphere": True}])
+def test_cubed_sphere_rejects_equirectangular_stages(option):
+    with pytest.raises(ValueError, match="grille"):
+        build_planet_graph(BiomeDeterminer(seed=2, grid=CubedSphereGrid(8)), **option)
+
+
+def test_cache_params_include_grid():
+    flat = planet_cache_params(BiomeDeterminer(width=32, height=192, seed=1))
+    cubed = planet_cache_params(BiomeDeterminer(seed=1, grid=CubedSphereGrid(32)))
+    assert (flat["width"], flat["height"]) == (cubed["width"], cubed["height"])
+    assert flat != cubed
+    assert cubed["grid"] == {"type": "CubedSphereGrid", "n": 32}
@@ -0,0 +1,130 @@
+"""
+Tests du rendu 3D hors écran (visualize_planet_3d).
+"""
+import importlib.util
+
+import numpy as np
+import pytest
+
+pv = pytest.importorskip("pyvista")
+Image = pytest.importorskip("PIL.Image")
+
+import visualize_planet_3d  # noqa: E402
+from visualize_3d import Visualizer3D  # noqa: E402
+from visualize_planet_3d import LOD_DISTANCES, PlanetRenderer  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def off_screen(monkeypatch):
+    monkeypatch.setattr(pv, "OFF_SCREEN", True)
+
+
+def screenshot(renderer, path, **options):
+    renderer.render(window_size=(160, 160), save_screenshot=str(path), **options)
+    return np.asarray(Image.open(path).convert("RGB"), dtype=float)
+
+
+def test_sphere_has_texture_coordinates():
+    biomes = np.zeros((8, 16), dtype=np.uint8)
+    mesh = PlanetRenderer(texture=biomes, resolution=(32, 16))._create_sphere()
+    tcoords = np.asarray(mesh.GetPointData().GetTCoords())
+    assert tcoords.shape == (mesh.n_points, 2)
+    assert tcoords.min() == 0 and tcoords.max() == 1
+
+
+def test_biome_texture_is_visible(tmp_path):
+    biomes = np.random.default_rng(0).integers(0, 9, (32, 64)).astype(np.uint8)
+    image = screenshot(PlanetRenderer(texture=biomes, resolution=(64, 32)), tmp_path / "planet.png")
+    assert image.std() > 10  # une sphère noire (texture rejetée) donne une image uniforme
+
+
+def test_second_render_reuses_cached_sphere_and_texture(tmp_path):
+    Image.fromarray(np.random.default_rng(1).integers(0, 255, (16, 32, 3), dtype=np.uint8)).save(
+        tmp_path / "texture.png"
+    )
+    meshes, textures = visualize_planet_3d.MESH_CACHE, visualize_planet_3d.TEXTURE_CACHE
+    meshes.clear()
+    textures.clear()
+    counts = (meshes.misses, meshes.hits, textures.hits)
+    images = [
+        screenshot(PlanetRenderer(str(tmp_path / "texture.png"), resolution=(48, 24)),
+                   tmp_path / f"render_{i}.png")
+        for i in range(2)
+    ]
+    # Premier rendu : construction ; second rendu : tout vient des caches
+    assert (meshes.misses, meshes.hits, textures.hits) == (counts[0] + 1, counts[1] + 1,
+                                                          counts[2] + 1)
+    assert len(textures) == 1
+    assert meshes.get(("sphere", 1.0, 48, 24)).GetPointData().GetTCoords() is not None
+    np.testing.assert_array_equal(images[0], images[1])
+
+
+def test_north_is_up(tmp_path):
+    # Moitié nord rouge, moitié sud bleue
+    texture = np.zeros((32, 64, 3), dtype=np.uint8)
+    texture[:16, :, 0] = 255
+    texture[16:, :, 2] = 255
+    image = screenshot(PlanetRenderer(texture=texture, resolution=(64, 32)), tmp_path / "poles.png",
+                       lighting="bright")
+    top, bottom = image[40, 80], image[120, 80]
+    assert top[0] > top[2] and bottom[2] > bottom[0]
+
+
+def test_turntable_frames_show_other_longitudes(tmp_path):
+    # Une couleur par quart de longitude
+    texture = np.zeros((32, 64, 3), dtype=np.uint8)
+    for quarter, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]):
+        texture[:, 16 * quarter:16 * (quarter + 1)] = color
+    pattern = str(tmp_path / "frame_{:02d}.png")
+    PlanetRenderer(texture=texture, resolution=(64, 32)).render(
+        window_size=(160, 160), rotation_speed=90, animation_path=pattern, frames=4
+    )
+    frames = [np.asarray(Image.open(pattern.format(i)).convert("RGB"), dtype=float)
+              for i in range(4)]
+    assert all(frame.std() > 10 for frame in frames)
+    # Chaque quart de tour amène une autre couleur au centre de l'image
+    assert len({tuple(np.round(frame[80, 80] / 64)) for frame in frames}) == 4
+
+
+def test_turntable_gif_export(tmp_path):
+    imageio = pytest.importorskip("imageio")
+    texture = np.zeros((32, 64, 3), dtype=np.uint8)
+    texture[:, :32, 0] = 255
+    texture[:, 32:, 2] = 255
+    path = tmp_path / "tour.gif"
+    PlanetRenderer(texture=texture, resolution=(64, 32)).render(
+        window_size=(96, 96), rotation_speed=90, animation_path=str(path), frames=4
+    )
+    frames = imageio.mimread(path)
+    assert len(frames) == 4
+    assert all(np.asarray(frame, dtype=float).std() > 10 for frame in frames)
+    assert np.abs(np.asarray(frames[0], float) - np.asarray(frames[2], float)).mean() > 1
+
+
+@pytest.mark.skipif(importlib.util.find_spec("imageio_ffmpeg") is not None,
+                    reason="imageio-ffmpeg installé")
+def test_video_export_without_ffmpeg_fails_before_rendering(tmp_path):
+    with pytest.raises(ImportError, match="imageio-ffmpeg"):
+        PlanetRenderer(texture=np.zeros((8, 16), dtype=np.uint8)).render(
+            rotation_speed=10, animation_path=str(tmp_path / "tour.mp4")
+        )
+    assert not (tmp_path / "tour.mp4").exists()
+
+
+def test_lod_follows_camera_distance():
+    relief = np.random.default_rng(0).random((16, 32)).astype(np.float32)
+    levels = ((32, 16), (24, 12), (16, 8), (8, 4))
+    renderer = PlanetRenderer(texture=np.zeros((16, 32), dtype=np.uint8), radius=2.0,
+                              relief=relief, lod_resolutions=levels)
+    visualizer = Visualizer3D(window_size=(64, 64))
+    actors = [visualizer.add_mesh(mesh) for mesh in renderer._create_relief_meshes()]
+    renderer._setup_lod(visualizer, actors)
+
+    # Un niveau visible à la fois, choisi à chaque déplacement de la caméra
+    camera = visualizer.plotter.camera
+    for level, distance in enumerate((3.0, 7.0, 15.0, 40.0)):
+        camera.position = (2.0 * distance, 0.0, 0.0)
+        assert [actor.GetVisibility() for actor in actors] == [i == level for i in range(4)]
+        if level < len(LOD_DISTANCES):
+            assert distance < LOD_DISTANCES[level]
+    visualizer.close()
@@ -0,0 +1,32 @@
+"""
+Tests du cache LRU des objets de rendu (render.cache).
+"""
+import numpy as np
+
+from render.cache import RenderCache
+
+
+def test_evicts_least_recently_used():
+    cache = RenderCache(30, size=lambda value: value.nbytes)
+    for key in "abc":
+        cache.put(key, np.zeros(10, dtype=np.uint8))
+    cache.get("a")  # "b" devient le plus ancien
+    cache.put("d", np.zeros(10, dtype=np.uint8))
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.nbytes == 30
+
+
+def test_get_or_create_builds_once():
+    cache = RenderCache(100, size=lambda value: 1)
+    calls = []
+    for _ in range(3):
+        cache.get_or_create("sphere", lambda: calls.append(1) or "mesh")
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_oversized_object_is_not_kept():
+    cache = RenderCache(10, size=lambda value: value)
+    cache.put("big", 11)
+    assert len(cache) == 0 and cache.nbytes == 0
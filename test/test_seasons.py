@@ -0,0 +1,69 @@
+"""
+Tests du cycle saisonnier (climate.seasons) et de son stockage (surface.series).
+"""
+import numpy as np
+import pytest
+
+from api.exoplanet_fetcher import Exoplanet
+from biome.biomes import BiomeDeterminer
+from climate import EnergyBalanceModel, SeasonalClimate
+from climate.ebm import _centers, _interp_rows
+from climate.insolation import annual_insolation, stellar_flux
+
+
+EARTH = Exoplanet('Terre', 'Soleil', 1.0, 1.0, 5772, 0.0, star_radius=1.0, orbit=1.0)
+EARTH_OBLIQUITY = np.radians(23.44)
+
+
+def _annual_equilibrium(seasons):
+    lat, _ = _centers(seasons.model.grid[0], 1)
+    insolation = annual_insolation(lat, stellar_flux(EARTH), seasons.obliquity)[:, None]
+    return seasons.model.equilibrium(insolation)[:, 0]
+
+
+@pytest.mark.parametrize("obliquity, heat_capacity, atol", [
+    (0.0, 1.0e8, 1e-4),               # insolation constante : équilibre exact
+    (EARTH_OBLIQUITY, 1.0e9, 1.0),    # forte inertie : cycle faible, albédo presque linéaire
+])
+def test_seasonal_mean_matches_annual_equilibrium(obliquity, heat_capacity, atol):
+    seasons = SeasonalClimate(EnergyBalanceModel(grid=(90, 1)), steps=48,
+                              obliquity=obliquity, heat_capacity=heat_capacity)
+    cycle = seasons.zonal_cycle(EARTH)
+    np.testing.assert_allclose(cycle.mean(axis=0), _annual_equilibrium(seasons),
+                               rtol=0, atol=atol)
+
+
+def test_earth_cycle_is_seasonal():
+    seasons = SeasonalClimate(EnergyBalanceModel(grid=(90, 1)), steps=48)
+    cycle = seasons.zonal_cycle(EARTH)
+    # L'écart à l'équilibre annuel ne vient que de l'albédo non linéaire près de la glace
+    assert abs(cycle.mean() - _annual_equilibrium(seasons).mean()) < 1.5
+    north, south = cycle[:, -1], cycle[:, 0]
+    assert np.ptp(north) > 10
+    assert np.argmax(north) != np.argmax(south)  # étés en opposition de phase
+
+
+def test_float16_series_round_trip():
+    determiner = BiomeDeterminer(width=64, height=32, seed=3)
+    altitude = determiner.generate_altitude()
+    seasons = SeasonalClimate(EnergyBalanceModel(grid=(90, 1)), steps=12)
+    series = seasons.run(determiner, altitude, EARTH, chunk_steps=5)
+
+    cycle = np.stack([_interp_rows(profile, altitude.shape[0])
+                      for profile in seasons.zonal_cycle(EARTH)])
+    anomalies = (cycle - cycle.mean(axis=0)).astype(np.float32)
+    temperature = series["temperature"]
+    humidity = series["humidity"]
+    expected = np.stack([temperature.reference + anomaly[:, None] for anomaly in anomalies])
+    moisture = np.clip(humidity.reference * np.exp(np.float32(0.07) * anomalies[:, :, None]), 0, 1)
+
+    # Anomalies float16 : demi-ulp de ~2^-7 sous 32 °C, ~2^-12 pour l'humidité
+    for t in range(seasons.steps):
+        np.testing.assert_allclose(temperature[t], expected[t], rtol=0, atol=1e-2)
+        np.testing.assert_allclose(humidity[t], moisture[t], rtol=0, atol=1e-3)
+
+    # Les statistiques sont cumulées en pleine précision
+    np.testing.assert_allclose(temperature.min, expected.min(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(temperature.max, expected.max(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(temperature.mean, expected.mean(axis=0), rtol=0, atol=1e-4)
+    assert temperature.nbytes == expected[0].nbytes + seasons.steps * expected[0].size * 2
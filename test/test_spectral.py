@@ -0,0 +1,58 @@
+"""
+Tests du moteur de terrain spectral (heightmap.spectral).
+"""
+import numpy as np
+import pytest
+
+from biome.biomes import BiomeDeterminer
+from heightmap.spectral import SpectralTerrain
+
+
+def test_range_and_determinism():
+    terrain = SpectralTerrain(beta=3.0, corner=8, seed=5)
+    altitude = terrain.generate(128, 64)
+    assert altitude.shape == (64, 128) and altitude.dtype == np.float32
+    assert altitude.min() == 0 and altitude.max() == 1
+    np.testing.assert_array_equal(SpectralTerrain(beta=3.0, corner=8, seed=5).generate(128, 64),
+                                  altitude)
+    assert not np.array_equal(SpectralTerrain(beta=3.0, corner=8, seed=6).generate(128, 64),
+                              altitude)
+
+
+def test_poles_are_continuous_and_independent():
+    altitude = SpectralTerrain(beta=3.0, corner=8, seed=1).generate(512, 256).astype(np.float64)
+    step = np.abs(np.diff(altitude, axis=0)).mean()  # écart entre lignes voisines
+    for row in (altitude[0], altitude[-1]):
+        # Au-delà du pôle : même ligne, méridien opposé
+        across = np.abs(row - np.roll(row, -256)).mean()
+        assert across < 1.5 * step
+    # Pas de périodicité en latitude : le nord ne prolonge pas le sud
+    assert np.abs(altitude[0] - altitude[-1]).mean() > 3 * step
+
+
+def test_quantiles_set_the_distribution():
+    quantiles = np.linspace(0.2, 0.8, 65) ** 2
+    altitude = SpectralTerrain(seed=2).generate(256, 128, quantiles=quantiles)
+    np.testing.assert_allclose([altitude.min(), altitude.max()], quantiles[[0, -1]], rtol=1e-6)
+    np.testing.assert_allclose(np.quantile(altitude, [0.1, 0.5, 0.9]),
+                               np.interp([0.1, 0.5, 0.9], np.linspace(0, 1, 65), quantiles),
+                               atol=0.02)
+    with pytest.raises(ValueError):
+        SpectralTerrain(seed=2).generate(16, 8, quantiles=[0.5, 0.4])
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_spectral_backend_matches_numpy_land_fraction(seed):
+    determiner = BiomeDeterminer(width=512, height=256, seed=seed)
+    numpy_land = (determiner.generate_altitude() > 0.45).mean()
+    spectral = determiner.generate_altitude(backend="spectral", out=np.empty((256, 512),
+                                                                              np.float32))
+    assert abs((spectral > 0.45).mean() - numpy_land) < 0.02
+
+
+def test_spectral_backend_follows_scale():
+    determiner = BiomeDeterminer(width=512, height=256, seed=3)
+    roughness = [np.abs(np.diff(determiner.generate_altitude(scale, backend="spectral"),
+                                axis=1)).mean() for scale in (25, 100, 400)]
+    # Plus l'échelle est grande, plus les structures sont petites
+    assert roughness[0] < roughness[1] < roughness[2]
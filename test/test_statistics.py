@@ -0,0 +1,68 @@
+"""
+Tests des statistiques de surface pondérées par l'aire (surface.statistics).
+"""
+import numpy as np
+import pytest
+
+from surface import statistics
+from surface.statistics import (
+    DEFAULT_BANDS, WATER_CLASSES, band_fractions, class_fractions, planet_statistics
+)
+
+
+def cell_weights(height, width):
+    """Poids de chaque cellule (H, W), proportionnels à cos(latitude), de somme 1."""
+    lat = np.pi * (0.5 - (np.arange(height) + 0.5) / height)
+    weights = np.repeat(np.cos(lat)[:, None], width, axis=1)
+    return weights / weights.sum()
+
+
+def brute_force(class_map, n_classes, weights):
+    return np.array([np.sum(weights * (class_map == c)) for c in range(n_classes)])
+
+
+@pytest.mark.parametrize("chunk_cells", [statistics.STAT_CHUNK_CELLS, 1000])
+def test_fractions_match_brute_force(monkeypatch, chunk_cells):
+    # Petit bloc : les planètes de la pile sont comptées en plusieurs bincount
+    monkeypatch.setattr(statistics, "STAT_CHUNK_CELLS", chunk_cells)
+    rng = np.random.default_rng(0)
+    stack = rng.integers(0, 9, (5, 18, 36)).astype(np.uint8)
+    weights = cell_weights(18, 36)
+
+    fractions = class_fractions(stack, 9)
+    for planet, result in zip(stack, fractions):
+        np.testing.assert_allclose(result, brute_force(planet, 9, weights), atol=1e-12)
+    np.testing.assert_allclose(class_fractions(stack[0], 9), fractions[0], atol=1e-12)
+
+
+def test_fractions_with_cell_areas_match_brute_force():
+    rng = np.random.default_rng(1)
+    class_map = rng.integers(0, 4, (12, 12))
+    area = rng.random((12, 12)) + 0.5
+    np.testing.assert_allclose(class_fractions(class_map, 4, area),
+                               brute_force(class_map, 4, area / area.sum()), atol=1e-12)
+
+
+def test_band_fractions_match_brute_force():
+    rng = np.random.default_rng(2)
+    class_map = rng.integers(0, 3, (30, 40))
+    weights = cell_weights(30, 40)
+    lat = np.degrees(np.pi * (0.5 - (np.arange(30) + 0.5) / 30))
+    bands = band_fractions(class_map, 3)
+    for b, (low, high) in enumerate(zip(DEFAULT_BANDS[:-1], DEFAULT_BANDS[1:])):
+        rows = (lat >= low) & (lat < high)
+        band_weights = weights * rows[:, None]
+        expected = brute_force(class_map, 3, band_weights) / band_weights.sum()
+        np.testing.assert_allclose(bands[b], expected, atol=1e-12)
+
+
+def test_planet_statistics_water_classes():
+    rng = np.random.default_rng(3)
+    biomes = rng.integers(0, 9, (2, 16, 32))
+    water = rng.integers(0, max(WATER_CLASSES.values()) + 1, (2, 16, 32))
+    stats = planet_statistics(biomes, water)
+    weights = cell_weights(16, 32)
+    for name, value in WATER_CLASSES.items():
+        expected = [np.sum(weights * (planet == value)) for planet in water]
+        np.testing.assert_allclose(stats[name], expected, atol=1e-12)
+    np.testing.assert_allclose(stats["biomes"].sum(axis=-1), 1)
@@ -0,0 +1,38 @@
+"""
+Tests du pipeline par bandes (surface.streaming).
+"""
+import numpy as np
+import pytest
+
+from biome.biomes import BiomeDeterminer
+from hydro.hydro import Hydrosphere
+from surface.streaming import StreamingPipeline
+
+
+def full_map_layers(determiner, altitude, sea_level):
+    """Calques calculés en une passe sur la carte entière."""
+    temperature = determiner.temperature_map(altitude)
+    humidity = determiner.humidity_map(altitude, sea_level)
+    return {
+        "temperature": temperature,
+        "humidity": humidity,
+        "biomes": determiner.determine_biomes(temperature, humidity, altitude, sea_level),
+        "water": Hydrosphere(sea_level).compute(altitude),
+    }
+
+
+@pytest.mark.parametrize("band_rows", [1, 7, 64])
+def test_bands_match_full_map(tmp_path, band_rows):
+    determiner = BiomeDeterminer(width=40, height=24, seed=5)
+    altitude = determiner.generate_altitude()
+    layers = StreamingPipeline(determiner, tmp_path, band_rows=band_rows).run(altitude)
+
+    expected = full_map_layers(determiner, altitude, 0.45)
+    for name, layer in expected.items():
+        np.testing.assert_array_equal(layers[name], layer, err_msg=name)
+
+
+def test_generated_bands_match_full_altitude(tmp_path):
+    determiner = BiomeDeterminer(width=40, height=24, seed=5)
+    layers = StreamingPipeline(determiner, tmp_path, band_rows=5).run()
+    np.testing.assert_array_equal(layers["altitude"], determiner.generate_altitude())
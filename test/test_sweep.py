@@ -0,0 +1,50 @@
+"""
+Tests du balayage de paramètres (surface.sweep).
+"""
+import numpy as np
+
+from biome.biomes import BiomeDeterminer
+from hydro.hydro import Hydrosphere
+from surface.sweep import ParameterSweep
+
+
+def test_sweep_matches_single_runs():
+    determiner = BiomeDeterminer(width=48, height=32, seed=5)
+    altitude = determiner.generate_altitude()
+    levels = np.array([0.35, 0.45, 0.55])
+    offsets = np.array([-4.0, 0.0, 6.0])
+    # Budget de deux réglages par bloc : le dernier bloc est incomplet
+    sweep = ParameterSweep(determiner, altitude,
+                           memory_budget=2 * altitude.size * ParameterSweep.BYTES_PER_CELL)
+    assert sweep.chunk_size == 2
+
+    for settings, layers in sweep.iter_chunks(levels, offsets):
+        for k, index in enumerate(range(len(levels))[settings]):
+            level, offset = levels[index], offsets[index]
+            temperature = determiner.temperature_map(altitude, equator_offset=offset)
+            humidity = determiner.humidity_map(altitude, level)
+            biomes = determiner.determine_biomes(temperature, humidity, altitude, level)
+            water = Hydrosphere(seuil_côte=0.05).compute(altitude, niveau_mer=level)
+            np.testing.assert_allclose(layers["temperature"][k], temperature, rtol=1e-6)
+            np.testing.assert_array_equal(layers["humidity"][k], humidity)
+            np.testing.assert_array_equal(layers["biomes"][k], biomes)
+            np.testing.assert_array_equal(layers["water"][k], water)
+
+
+def test_biomes_broadcast_mixed_stacks():
+    determiner = BiomeDeterminer(width=24, height=16, seed=2)
+    altitude = determiner.generate_altitude()
+    levels = np.array([0.4, 0.5])
+    temperature = determiner.temperature_map(altitude)  # (H, W) commune
+    humidity = determiner.humidity_map(altitude, levels)  # (K, H, W)
+
+    stack = determiner.determine_biomes(temperature, humidity, altitude, levels, chunk_rows=5)
+    assert stack.shape == (2,) + altitude.shape
+    for k, level in enumerate(levels):
+        single = determiner.determine_biomes(temperature, humidity[k], altitude, level)
+        np.testing.assert_array_equal(stack[k], single)
+
+    # Cartes 2D, un niveau par réglage
+    stack = determiner.determine_biomes(temperature, humidity[0], altitude, levels)
+    assert stack.shape == (2,) + altitude.shape
+    assert (stack[1] == 0).sum() >= (stack[0] == 0).sum()
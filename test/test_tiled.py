@@ -0,0 +1,31 @@
+"""
+Tests de la génération d'altitude par tuiles (heightmap.tiled).
+"""
+import numpy as np
+
+from heightmap.noise import FractalNoise
+from heightmap.tiled import TiledAltitudeGenerator, shared_array
+
+
+def make_generator(tile_size=48):
+    return TiledAltitudeGenerator(160, 80, scale=20, noise=FractalNoise(octaves=4, seed=7),
+                                  tile_size=tile_size)
+
+
+def test_parallel_matches_single_pass():
+    reference = make_generator(tile_size=1000).generate()
+    parallel = make_generator().generate(workers=2)
+    np.testing.assert_array_equal(parallel, reference)
+
+
+def test_parallel_writes_into_shared_out_without_copy():
+    out = shared_array((80, 160), np.float32)
+    result = make_generator().generate(workers=2, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, make_generator().generate())
+
+
+def test_parallel_copies_into_plain_out():
+    out = np.zeros((80, 160), dtype=np.float32)
+    make_generator().generate(workers=2, out=out)
+    np.testing.assert_array_equal(out, make_generator().generate())
@@ -16,6 +16,8 @@ class Visualizer3D:
         background (str): Couleur de fond (par défaut: 'black')
         window_size (tuple): Taille de la fenêtre en pixels (par défaut: (1024, 768))
         title (str): Titre de la fenêtre (par défaut: 'Visualisation 3D')
+        off_screen (bool): Rendu sans fenêtre, pour les captures sur une machine
+            sans affichage (par défaut: None = pv.OFF_SCREEN)
     
     Example:
         >>> viz = Visualizer3D(background='white')
@@ -28,9 +30,10 @@ class Visualizer3D:
         self, 
         background: str = 'black',
         window_size: Tuple[int, int] = (1024, 768),
-        title: str = 'Visualisation 3D'
+        title: str = 'Visualisation 3D',
+        off_screen: Optional[bool] = None
     ):
-        self.plotter = pv.Plotter(window_size=window_size)
+        self.plotter = pv.Plotter(window_size=window_size, off_screen=off_screen)
         self.plotter.background_color = background
         self.plotter.title = title
         self.meshes = []
@@ -43,7 +46,7 @@ class Visualizer3D:
         opacity: float = 1.0,
         smooth_shading: bool = True,
         **kwargs
-    ) -> None:
+    ) -> Optional[pv.Actor]:
         """
         Ajoute un mesh à la scène.
         
@@ -54,9 +57,12 @@ class Visualizer3D:
             opacity: Transparence (0.0 à 1.0)
             smooth_shading: Active le lissage de Gouraud
             **kwargs: Arguments supplémentaires pour plotter.add_mesh()
+        
+        Returns:
+            pv.Actor: Acteur du mesh (None en cas d'erreur)
         """
         try:
-            self.plotter.add_mesh(
+            actor = self.plotter.add_mesh(
                 mesh, 
                 texture=texture,
                 color=color,
@@ -65,8 +71,10 @@ class Visualizer3D:
                 **kwargs
             )
             self.meshes.append(mesh)
+            return actor
         except Exception as e:
             warnings.warn(f"Erreur lors de l'ajout du mesh: {e}")
+            return None
     
     def add_light(
         self, 
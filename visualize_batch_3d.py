@@ -0,0 +1,184 @@
+"""
+Rendu hors écran de vignettes de planètes, en lot.
+
+Chaque processus du lot ouvre un seul plotter hors écran (sans fenêtre,
+utilisable sur une machine sans affichage), avec une sphère, un éclairage
+et une caméra fixes. D'une planète à l'autre, seule la texture de l'acteur
+est remplacée avant la capture : ni plotter, ni mesh, ni lumières ne sont
+recréés. Les planètes sont réparties sur un pool de processus.
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pyvista as pv
+
+from visualize_3d import Visualizer3D
+from visualize_planet_3d import PlanetRenderer, sphere_mesh
+
+# Rend les paquets de src/ importables depuis la racine du projet
+SRC_PATH = str(Path(__file__).resolve().parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from render.palette import as_rgb  # noqa: E402
+
+# Texture d'une planète : chemin d'image, image RGB ou carte des biomes
+TextureSource = Union[str, np.ndarray]
+
+# État des workers, initialisé une seule fois par processus
+_worker = {}
+
+
+def _init_worker(settings: dict) -> None:
+    visualizer = Visualizer3D(
+        background=settings['background'],
+        window_size=settings['window_size'],
+        title='Vignettes',
+        off_screen=True
+    )
+    sphere = sphere_mesh(settings['radius'], *settings['resolution'])
+    # Texture provisoire : l'acteur est créé texturé une fois pour toutes
+    placeholder = pv.Texture(np.zeros((2, 2, 3), dtype=np.uint8))
+    actor = visualizer.add_mesh(sphere, texture=placeholder, smooth_shading=True)
+    if actor is None:
+        visualizer.close()
+        raise RuntimeError("Impossible d'ajouter la sphère texturée au plotter")
+    PlanetRenderer._setup_lighting(visualizer, settings['lighting'])
+    # Caméra dans le plan de l'équateur, nord en haut
+    visualizer.set_camera(
+        position=(settings['radius'] * settings['camera_distance'], 0, 0),
+        focal_point=(0, 0, 0),
+        view_up=(0, 0, 1)
+    )
+    _worker['visualizer'] = visualizer
+    _worker['actor'] = actor
+    _worker['settings'] = settings
+
+
+def _render_in_worker(task: Tuple[str, TextureSource]) -> str:
+    name, source = task
+    settings = _worker['settings']
+    if isinstance(source, np.ndarray):
+        texture = pv.Texture(as_rgb(source, settings['palette']))
+    else:
+        texture = pv.read_texture(source)
+    _worker['actor'].SetTexture(texture)
+    path = os.path.join(settings['output_dir'], f"{name}.png")
+    plotter = _worker['visualizer'].plotter
+    plotter.render()
+    plotter.screenshot(path, return_img=False)
+    return path
+
+
+class BatchRenderer:
+    """
+    Rendu hors écran de milliers de vignettes de planètes.
+
+    Args:
+        output_dir (str): Dossier des captures (créé si besoin)
+        window_size (tuple): Taille des vignettes en pixels (par défaut: (256, 256))
+        background (str): Couleur de fond (par défaut: 'black')
+        lighting (str): Type d'éclairage, voir PlanetRenderer.render()
+        radius (float): Rayon de la planète (par défaut: 1.0)
+        resolution (tuple): Résolution (theta, phi) de la sphère (par défaut: (128, 64))
+        camera_distance (float): Distance de la caméra en rayons (par défaut: 4.5,
+            la planète entière tient dans le champ de 30° de la caméra)
+        palette (np.ndarray): Palette des cartes de classes (None = palette des biomes)
+        workers (int): Nombre de processus (None, 0 ou 1 = processus courant)
+
+    Example:
+        >>> batch = BatchRenderer('data/thumbnails', workers=8)
+        >>> stats = batch.render({f'planet_{i}': biome_maps[i] for i in range(1000)})
+        >>> print(f"{stats['planets_per_second']:.1f} planètes/s")
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        window_size: Tuple[int, int] = (256, 256),
+        background: str = 'black',
+        lighting: str = 'realistic',
+        radius: float = 1.0,
+        resolution: Tuple[int, int] = (128, 64),
+        camera_distance: float = 4.5,
+        palette: Optional[np.ndarray] = None,
+        workers: Optional[int] = None
+    ):
+        if radius <= 0:
+            raise ValueError(f"Le rayon doit être positif (reçu: {radius})")
+        self.output_dir = output_dir
+        self.workers = workers
+        self.settings = {
+            'output_dir': output_dir,
+            'window_size': tuple(window_size),
+            'background': background,
+            'lighting': lighting,
+            'radius': radius,
+            'resolution': tuple(resolution),
+            'camera_distance': camera_distance,
+            'palette': palette,
+        }
+
+    def render(
+        self,
+        planets: Union[Mapping[str, TextureSource], Iterable[Tuple[str, TextureSource]]]
+    ) -> Dict[str, object]:
+        """
+        Capture une vignette PNG par planète, sans ouvrir de fenêtre.
+
+        Args:
+            planets: Nom -> texture (chemin d'image, image RGB ou carte des biomes),
+                en dictionnaire ou en paires (nom, texture)
+
+        Returns:
+            dict: 'paths' (captures, dans l'ordre), 'count', 'seconds' et
+            'planets_per_second'
+        """
+        tasks = list(planets.items() if isinstance(planets, Mapping) else planets)
+        os.makedirs(self.output_dir, exist_ok=True)
+        start = time.perf_counter()
+        if not self.workers or self.workers <= 1:
+            _init_worker(self.settings)
+            try:
+                paths: List[str] = [_render_in_worker(task) for task in tasks]
+            finally:
+                _worker.pop('visualizer').close()
+        else:
+            # Plusieurs planètes par envoi pour amortir la communication
+            chunksize = max(1, len(tasks) // (self.workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.settings,)
+            ) as pool:
+                paths = list(pool.map(_render_in_worker, tasks, chunksize=chunksize))
+        seconds = time.perf_counter() - start
+        return {
+            'paths': paths,
+            'count': len(paths),
+            'seconds': seconds,
+            'planets_per_second': len(paths) / seconds if seconds > 0 else float('inf'),
+        }
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    from biome.biomes import BiomeDeterminer
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    maps = {}
+    for i in range(count):
+        determiner = BiomeDeterminer(width=256, height=128, seed=i)
+        altitude = determiner.generate_altitude()
+        maps[f'planet_{i:05d}'] = determiner.determine_biomes(
+            determiner.temperature_map(altitude), determiner.humidity_map(altitude), altitude
+        )
+    stats = BatchRenderer('thumbnails', workers=workers).render(maps)
+    print(f"{stats['count']} vignettes en {stats['seconds']:.1f}s "
+          f"({stats['planets_per_second']:.1f} planètes/s)")
@@ -1,22 +1,114 @@
 """
 Module de rendu de planètes en 3D.
 Utilise PyVista pour créer des visualisations réalistes de planètes avec textures.
+
+La texture vient d'un fichier image ou directement d'un tableau NumPy (image
+RGB ou carte des biomes + palette), sans passer par un PNG intermédiaire.
+
+Avec une carte d'altitude (relief=...), la sphère est déplacée par le relief
+et construite à plusieurs niveaux de détail : le rendu affiche le niveau
+adapté à la distance de la caméra.
+
+Les sphères et les textures lues sur disque sont gardées dans des caches LRU
+communs au processus : un nouveau rendu (autre éclairage, autre caméra) ne
+reconstruit pas la géométrie et ne relit pas l'image.
 """
 import pyvista as pv
+import importlib.util
+import numpy as np
 import os
-from typing import Optional, Tuple
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
 from visualize_3d import Visualizer3D
 
+# Rend les paquets de src/ importables depuis la racine du projet
+SRC_PATH = str(Path(__file__).resolve().parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from render.cache import RenderCache  # noqa: E402
+from render.mesh import DEFAULT_LODS, relief_lods, uv_sphere  # noqa: E402
+from render.palette import as_rgb  # noqa: E402
+
+# Budgets mémoire des caches de rendu (octets)
+MESH_CACHE_BYTES = 256 * 2**20
+TEXTURE_CACHE_BYTES = 1024 * 2**20
+
+# Distances caméra-centre (en rayons) au-delà desquelles on passe au niveau suivant.
+# Fenêtre de 900 pixels de haut, champ de 30° : au seuil, les sommets du niveau
+# quitté sont espacés d'environ 2 pixels au centre de l'image, ceux du suivant
+# d'environ 4. À 3 rayons (caméra par défaut) la planète déborde de l'image et
+# le niveau 1024x512 garde environ 3.6 pixels entre sommets
+LOD_DISTANCES = (5.0, 10.0, 20.0)
+
+# Meshes par (type, rayon, theta, phi) et textures par (chemin, mtime, taille)
+MESH_CACHE = RenderCache(MESH_CACHE_BYTES, size=lambda mesh: mesh.actual_memory_size * 1024)
+TEXTURE_CACHE = RenderCache(
+    TEXTURE_CACHE_BYTES, size=lambda texture: texture.to_image().actual_memory_size * 1024
+)
+
+
+def textured_mesh(points: np.ndarray, faces: np.ndarray, tcoords: np.ndarray) -> pv.PolyData:
+    """
+    Mesh PyVista portant des coordonnées de texture actives.
+    
+    Args:
+        points, faces, tcoords: Sortie de render.mesh.relief_sphere()
+    
+    Returns:
+        pv.PolyData: Mesh prêt à recevoir une texture équirectangulaire
+    """
+    mesh = pv.PolyData(points, faces)
+    # Normales calculées ici : le lissage de add_mesh(smooth_shading=True)
+    # réutilise alors le mesh tel quel au lieu d'en perdre les coordonnées
+    mesh.compute_normals(cell_normals=False, inplace=True)
+    mesh.point_data['Texture Coordinates'] = tcoords
+    # Appel VTK direct : le nom de la propriété PyVista change selon les versions
+    mesh.GetPointData().SetActiveTCoords('Texture Coordinates')
+    return mesh
+
+
+def sphere_mesh(radius: float, theta_resolution: int, phi_resolution: int) -> pv.PolyData:
+    """
+    Sphère texturable partagée via MESH_CACHE, à ne pas modifier en place.
+    
+    pv.Sphere ne porte pas de coordonnées de texture : la sphère vient de
+    render.mesh.uv_sphere, avec la couture 0°/360° dupliquée et une texture
+    équirectangulaire (ligne 0 au pôle nord, z vers le nord).
+    
+    Args:
+        radius: Rayon de la sphère
+        theta_resolution: Nombre de méridiens
+        phi_resolution: Nombre de parallèles
+    
+    Returns:
+        pv.PolyData: Mesh de la sphère
+    """
+    key = ('sphere', radius, theta_resolution, phi_resolution)
+    return MESH_CACHE.get_or_create(key, lambda: textured_mesh(
+        *uv_sphere(theta_resolution, phi_resolution, radius)
+    ))
+
 
 class PlanetRenderer:
     """
     Classe pour le rendu 3D de planètes avec textures.
     
     Args:
-        texture_path (str): Chemin vers le fichier de texture
+        texture_path (str): Chemin vers le fichier de texture (None si `texture` est fourni)
         radius (float): Rayon de la planète (par défaut: 1.0)
         resolution (tuple): Résolution (theta, phi) de la sphère (par défaut: (256, 128))
         name (str): Nom de la planète (par défaut: 'Planet')
+        texture (np.ndarray): Texture en mémoire : image RGB(A) (H, W, 3|4) en uint8
+            ou flottants dans [0, 1], ou carte de classes (H, W) colorisée par `palette`
+        palette (np.ndarray): Couleurs (n, 3) des classes (None = palette des biomes)
+        relief (np.ndarray): Carte d'altitude (H, W) dans [0, 1] qui déplace les
+            sommets (None = sphère lisse de résolution `resolution`)
+        exaggeration (float): Amplitude du relief en fraction du rayon (par défaut: 0.05)
+        sea_level (float): Niveau de la mer sous lequel la surface reste plate (None = aucun)
+        lod_resolutions (tuple): Résolutions (theta, phi) des niveaux de détail du relief,
+            du plus fin au plus grossier (un seuil de LOD_DISTANCES entre deux niveaux)
     
     Raises:
         FileNotFoundError: Si le fichier de texture n'existe pas
@@ -25,26 +117,45 @@ class PlanetRenderer:
     Example:
         >>> renderer = PlanetRenderer('earth_texture.jpg', radius=1.5)
         >>> renderer.render(rotation_speed=5.0, show_axes=True)
+        >>> renderer.render(rotation_speed=5.0, animation_path='tour.gif', frames=72)
+        >>> PlanetRenderer(texture=graph.get('biomes')).render()  # sans fichier
+        >>> PlanetRenderer(texture=biomes, relief=altitude, sea_level=0.45).render()
     """
     
     def __init__(
         self,
-        texture_path: str,
+        texture_path: Optional[str] = None,
         radius: float = 1.0,
         resolution: Tuple[int, int] = (256, 128),
-        name: str = 'Planet'
+        name: str = 'Planet',
+        texture: Optional[np.ndarray] = None,
+        palette: Optional[np.ndarray] = None,
+        relief: Optional[np.ndarray] = None,
+        exaggeration: float = 0.05,
+        sea_level: Optional[float] = None,
+        lod_resolutions: Tuple[Tuple[int, int], ...] = DEFAULT_LODS
     ):
+        if (texture_path is None) == (texture is None):
+            raise ValueError("Fournir soit texture_path, soit texture (tableau NumPy)")
         self.texture_path = texture_path
+        # Image uint8 contiguë, convertie une seule fois
+        self.texture = as_rgb(texture, palette) if texture is not None else None
+        self._texture = None  # pv.Texture construite depuis self.texture au premier rendu
         self.radius = radius
         self.theta_resolution, self.phi_resolution = resolution
         self.name = name
+        self.relief = relief
+        self.exaggeration = exaggeration
+        self.sea_level = sea_level
+        self.lod_resolutions = tuple(lod_resolutions)
+        self._lods = None  # maillages du relief, construits au premier rendu
         
         # Validation
         self._validate_parameters()
     
     def _validate_parameters(self) -> None:
         """Valide les paramètres d'initialisation."""
-        if not os.path.exists(self.texture_path):
+        if self.texture_path is not None and not os.path.exists(self.texture_path):
             raise FileNotFoundError(
                 f"Texture non trouvée: {self.texture_path}\n"
                 f"Vérifiez que le chemin est correct."
@@ -58,28 +169,67 @@ class PlanetRenderer:
                 f"Résolution trop faible: ({self.theta_resolution}, {self.phi_resolution}). "
                 f"Minimum: (3, 3)"
             )
+        
+        if self.relief is not None:
+            if self.relief.ndim != 2:
+                raise ValueError("Le relief doit être une carte 2D (H, W)")
+            if not 1 <= len(self.lod_resolutions) <= len(LOD_DISTANCES) + 1:
+                raise ValueError(
+                    f"De 1 à {len(LOD_DISTANCES) + 1} niveaux de détail attendus "
+                    f"(reçu: {len(self.lod_resolutions)})"
+                )
     
     def _create_sphere(self) -> pv.PolyData:
         """
-        Crée la géométrie sphérique de la planète.
+        Crée la géométrie sphérique de la planète (partagée via MESH_CACHE).
         
         Returns:
-            pv.PolyData: Mesh de la sphère
-        """
-        sphere = pv.Sphere(
-            radius=self.radius,
-            theta_resolution=self.theta_resolution,
-            phi_resolution=self.phi_resolution,
-            start_theta=0,
-            end_theta=360,
-            start_phi=0,
-            end_phi=180
-        )
-        return sphere
+            pv.PolyData: Mesh de la sphère, à ne pas modifier en place
+        """
+        return sphere_mesh(self.radius, self.theta_resolution, self.phi_resolution)
+    
+    def _create_relief_meshes(self) -> List[pv.PolyData]:
+        """
+        Construit les maillages déplacés par le relief, un par niveau de détail.
+        
+        Returns:
+            list: Maillages texturés, du plus fin au plus grossier
+        """
+        if self._lods is None:
+            self._lods = []
+            for points, faces, tcoords in relief_lods(
+                self.relief, self.lod_resolutions, self.radius,
+                self.exaggeration, self.sea_level
+            ):
+                self._lods.append(textured_mesh(points, faces, tcoords))
+        return self._lods
+    
+    def _setup_lod(self, visualizer: Visualizer3D, actors: List[pv.Actor]) -> None:
+        """
+        Affiche le niveau de détail adapté à la distance de la caméra.
+        
+        Args:
+            visualizer: Instance du visualiseur
+            actors: Acteurs des niveaux, du plus fin au plus grossier
+        """
+        camera = visualizer.plotter.camera
+        thresholds = np.asarray(LOD_DISTANCES[:len(actors) - 1]) * self.radius
+        
+        def update(*_) -> None:
+            distance = np.linalg.norm(np.subtract(camera.position, camera.focal_point))
+            level = int(np.searchsorted(thresholds, distance))
+            for i, actor in enumerate(actors):
+                actor.SetVisibility(i == level)
+        
+        camera.AddObserver('ModifiedEvent', update)
+        update()
     
     def _load_texture(self) -> pv.Texture:
         """
-        Charge la texture de la planète.
+        Charge la texture de la planète, depuis la mémoire ou le fichier.
+        
+        Une texture de fichier est reprise de TEXTURE_CACHE tant que le fichier
+        n'a pas changé (date de modification et taille).
         
         Returns:
             pv.Texture: Texture chargée
@@ -88,7 +238,17 @@ class PlanetRenderer:
             RuntimeError: Si le chargement échoue
         """
         try:
-            texture = pv.read_texture(self.texture_path)
+            if self.texture is not None:
+                # Texture construite depuis le tableau, sans encodage ni décodage d'image
+                if self._texture is None:
+                    self._texture = pv.Texture(self.texture)
+                return self._texture
+            path = os.path.abspath(self.texture_path)
+            stat = os.stat(path)
+            texture = TEXTURE_CACHE.get_or_create(
+                (path, stat.st_mtime_ns, stat.st_size),
+                lambda: pv.read_texture(path)
+            )
             return texture
         except Exception as e:
             raise RuntimeError(f"Erreur lors du chargement de la texture: {e}")
@@ -102,7 +262,10 @@ class PlanetRenderer:
         show_axes: bool = False,
         camera_distance: float = 3.0,
         save_screenshot: Optional[str] = None,
-        enable_anti_aliasing: bool = True
+        enable_anti_aliasing: bool = True,
+        animation_path: Optional[str] = None,
+        frames: int = 72,
+        framerate: int = 24
     ) -> None:
         """
         Effectue le rendu 3D de la planète.
@@ -111,60 +274,122 @@ class PlanetRenderer:
             background: Couleur de fond ('black', 'white', 'space', etc.)
             window_size: Dimensions de la fenêtre (largeur, hauteur)
             lighting: Type d'éclairage ('realistic', 'bright', 'ambient')
-            rotation_speed: Vitesse de rotation (None = pas de rotation)
+            rotation_speed: Vitesse de rotation en degrés par image (None = pas de rotation)
             show_axes: Affiche les axes de référence
             camera_distance: Distance de la caméra par rapport à la planète
             save_screenshot: Chemin pour sauvegarder une capture (None = pas de sauvegarde)
             enable_anti_aliasing: Active l'anti-aliasing pour un meilleur rendu
+            animation_path: Avec rotation_speed, exporte un tour de la planète hors
+                écran au lieu d'ouvrir la fenêtre : fichier .gif, vidéo (.mp4...) ou
+                suite d'images avec un motif ('frames/tour_{:04d}.png')
+            frames: Nombre d'images de l'animation exportée
+            framerate: Images par seconde de l'animation
+        
+        Raises:
+            RuntimeError: Si la texture ne se charge pas ou si le mesh ne peut pas
+                être ajouté à la scène
+            ImportError: Si l'export .gif ou vidéo demandé n'a pas son writer
+                (imageio, imageio-ffmpeg), avant la construction de la scène
         """
+        # Export d'animation : aucune fenêtre n'est ouverte
+        export = rotation_speed is not None and animation_path is not None
+        if export:
+            self._check_animation_writer(animation_path)
+        
         # Création du visualiseur
         visualizer = Visualizer3D(
             background=background,
             window_size=window_size,
-            title=f'Rendu 3D - {self.name}'
-        )
-        
-        # Création de la sphère et chargement de la texture
-        sphere = self._create_sphere()
-        texture = self._load_texture()
-        
-        # Ajout du mesh
-        visualizer.add_mesh(
-            sphere,
-            texture=texture,
-            smooth_shading=True
-        )
-        
-        # Configuration de l'éclairage
-        self._setup_lighting(visualizer, lighting)
-        
-        # Configuration de la caméra
-        camera_position = (0, 0, self.radius * camera_distance)
-        visualizer.set_camera(
-            position=camera_position,
-            focal_point=(0, 0, 0),
-            view_up=(0, 1, 0)
+            title=f'Rendu 3D - {self.name}',
+            off_screen=True if export else None
         )
         
-        # Options supplémentaires
-        if show_axes:
-            visualizer.add_axes(interactive=True)
-        
-        if enable_anti_aliasing:
-            visualizer.enable_eye_dome_lighting()
+        try:
+            texture = self._load_texture()
+            
+            if self.relief is not None:
+                # Un acteur par niveau de détail, un seul visible à la fois
+                actors = [
+                    visualizer.add_mesh(mesh, texture=texture, smooth_shading=True)
+                    for mesh in self._create_relief_meshes()
+                ]
+            else:
+                # Création de la sphère et ajout du mesh
+                sphere = self._create_sphere()
+                actors = [visualizer.add_mesh(
+                    sphere,
+                    texture=texture,
+                    smooth_shading=True
+                )]
+            if any(actor is None for actor in actors):
+                visualizer.close()
+                raise RuntimeError(f"Impossible d'ajouter le mesh de {self.name} au plotter")
+            if self.relief is not None:
+                self._setup_lod(visualizer, actors)
+            
+            # Configuration de l'éclairage
+            self._setup_lighting(visualizer, lighting)
+            
+            # Caméra dans le plan de l'équateur, nord (z) en haut : la rotation
+            # autour de z fait défiler les longitudes
+            camera_position = (self.radius * camera_distance, 0, 0)
+            visualizer.set_camera(
+                position=camera_position,
+                focal_point=(0, 0, 0),
+                view_up=(0, 0, 1)
+            )
+            
+            # Options supplémentaires
+            if show_axes:
+                visualizer.add_axes(interactive=True)
+            
+            if enable_anti_aliasing:
+                visualizer.enable_eye_dome_lighting()
+            
+            # Sauvegarde screenshot
+            if save_screenshot:
+                visualizer.screenshot(save_screenshot)
+            
+            # Rotation (si demandée)
+            if rotation_speed is not None:
+                self._add_rotation(visualizer, rotation_speed, actors, animation_path,
+                                   frames, framerate)
+            
+            # Affichage
+            if not export:
+                visualizer.show()
+        finally:
+            # Le writer de l'animation est refermé même si une image échoue
+            if export:
+                visualizer.close()
+    
+    @staticmethod
+    def _check_animation_writer(path: str) -> None:
+        """
+        Vérifie que le writer de l'animation est installé.
         
-        # Rotation (si demandée)
-        if rotation_speed is not None:
-            self._add_rotation(visualizer, rotation_speed)
+        Une suite d'images n'a besoin que de PyVista ; open_gif et open_movie
+        passent par imageio (et imageio-ffmpeg pour les vidéos).
         
-        # Sauvegarde screenshot
-        if save_screenshot:
-            visualizer.screenshot(save_screenshot)
+        Args:
+            path: Animation exportée (.gif, vidéo ou motif '..._{:04d}.png')
         
-        # Affichage
-        visualizer.show()
+        Raises:
+            ImportError: Si un module requis manque
+        """
+        if '{' in path:
+            return
+        modules = ['imageio'] if path.lower().endswith('.gif') else ['imageio', 'imageio_ffmpeg']
+        missing = [name for name in modules if importlib.util.find_spec(name) is None]
+        if missing:
+            packages = [name.replace('_', '-') for name in missing]
+            raise ImportError(
+                f"L'export de {os.path.basename(path)} nécessite {', '.join(packages)} "
+                f"(pip install {' '.join(packages)})"
+            )
     
-    def _setup_lighting(self, visualizer: Visualizer3D, lighting_type: str) -> None:
+    @staticmethod
+    def _setup_lighting(visualizer: Visualizer3D, lighting_type: str) -> None:
         """
         Configure l'éclairage de la scène.
         
@@ -207,18 +432,63 @@ class PlanetRenderer:
                 intensity=1.0
             )
     
-    def _add_rotation(self, visualizer: Visualizer3D, speed: float) -> None:
+    def _add_rotation(
+        self,
+        visualizer: Visualizer3D,
+        speed: float,
+        actors: List[pv.Actor],
+        path: Optional[str] = None,
+        frames: int = 72,
+        framerate: int = 24
+    ) -> None:
         """
-        Ajoute une rotation animée à la planète.
+        Fait tourner la planète autour de son axe (z).
+        
+        Seule la transformation des acteurs change d'une image à l'autre : le
+        mesh et la texture déjà envoyés au GPU sont réutilisés. En export,
+        chaque image est transmise dès son rendu : la mémoire reste stable pour
+        une suite d'images ou une vidéo, mais le writer GIF d'imageio garde les
+        images jusqu'à la fermeture (largeur x hauteur x 3 octets par image).
         
         Args:
             visualizer: Instance du visualiseur
             speed: Vitesse de rotation en degrés par frame
+            actors: Acteurs de la planète (tous les niveaux de détail)
+            path: Animation exportée (.gif, vidéo ou motif '..._{:04d}.png') ;
+                None = rotation continue dans la fenêtre interactive
+            frames: Nombre d'images exportées
+            framerate: Images par seconde
         """
-        # Note: Cette fonctionnalité nécessiterait une boucle d'animation
-        # Pour PyVista, cela peut être implémenté avec plotter.add_timer_event
-        # ou en utilisant un callback personnalisé
-        print(f"Rotation à {speed}°/s (fonctionnalité à implémenter avec callbacks)")
+        plotter = visualizer.plotter
+        
+        def rotate() -> None:
+            for actor in actors:
+                actor.RotateZ(speed)
+        
+        if path is None:
+            def step() -> None:
+                rotate()
+                plotter.render()
+            
+            plotter.add_callback(step, interval=max(1, int(1000 / framerate)))
+            return
+        
+        sequence = '{' in path
+        if not sequence:
+            # Écrivain en flux (imageio) : une image ajoutée par write_frame()
+            if path.lower().endswith('.gif'):
+                plotter.open_gif(path, fps=framerate)
+            else:
+                plotter.open_movie(path, framerate=framerate)
+        for index in range(frames):
+            if index:
+                rotate()
+            if sequence:
+                plotter.render()
+                plotter.screenshot(path.format(index), return_img=False)
+            else:
+                plotter.write_frame()
+        print(f"Animation exportée: {path} ({frames} images)")
 
 
 # Exemple d'utilisation